@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the process_page parsing backends.
+
+Parses every saved page in a directory (e.g. the one served by
+leginfo_standin.py) with the original full-tree BeautifulSoup path and with
+each installed html_text backend, reports the parse time per page and checks
+that every backend extracts exactly the same text.
+
+Usage:
+    python bench_html_parsing.py ./saved_pages
+"""
+
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from html_text import BACKENDS, available_backends
+
+def original_page_text(content) -> str:
+    """The unscoped html.parser path process_page used before html_text existed."""
+    soup = BeautifulSoup(content, 'html.parser')
+    content_div = soup.find('div', id='content_main') or soup.find('div', id='sectionText') or soup.body
+    for br in soup.find_all("br"): br.replace_with("\n")
+    return content_div.get_text().replace(u'\xa0', ' ')
+
+def load_pages(pages_dir):
+    """Reads every .html/.htm file in a directory as bytes."""
+    pages = []
+    for name in sorted(os.listdir(pages_dir)):
+        if name.endswith(('.html', '.htm')):
+            with open(os.path.join(pages_dir, name), 'rb') as f:
+                pages.append(f.read())
+    return pages
+
+def time_per_page(extract, pages, repeat=3):
+    """Returns the best-of-`repeat` parse time per page, in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in pages:
+            extract(content)
+        best = min(best, time.perf_counter() - start)
+    return best / len(pages) * 1000
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+    pages = load_pages(sys.argv[1])
+    if not pages:
+        print("No saved pages found.")
+        return
+
+    expected = [original_page_text(content) for content in pages]
+    print(f"Pages: {len(pages)} ({sum(len(p) for p in pages) / len(pages) / 1024:.1f} KB average)")
+
+    baseline_ms = time_per_page(original_page_text, pages)
+    print(f"{'original (full html.parser)':30} {baseline_ms:8.3f} ms/page")
+    for name in available_backends():
+        extract = BACKENDS[name]
+        mismatches = sum(1 for content, text in zip(pages, expected) if extract(content) != text)
+        ms = time_per_page(extract, pages)
+        print(f"{name:30} {ms:8.3f} ms/page  {baseline_ms / ms:5.1f}x  mismatches: {mismatches}")
+
+if __name__ == '__main__':
+    main()
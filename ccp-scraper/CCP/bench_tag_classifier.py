@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark for rule tag classification.
+
+Compares the original per-keyword ``re.search`` loop against the compiled
+single-pass TagClassifier and checks that both produce the same tags.
+
+Usage:
+    python bench_tag_classifier.py                 # synthetic rule corpus
+    python bench_tag_classifier.py ./pdfs/output   # rules from extract_rules.py JSON output
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+
+from tag_classifier import TAG_KEYWORDS, DEFAULT_CLASSIFIER
+
+SAMPLE_SENTENCES = [
+    "Any party may move for summary judgment in any action or proceeding if it is contended that the action has no merit.",
+    "The motion shall be supported by affidavits, declarations, admissions, answers to interrogatories, depositions, and matters of which judicial notice shall or may be taken.",
+    "Notice of the motion and supporting papers shall be served on all other parties to the action at least 75 days before the time appointed for hearing.",
+    "An opposition to the motion shall be served and filed not less than 20 days preceding the noticed or continued date of hearing.",
+    "A reply to the opposition shall be served and filed not less than 11 days preceding the noticed or continued date of hearing.",
+    "If the court determines at any time that any of the affidavits are presented in bad faith, the court shall order the party to pay reasonable expenses, and may impose sanctions.",
+    "The supporting papers shall include a separate statement setting forth plainly and concisely all material facts.",
+    "Upon entry of any order pursuant to this section, except the entry of summary judgment, a party may petition for a peremptory writ.",
+]
+
+def legacy_tags(rule_text: str) -> list:
+    """The original implementation: one regex search per keyword of every tag."""
+    tags = set()
+    for tag, keywords in TAG_KEYWORDS.items():
+        if any(re.search(r'\b' + keyword + r'\b', rule_text, re.IGNORECASE) for keyword in keywords):
+            tags.add(tag)
+    return sorted(list(tags))
+
+def synthetic_corpus(count=2000, seed=437):
+    """Builds rule texts of one to six sentences from the sample statute language."""
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(SAMPLE_SENTENCES, k=rng.randint(1, 6))) for _ in range(count)]
+
+def load_corpus(output_dir):
+    """Loads rule texts from the california_code_*_with_links.json files in a directory."""
+    texts = []
+    for name in sorted(os.listdir(output_dir)):
+        if name.endswith('_with_links.json'):
+            with open(os.path.join(output_dir, name), 'r', encoding='utf-8') as f:
+                texts.extend(rule["text"] for rule in json.load(f).get("rules", []))
+    return texts
+
+def time_per_rule(classify, texts, repeat=5):
+    """Returns the best-of-`repeat` classification cost per rule, in microseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            classify(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e6
+
+def main():
+    texts = load_corpus(sys.argv[1]) if len(sys.argv) > 1 else synthetic_corpus()
+    if not texts:
+        print("No rules found to benchmark.")
+        return
+
+    mismatches = sum(1 for text in texts if legacy_tags(text) != DEFAULT_CLASSIFIER.tags(text))
+    legacy_us = time_per_rule(legacy_tags, texts)
+    compiled_us = time_per_rule(DEFAULT_CLASSIFIER.tags, texts)
+
+    print(f"Rules classified: {len(texts)}")
+    print(f"Per-keyword regex loop: {legacy_us:8.2f} us/rule")
+    print(f"Compiled single pass:   {compiled_us:8.2f} us/rule")
+    print(f"Speedup: {legacy_us / compiled_us:.1f}x")
+    print(f"Tag mismatches: {mismatches}")
+
+if __name__ == '__main__':
+    main()
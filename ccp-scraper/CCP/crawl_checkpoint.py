@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import gzip
+import json
+import time
+
+class CrawlCheckpoint:
+    """
+    Saves and restores scraper progress in a small gzipped JSON file.
+
+    A checkpoint records which phase the run was in and enough state to
+    continue it:
+        crawl   - the frontier (including pages that were in flight) and the
+                  visited set
+        analyze - the content pages found by the crawl and the ones already
+                  processed
+
+    Args:
+        path: The checkpoint file.
+        start_url: The crawl's start URL; a checkpoint from a different start
+            URL is ignored on load.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, start_url):
+        self.path = path
+        self.start_url = start_url
+        self.saves = 0
+
+    def load(self):
+        """Returns the saved state dictionary, or None if there is no usable checkpoint."""
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("version") != self.VERSION or state.get("start_url") != self.start_url:
+            return None
+        return state
+
+    def save(self, phase, **state):
+        """Atomically replaces the checkpoint with the given phase and state lists."""
+        record = {"version": self.VERSION, "start_url": self.start_url, "phase": phase, "saved_at": time.time()}
+        record.update({key: list(value) for key, value in state.items()})
+        tmp_path = self.path + ".tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(record, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.saves += 1
+
+    def clear(self):
+        """Removes the checkpoint once a run has finished."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+class TokenBucket:
+    """
+    A thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `burst`; each
+    request takes one token and waits only as long as needed for the next one,
+    instead of sleeping a fixed amount before every request.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available and takes it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+class HostRateLimiter:
+    """Keeps one TokenBucket per host so politeness is enforced per server."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url: str):
+        """Waits for this URL's host to allow another request."""
+        host = urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+        bucket.acquire()
+
+class ThrottledAdapter(HTTPAdapter):
+    """
+    A requests transport adapter that waits on a HostRateLimiter before every
+    request it sends to the network.
+
+    Throttling here rather than around session.get means responses answered
+    without a request (see http_cache.CachingAdapter) cost no token.
+    """
+
+    def __init__(self, limiter: HostRateLimiter, **kwargs):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire(request.url)
+        return super().send(request, **kwargs)
+
+def is_content_page(url: str) -> bool:
+    """Checks whether a leginfo URL displays law text rather than a table of contents."""
+    return 'codes_displayText.xhtml' in url or 'codes_displaySection.xhtml' in url
+
+class Crawler:
+    """
+    Breadth-first crawler with a deque frontier and a bounded pool of fetchers.
+
+    All fetchers share one `requests.Session` (and therefore its connection
+    pool). Only the coordinating thread touches the frontier and the visited
+    set; workers just fetch a page and return the links found on it.
+
+    Args:
+        session: The shared requests.Session.
+        link_filter: Callable taking an absolute URL and returning whether it
+            should be crawled.
+        workers: Maximum number of concurrent fetches.
+        rate: Requests per second allowed per host, or None when the
+            session's adapter already throttles (see ThrottledAdapter).
+        burst: Number of requests a host may receive back-to-back.
+        stats_interval: Seconds between progress stats lines.
+        on_page: Optional callable receiving (url, body bytes) for every page
+            fetched, called from the coordinating thread.
+        checkpoint: Optional callable receiving (pending urls, visited set),
+            called every `checkpoint_interval` seconds and when the crawl is
+            interrupted. Pending URLs include pages still in flight.
+        checkpoint_interval: Seconds between checkpoint calls.
+    """
+
+    def __init__(self, session, link_filter, workers=4, rate=5.0, burst=2, stats_interval=5.0, on_page=None,
+                 checkpoint=None, checkpoint_interval=30.0):
+        self.session = session
+        self.link_filter = link_filter
+        self.on_page = on_page
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.workers = max(1, workers)
+        self.limiter = HostRateLimiter(rate, burst) if rate is not None else None
+        self.stats_interval = stats_interval
+        self.frontier = deque()
+        self.visited = set()
+        self.pages_fetched = 0
+        self.errors = 0
+        self.started = None
+
+    def restore(self, pending, visited):
+        """Reloads a frontier and visited set saved by a checkpoint."""
+        self.visited.update(visited)
+        self.visited.update(pending)
+        self.frontier.extend(pending)
+
+    def add(self, url: str) -> bool:
+        """Queues a URL unless it has been seen before. Returns True if queued."""
+        if url in self.visited:
+            return False
+        self.visited.add(url)
+        self.frontier.append(url)
+        return True
+
+    def fetch_links(self, url: str) -> tuple:
+        """
+        Fetches one page and finds its links (runs in a worker).
+
+        Returns:
+            A (body bytes, list of absolute link URLs) tuple.
+        """
+        if self.limiter is not None:
+            self.limiter.acquire(url)
+        response = self.session.get(url)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, 'html.parser')
+
+        links = []
+        for link in soup.find_all('a', href=True):
+            href = link.get('href', '').split('#')[0]
+            if not href or 'goUp=Y' in href or 'mailto:' in href:
+                continue
+            links.append(urljoin(url, href))
+        return response.content, links
+
+    def stats_line(self) -> str:
+        """Returns a one-line progress summary."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return (f"  [crawl] {self.pages_fetched} pages in {elapsed:.1f}s "
+                f"({self.pages_fetched / elapsed:.2f} pages/sec), "
+                f"queue depth {len(self.frontier)}, {self.errors} errors")
+
+    def crawl(self, seeds):
+        """
+        Crawls outward from the seed URLs until the frontier is exhausted.
+
+        Returns:
+            The set of all URLs visited, seeds included.
+        """
+        for url in seeds:
+            self.add(url)
+
+        self.started = time.monotonic()
+        last_report = last_checkpoint = self.started
+        in_flight = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                while self.frontier or in_flight:
+                    while self.frontier and len(in_flight) < self.workers:
+                        url = self.frontier.popleft()
+                        in_flight[pool.submit(self.fetch_links, url)] = url
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        url = in_flight[future]
+                        try:
+                            body, links = future.result()
+                        except Exception as e:
+                            # One bad page (network error, unparsable HTML...) must not end the crawl
+                            self.errors += 1
+                            print(f"    Could not crawl {url}: {e}")
+                            del in_flight[future]
+                            continue
+
+                        self.pages_fetched += 1
+                        print(f"  Crawled page: {url}")
+                        if self.on_page is not None:
+                            self.on_page(url, body)
+                        for full_url in links:
+                            if self.link_filter(full_url) and self.add(full_url):
+                                print(f"    -> Found new CCP link: {full_url}")
+                        # Only drop the page once its links are queued, so a checkpoint never loses them
+                        del in_flight[future]
+
+                    now = time.monotonic()
+                    if now - last_report >= self.stats_interval:
+                        print(self.stats_line())
+                        last_report = now
+                    if self.checkpoint is not None and now - last_checkpoint >= self.checkpoint_interval:
+                        self.checkpoint(list(in_flight.values()) + list(self.frontier), self.visited)
+                        last_checkpoint = now
+        except KeyboardInterrupt:
+            if self.checkpoint is not None:
+                self.checkpoint(list(in_flight.values()) + list(self.frontier), self.visited)
+            raise
+
+        print(self.stats_line())
+        return set(self.visited)
@@ -3,35 +3,60 @@
 
 import re
 import json
+import hashlib
 from pypdf import PdfReader
 import os
+import sys
+import time
+import argparse
 import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tag_classifier import classify_tags
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from section_id import canonical_section, section_sort_key
+
+# Bump whenever parse_rules_from_text, extract_metadata or the section
+# number read from a file name change their output, so the incremental batch
+# mode re-parses every section on the next run.
+# 2: section numbers are canonical (CCP_0437C.pdf is section 437c).
+PARSER_VERSION = "2"
+
+def extract_pages_from_pdf(pdf_path: str) -> list:
     """
-    Extracts all text content from a given PDF file.
+    Extracts the text of each page of a given PDF file.
 
     Args:
         pdf_path: The file path to the PDF.
 
     Returns:
-        A single string containing all the text from the PDF.
-        Returns an empty string if the file cannot be read.
+        A list with one string per page.
+        Returns an empty list if the file cannot be read.
     """
     if not os.path.exists(pdf_path):
         print(f"Error: File not found at {pdf_path}")
-        return ""
-        
+        return []
+
     try:
         reader = PdfReader(pdf_path)
-        full_text = []
-        for page in reader.pages:
-            full_text.append(page.extract_text())
-        # Join with spaces to handle text broken across lines/pages better
-        return " ".join(full_text)
+        return [page.extract_text() for page in reader.pages]
     except Exception as e:
         print(f"An error occurred while reading the PDF '{pdf_path}': {e}")
-        return ""
+        return []
+
+def extract_text_from_pdf(pdf_path: str) -> str:
+    """
+    Extracts all text content from a given PDF file.
+
+    Args:
+        pdf_path: The file path to the PDF.
+
+    Returns:
+        A single string containing all the text from the PDF.
+        Returns an empty string if the file cannot be read.
+    """
+    # Join with spaces to handle text broken across lines/pages better
+    return " ".join(extract_pages_from_pdf(pdf_path))
 
 def clean_text(text: str) -> str:
     """
@@ -95,21 +120,7 @@ def extract_metadata(rule_text: str) -> dict:
     metadata['cross_references'] = re.findall(cross_ref_pattern, rule_text, re.IGNORECASE)
 
     # 4. Rule Classification Tags
-    tags = set()
-    tag_keywords = {
-        'motion': ['motion', 'move'],
-        'deadline': ['days', 'date', 'period', 'time', 'within'],
-        'service': ['served', 'service', 'delivery'],
-        'evidence': ['affidavits', 'declarations', 'evidence', 'admissions', 'depositions'],
-        'sanction': ['sanctions', 'bad faith'],
-        'judgment': ['judgment'],
-        'opposition': ['opposition'],
-        'reply': ['reply']
-    }
-    for tag, keywords in tag_keywords.items():
-        if any(re.search(r'\b' + keyword + r'\b', rule_text, re.IGNORECASE) for keyword in keywords):
-            tags.add(tag)
-    metadata['tags'] = sorted(list(tags))
+    metadata['tags'] = classify_tags(rule_text)
     
     return metadata
 
@@ -236,41 +247,310 @@ def parse_rules_from_text(text: str, section_number: str) -> dict:
         "rules": parsed_rules
     }
 
-def process_file(pdf_path, output_dir):
-    """Processes a single PDF file for rule extraction."""
-    print("-" * 50)
-    print(f"Processing file: {os.path.basename(pdf_path)}")
+def file_sha256(path: str) -> str:
+    """Returns the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def manifest_path_for(output_dir: str) -> str:
+    """Returns the manifest location, stored next to (not inside) the output directory."""
+    return os.path.normpath(output_dir) + ".manifest.json"
+
+def load_manifest(manifest_path: str) -> dict:
+    """
+    Loads the incremental-extraction manifest.
+
+    Returns:
+        A dictionary keyed by PDF file name. Each entry records the PDF's
+        content hash, size, mtime, the parser version and the output path.
+        Returns an empty dictionary if the manifest is missing or unreadable.
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get("files", {}) if isinstance(manifest, dict) else {}
+
+def save_manifest(manifest_path: str, entries: dict):
+    """Writes the manifest atomically so an interrupted run never leaves it half-written."""
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"parser_version": PARSER_VERSION, "files": entries}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def is_entry_current(entry, output_path=None) -> bool:
+    """
+    Checks that a manifest entry was produced by this parser and its output
+    still exists. Entries for skipped files have no output to check.
+    """
+    if not entry or entry.get("parser_version") != PARSER_VERSION:
+        return False
+    if entry.get("status") == "skipped":
+        return True
+    if output_path is not None and entry.get("output_path") != output_path:
+        return False
+    return bool(entry.get("output_path")) and os.path.exists(entry["output_path"])
+
+def process_file(pdf_path, output_dir, quiet=False, previous_entry=None):
+    """
+    Processes a single PDF file for rule extraction.
+
+    Args:
+        pdf_path: The file path to the PDF.
+        output_dir: The directory the JSON output is written to.
+        quiet: Suppress progress output (used by the batch workers, whose
+            results are reported by the parent process instead).
+        previous_entry: The manifest entry from the last run, if any. When the
+            PDF's content hash still matches it, parsing is skipped (and a
+            file skipped last time is skipped again with the same error).
+
+    Returns:
+        A result dictionary with the file name, detected section number,
+        status ("success", "unchanged", "skipped" or "failed"), page count,
+        content hash, output path and an error message when applicable.
+    """
+    def log(message):
+        if not quiet:
+            print(message)
+
+    def skip(error):
+        # Hashed even so, so the manifest can skip the file without opening it next time
+        result["error"] = error
+        log(f"  -> SKIPPING: {error}")
+        if result["sha256"] is None:
+            try:
+                result["sha256"] = file_sha256(pdf_path)
+            except OSError:
+                pass
+        return result
 
-    # Automatically derive section number from filename
     basename = os.path.basename(pdf_path)
+    result = {
+        "file": basename,
+        "section_number": None,
+        "status": "skipped",
+        "pages": 0,
+        "sha256": None,
+        "output_path": None,
+        "error": None
+    }
+
+    log("-" * 50)
+    log(f"Processing file: {basename}")
+
+    # Automatically derive section number from filename
     match = re.search(r'(?:CCP_)?([a-zA-Z0-9\.]+)\.pdf', basename, re.IGNORECASE)
     
     if not match:
-        print(f"  -> SKIPPING: Could not determine section number from filename '{basename}'.")
-        return
+        return skip(f"Could not determine section number from filename '{basename}'.")
 
-    section_number = match.group(1)
-    print(f"  -> Detected section number: {section_number}")
+    section_number = canonical_section(match.group(1))
+    result["section_number"] = section_number
+    log(f"  -> Detected section number: {section_number}")
 
     output_json_path = os.path.join(output_dir, f'california_code_{section_number}_with_links.json')
 
+    # The file was touched but its bytes may be identical (e.g. re-downloaded)
+    if previous_entry is not None:
+        try:
+            result["sha256"] = file_sha256(pdf_path)
+        except OSError as e:
+            result["status"] = "failed"
+            result["error"] = f"Could not read file: {e}"
+            log(f"  -> FAILED: {result['error']}")
+            return result
+        if result["sha256"] == previous_entry.get("sha256") and previous_entry.get("status") == "skipped" \
+                and is_entry_current(previous_entry):
+            result["error"] = previous_entry.get("error")
+            log(f"  -> SKIPPING: Content hash matches the previous run, which skipped it: {result['error']}")
+            return result
+        if result["sha256"] == previous_entry.get("sha256") and is_entry_current(previous_entry, output_json_path):
+            result["status"] = "unchanged"
+            result["output_path"] = output_json_path
+            log("  -> UNCHANGED: Content hash matches the previous run.")
+            return result
+
     # Execution for one file
-    pdf_text = extract_text_from_pdf(pdf_path)
+    pages = extract_pages_from_pdf(pdf_path)
+    result["pages"] = len(pages)
+    pdf_text = " ".join(pages)
     if not pdf_text:
-        print("  -> SKIPPING: PDF text could not be extracted.")
-        return
+        return skip("PDF text could not be extracted.")
 
     structured_data = parse_rules_from_text(pdf_text, section_number)
     if "error" in structured_data:
-        print(f"  -> SKIPPING: Error during parsing: {structured_data['error']}")
-        return
+        return skip(f"Error during parsing: {structured_data['error']}")
 
     try:
         with open(output_json_path, 'w', encoding='utf-8') as f:
             json.dump(structured_data, f, indent=4)
-        print(f"  -> SUCCESS: Saved output to '{output_json_path}'")
+        result["status"] = "success"
+        result["output_path"] = output_json_path
+        if result["sha256"] is None:
+            result["sha256"] = file_sha256(pdf_path)
+        log(f"  -> SUCCESS: Saved output to '{output_json_path}'")
     except Exception as e:
-        print(f"  -> FAILED: An error occurred while saving the JSON file: {e}")
+        result["status"] = "failed"
+        result["error"] = f"An error occurred while saving the JSON file: {e}"
+        log(f"  -> FAILED: {result['error']}")
+
+    return result
+
+def list_pdf_files(folder_path):
+    """Returns the sorted full paths of all PDF files directly inside a folder."""
+    return [
+        os.path.join(folder_path, f)
+        for f in sorted(os.listdir(folder_path))
+        if f.lower().endswith('.pdf')
+    ]
+
+def run_batch(folder_path, output_dir=None, workers=None, force=False):
+    """
+    Processes every PDF in a folder over a pool of worker processes.
+
+    Results are printed as each file completes (not in submission order),
+    followed by an aggregate throughput summary. A manifest stored next to
+    the output directory makes the run incremental: files whose size and
+    mtime match the previous run are skipped without being opened, and
+    files whose stat changed are only re-parsed if their content hash did.
+    Files skipped for having no section number or no usable text are
+    recorded too, so they are not reopened either.
+
+    Args:
+        folder_path: The folder containing the CCP PDF files.
+        output_dir: Where to write the JSON files. Defaults to "<folder>/output".
+        workers: Number of worker processes. Defaults to the CPU count.
+        force: Ignore the manifest and re-parse every file.
+
+    Returns:
+        The list of per-file result dictionaries, in section order (files
+        without a section number last, by name).
+    """
+    if not os.path.isdir(folder_path):
+        print(f"Error: The provided path '{folder_path}' is not a valid directory.")
+        return []
+
+    output_dir = output_dir or os.path.join(folder_path, "output")
+    os.makedirs(output_dir, exist_ok=True)
+
+    pdf_paths = list_pdf_files(folder_path)
+    if not pdf_paths:
+        print("No PDF files found in the specified directory.")
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    total_files = len(pdf_paths)
+    print(f"Found {total_files} PDF file(s) to process with {workers} worker(s).")
+    print(f"Output will be saved in: {output_dir}")
+
+    manifest_path = manifest_path_for(output_dir)
+    previous_manifest = {} if force else load_manifest(manifest_path)
+    manifest = {}
+    stats = {}
+    results = []
+    start_time = time.perf_counter()
+
+    # O(stat) pass: anything whose size and mtime are unchanged is not even opened
+    pending = []
+    for path in pdf_paths:
+        name = os.path.basename(path)
+        st = os.stat(path)
+        stats[name] = st
+        entry = previous_manifest.get(name)
+        if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns and is_entry_current(entry):
+            manifest[name] = entry
+            skipped = entry.get("status") == "skipped"
+            results.append({
+                "file": name,
+                "section_number": entry.get("section_number"),
+                "status": "skipped" if skipped else "unchanged",
+                "pages": 0,
+                "sha256": entry.get("sha256"),
+                "output_path": entry.get("output_path"),
+                "error": entry.get("error") if skipped else None
+            })
+        else:
+            pending.append(path)
+
+    if results:
+        print(f"Skipping {len(results)} file(s) unchanged since the last run; {len(pending)} to check.")
+
+    done = len(results)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(process_file, path, output_dir, True, previous_manifest.get(os.path.basename(path))): path
+            for path in pending
+        }
+        for future in as_completed(futures):
+            done += 1
+            try:
+                result = future.result()
+            except Exception as e:
+                # A crashed worker must not take the rest of the batch with it
+                result = {
+                    "file": os.path.basename(futures[future]),
+                    "section_number": None,
+                    "status": "failed",
+                    "pages": 0,
+                    "sha256": None,
+                    "output_path": None,
+                    "error": str(e)
+                }
+            results.append(result)
+
+            if result["status"] in ("success", "unchanged"):
+                st = stats[result["file"]]
+                manifest[result["file"]] = {
+                    "section_number": result["section_number"],
+                    "sha256": result["sha256"],
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "parser_version": PARSER_VERSION,
+                    "output_path": result["output_path"]
+                }
+            elif result["status"] == "skipped" and result["sha256"] is not None:
+                st = stats[result["file"]]
+                manifest[result["file"]] = {
+                    "status": "skipped",
+                    "error": result["error"],
+                    "section_number": result["section_number"],
+                    "sha256": result["sha256"],
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "parser_version": PARSER_VERSION,
+                    "output_path": None
+                }
+
+            line = f"[{done}/{total_files}] {result['status'].upper():8} {result['file']}"
+            if result["status"] == "success":
+                line += f" ({result['pages']} pages) -> {result['output_path']}"
+            elif result["error"]:
+                line += f": {result['error']}"
+            print(line)
+
+    save_manifest(manifest_path, manifest)
+    print_batch_summary(results, time.perf_counter() - start_time)
+    results.sort(key=lambda r: (section_sort_key(r["section_number"]) if r["section_number"] else (2, (), ""), r["file"]))
+    return results
+
+def print_batch_summary(results, elapsed):
+    """Prints aggregate throughput statistics for a batch run."""
+    elapsed = max(elapsed, 1e-9)
+    total_pages = sum(r["pages"] for r in results)
+    succeeded = sum(1 for r in results if r["status"] == "success")
+    unchanged = sum(1 for r in results if r["status"] == "unchanged")
+    skipped = sum(1 for r in results if r["status"] == "skipped")
+    failed = sum(1 for r in results if r["status"] == "failed")
+
+    print("\n--- Batch Summary ---")
+    print(f"Files: {len(results)} ({succeeded} succeeded, {unchanged} unchanged, {skipped} skipped, {failed} failed)")
+    print(f"Pages: {total_pages}")
+    print(f"Elapsed: {elapsed:.2f}s")
+    print(f"Throughput: {len(results) / elapsed:.2f} files/sec, {total_pages / elapsed:.2f} pages/sec")
 
 def main():
     """
@@ -305,8 +585,30 @@ def main():
 
     print("\nBatch processing complete.")
 
+def parse_args(argv=None):
+    """Parses the command-line arguments for the non-interactive batch mode."""
+    parser = argparse.ArgumentParser(
+        description="Extract structured CCP rules from a folder of section PDFs."
+    )
+    parser.add_argument("folder", help="Folder containing the CCP PDF files.")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count).")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="Output directory (default: <folder>/output).")
+    parser.add_argument("--force", action="store_true",
+                        help="Ignore the incremental manifest and re-parse every PDF.")
+    return parser.parse_args(argv)
+
 
 if __name__ == '__main__':
     # Before running, ensure you have pypdf installed:
     # pip install pypdf
-    main()
+    #
+    # Run without arguments for the interactive prompt, or pass a folder for
+    # the parallel batch mode:
+    # python extract_rules.py ./pdfs --workers 8 --output-dir ./output
+    if len(sys.argv) > 1:
+        args = parse_args()
+        run_batch(args.folder, args.output_dir, args.workers, args.force)
+    else:
+        main()
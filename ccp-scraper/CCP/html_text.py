@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Parsing backends that turn a leginfo page into the law text process_page scans.
+
+Every backend produces the same string: the text of the `content_main` div
+(else `sectionText`, else `<body>`), without `<script>`, `<style>` and
+`<template>` contents, with each `<br>` turned into a newline and
+non-breaking spaces replaced by regular spaces. Raw bytes are decoded the
+way BeautifulSoup decodes them (the HTTP charset when given, else a BOM or
+`<meta charset>`, else UTF-8 with a windows-1252 fallback), so every
+backend sees the same characters.
+
+    selectolax   - Lexbor-based C parser, used when selectolax is installed
+    lxml         - lxml.html, used when lxml is installed
+    html.parser  - BeautifulSoup with the standard-library parser (always available)
+"""
+
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+CONTENT_IDS = ('content_main', 'sectionText')
+
+# Only build a tree for the content divs; the navigation chrome around them is skipped
+CONTENT_STRAINER = SoupStrainer('div', id=list(CONTENT_IDS))
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+# lxml refuses str input that still carries an XML encoding declaration
+XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+def _finish(text: str) -> str:
+    return text.replace(u'\xa0', ' ')
+
+CHARSET_PATTERN = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+def charset_from_content_type(content_type):
+    """Returns the charset declared in a Content-Type header, or None (no ISO-8859-1 default)."""
+    match = CHARSET_PATTERN.search(content_type or '')
+    return match.group(1) if match else None
+
+def decode_html(content, encoding=None) -> str:
+    """Decodes raw page bytes like BeautifulSoup does, trusting `encoding` (e.g. the HTTP charset) first."""
+    if isinstance(content, str):
+        return content
+    return UnicodeDammit(content, known_definite_encodings=[encoding] if encoding else [], is_html=True).unicode_markup
+
+def text_with_html_parser(content, encoding=None) -> str:
+    """The original pure-Python path, scoped to the content divs when they exist."""
+    content = decode_html(content, encoding)
+    soup = BeautifulSoup(content, 'html.parser', parse_only=CONTENT_STRAINER)
+    content_div = next((soup.find('div', id=div_id) for div_id in CONTENT_IDS if soup.find('div', id=div_id)), None)
+    if content_div is None:
+        # No content div: fall back to the whole body, which needs a full parse
+        soup = BeautifulSoup(content, 'html.parser')
+        content_div = soup.body or soup
+    for br in content_div.find_all("br"):
+        br.replace_with("\n")
+    return _finish(content_div.get_text())
+
+def text_with_lxml(content, encoding=None) -> str:
+    """Extracts the content text with lxml.html."""
+    root = lxml.html.fromstring(XML_DECLARATION.sub('', decode_html(content, encoding), count=1))
+    content_div = None
+    for div_id in CONTENT_IDS:
+        found = root.xpath('//div[@id=$id]', id=div_id)
+        if found:
+            content_div = found[0]
+            break
+    if content_div is None:
+        content_div = root.find('body') if root.tag != 'body' else root
+        if content_div is None:
+            content_div = root
+    for element in list(content_div.iter(*NON_TEXT_TAGS)):
+        element.drop_tree()
+    for br in content_div.iter('br'):
+        br.tail = "\n" + (br.tail or "")
+    return _finish(content_div.text_content())
+
+def text_with_selectolax(content, encoding=None) -> str:
+    """Extracts the content text with selectolax."""
+    tree = SelectolaxParser(decode_html(content, encoding))
+    content_div = None
+    for div_id in CONTENT_IDS:
+        content_div = tree.css_first(f'div#{div_id}')
+        if content_div is not None:
+            break
+    if content_div is None:
+        content_div = tree.body or tree.root
+    content_div.strip_tags(list(NON_TEXT_TAGS), recursive=True)
+    for br in content_div.css('br'):
+        br.replace_with("\n")
+    return _finish(content_div.text(deep=True, separator=''))
+
+BACKENDS = {
+    'selectolax': text_with_selectolax,
+    'lxml': text_with_lxml,
+    'html.parser': text_with_html_parser,
+}
+
+def available_backends() -> list:
+    """Returns the names of the backends usable in this environment, fastest first."""
+    names = []
+    if SelectolaxParser is not None:
+        names.append('selectolax')
+    if lxml is not None:
+        names.append('lxml')
+    names.append('html.parser')
+    return names
+
+def get_backend(name='auto'):
+    """
+    Returns the text extraction function for a backend name.
+
+    'auto' picks the fastest installed backend; an unavailable backend raises
+    ValueError rather than silently switching.
+    """
+    if name == 'auto':
+        name = available_backends()[0]
+    if name not in available_backends():
+        raise ValueError(f"Parsing backend '{name}' is not available (installed: {', '.join(available_backends())})")
+    return BACKENDS[name]
+
+def extract_page_text(content, backend='auto', encoding=None) -> str:
+    """Returns the law text of a page's raw HTML bytes; `encoding` is the HTTP charset, if known."""
+    return get_backend(backend)(content, encoding)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from crawler import ThrottledAdapter
+
+def normalize_url(url: str) -> str:
+    """Normalizes a URL into a cache key: lower-case scheme and host, sorted query, no fragment."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+class HTTPCache:
+    """
+    A persistent, size-bounded LRU cache of GET response bodies.
+
+    Bodies are stored one file per URL; an index.json next to them records
+    each entry's ETag, Last-Modified, storage time and size in least- to
+    most-recently-used order.
+
+    Args:
+        directory: Cache directory (created if missing).
+        max_bytes: Upper bound on the total size of cached bodies.
+        max_age: Seconds an entry is served without revalidating it. With the
+            default of 0 every hit is revalidated with a conditional request.
+    """
+
+    INDEX_NAME = "index.json"
+    SAVE_EVERY = 50
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024, max_age=0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.unsaved = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _index_path(self):
+        return os.path.join(self.directory, self.INDEX_NAME)
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".body")
+
+    def _load(self):
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, entry in entries:
+            if os.path.exists(self._body_path(key)):
+                self.entries[key] = entry
+                self.total_bytes += entry["size"]
+
+    def save(self):
+        """Writes the index atomically."""
+        with self.lock:
+            self._save_locked()
+
+    def _save_locked(self):
+        tmp_path = self._index_path() + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(list(self.entries.items()), f)
+        os.replace(tmp_path, self._index_path())
+        self.unsaved = 0
+
+    def lookup(self, key):
+        """
+        Returns (entry, body) for a cached URL and marks it most recently used,
+        or (None, None) if it is not cached.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None, None
+            try:
+                with open(self._body_path(key), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                self.total_bytes -= self.entries.pop(key)["size"]
+                return None, None
+            self.entries.move_to_end(key)
+            return entry, body
+
+    def is_fresh(self, entry) -> bool:
+        """Checks whether an entry is young enough to skip revalidation."""
+        return self.max_age > 0 and time.time() - entry["stored_at"] < self.max_age
+
+    def store(self, key, response):
+        """Caches a 200 response, evicting least-recently-used entries if over budget."""
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        entry = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "stored_at": time.time(),
+            "size": len(body)
+        }
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old["size"]
+            with open(self._body_path(key), 'wb') as f:
+                f.write(body)
+            self.entries[key] = entry
+            self.total_bytes += len(body)
+
+            while self.total_bytes > self.max_bytes:
+                old_key, old_entry = self.entries.popitem(last=False)
+                self.total_bytes -= old_entry["size"]
+                try:
+                    os.remove(self._body_path(old_key))
+                except OSError:
+                    pass
+
+            self.unsaved += 1
+            if self.unsaved >= self.SAVE_EVERY:
+                self._save_locked()
+
+    def touch(self, key):
+        """Restarts an entry's max-age clock after a successful revalidation."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry["stored_at"] = time.time()
+                self.unsaved += 1
+
+    def record(self, outcome, bytes_saved=0):
+        """Counts a lookup outcome ("hits", "revalidated" or "misses")."""
+        with self.lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self.bytes_saved += bytes_saved
+
+    def stats_line(self) -> str:
+        """Returns a one-line summary of cache effectiveness."""
+        return (f"HTTP cache: {self.hits} fresh hits, {self.revalidated} revalidated (304), "
+                f"{self.misses} misses, {self.bytes_saved / 1024:.1f} KB not downloaded")
+
+class CachingAdapter(ThrottledAdapter):
+    """
+    A requests transport adapter that answers GETs from an HTTPCache.
+
+    Fresh entries are returned without touching the network. Stale entries
+    are revalidated with If-None-Match / If-Modified-Since, and a 304 reply
+    is turned back into the cached 200 response, so callers never see the
+    difference. Mount it on a session to make caching transparent.
+
+    Only misses and revalidations wait on the host's rate limiter, so a rerun
+    served from the cache is not slowed down to the crawl rate.
+    """
+
+    def __init__(self, cache: HTTPCache, limiter, **kwargs):
+        super().__init__(limiter, **kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        key = normalize_url(request.url)
+        entry, body = self.cache.lookup(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record("hits", len(body))
+            return self._cached_response(request, entry, body)
+
+        if entry is not None:
+            if entry.get("etag"):
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            response.close()
+            self.cache.record("revalidated", len(body))
+            self.cache.touch(key)
+            return self._cached_response(request, entry, body)
+
+        self.cache.record("misses")
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        return response
+
+    def _cached_response(self, request, entry, body):
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.headers = CaseInsensitiveDict()
+        for header, field in (("ETag", "etag"), ("Last-Modified", "last_modified"), ("Content-Type", "content_type")):
+            if entry.get(field):
+                response.headers[header] = entry[field]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response._content_consumed = True
+        return response
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Local stand-in for leginfo.legislature.ca.gov that serves saved pages.
+
+Each saved page lives in one directory under the name returned by
+`saved_page_name`, i.e. the URL's path and query percent-encoded into a
+single file name. Point the scraper at it with:
+
+    python leginfo_standin.py ./saved_pages --port 8001
+    python scrape_and_process.py --start-url "http://localhost:8001/faces/codedisplayexpand.xhtml?tocCode=CCP"
+"""
+
+import os
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, quote
+
+def saved_page_name(url: str) -> str:
+    """Maps a URL (absolute or path-only) to the file name its saved copy uses."""
+    parts = urlsplit(url)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    return quote(target, safe='') + ".html"
+
+def make_handler(pages_dir):
+    """Builds a request handler class serving saved pages from `pages_dir`."""
+
+    class SavedPageHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = os.path.join(pages_dir, saved_page_name(self.path))
+            if not os.path.isfile(path):
+                self.send_error(404, "Page not saved")
+                return
+            with open(path, 'rb') as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SavedPageHandler
+
+def start_standin(pages_dir, port=0):
+    """
+    Starts the stand-in on a background thread.
+
+    Returns:
+        The running server; its base URL is http://localhost:<server.server_port>.
+        Call server.shutdown() to stop it.
+    """
+    server = ThreadingHTTPServer(("localhost", port), make_handler(pages_dir))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve saved leginfo pages locally.")
+    parser.add_argument("pages_dir", help="Directory of saved pages.")
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("localhost", args.port), make_handler(args.pages_dir))
+    print(f"Serving saved leginfo pages from {args.pages_dir} at http://localhost:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+class PageStore:
+    """
+    A size-bounded on-disk store of fetched page bodies, keyed by URL.
+
+    The crawl phase puts every content page it downloads here so the analysis
+    phase can read it back instead of fetching it a second time. When the
+    store grows past `max_bytes` the oldest pages are evicted; those are simply
+    fetched again later.
+
+    Args:
+        directory: Where page bodies are written (created if missing).
+        max_bytes: Upper bound on the total size of stored bodies.
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.entries = OrderedDict()  # url -> size in bytes, oldest first
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.stored = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest() + ".html")
+
+    def put(self, url, body: bytes):
+        """Stores a page body, evicting the oldest pages if over budget."""
+        if len(body) > self.max_bytes:
+            return
+        with self.lock:
+            if url in self.entries:
+                self.total_bytes -= self.entries.pop(url)
+            with open(self._path(url), 'wb') as f:
+                f.write(body)
+            self.entries[url] = len(body)
+            self.total_bytes += len(body)
+            self.stored += 1
+
+            while self.total_bytes > self.max_bytes:
+                old_url, size = self.entries.popitem(last=False)
+                self._remove(old_url)
+                self.total_bytes -= size
+                self.evicted += 1
+
+    def take(self, url):
+        """
+        Returns a stored page body and removes it from the store.
+
+        Returns:
+            The body bytes, or None if the page was never stored or was evicted.
+        """
+        with self.lock:
+            size = self.entries.pop(url, None)
+            if size is None:
+                self.misses += 1
+                return None
+            self.total_bytes -= size
+            path = self._path(url)
+            try:
+                with open(path, 'rb') as f:
+                    body = f.read()
+            except OSError:
+                self.misses += 1
+                return None
+            self._remove(url)
+            self.hits += 1
+            return body
+
+    def _remove(self, url):
+        try:
+            os.remove(self._path(url))
+        except OSError:
+            pass
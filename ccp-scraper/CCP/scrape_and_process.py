@@ -3,11 +3,23 @@
 
 import os
 import re
+import sys
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, parse_qs
-import json
 import time
+import argparse
+import tempfile
+from tag_classifier import TagClassifier
+from crawler import Crawler, HostRateLimiter, ThrottledAdapter, is_content_page
+from page_store import PageStore
+from http_cache import HTTPCache, CachingAdapter
+from html_text import extract_page_text, available_backends, charset_from_content_type
+from section_sink import open_sink
+from crawl_checkpoint import CrawlCheckpoint
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from section_id import canonical_section, section_sort_key
 
 # --- Helper functions ---
 
@@ -16,27 +28,61 @@ def clean_text(text: str) -> str:
     # Also replaces the non-breaking space character with a regular space
     return re.sub(r'\s+', ' ', text.strip()).replace(u'\xa0', ' ')
 
+# Section tags have always used a narrower evidence vocabulary than the PDF
+# extractor; kept as-is so existing section JSON does not change.
+SECTION_TAG_CLASSIFIER = TagClassifier({
+    'motion': ['motion', 'move'], 'deadline': ['days', 'date', 'period', 'time', 'within'],
+    'service': ['served', 'service', 'delivery'], 'evidence': ['affidavits', 'declarations', 'evidence'],
+    'sanction': ['sanctions', 'bad faith'], 'judgment': ['judgment'], 'opposition': ['opposition'], 'reply': ['reply']
+})
+
 def extract_metadata_for_rule(rule_text: str) -> dict:
     """Extracts metadata attributes from a single rule's text."""
-    metadata = {}
-    tags = set()
-    tag_keywords = {
-        'motion': ['motion', 'move'], 'deadline': ['days', 'date', 'period', 'time', 'within'],
-        'service': ['served', 'service', 'delivery'], 'evidence': ['affidavits', 'declarations', 'evidence'],
-        'sanction': ['sanctions', 'bad faith'], 'judgment': ['judgment'], 'opposition': ['opposition'], 'reply': ['reply']
-    }
-    for tag, keywords in tag_keywords.items():
-        if any(re.search(r'\b' + kw + r'\b', rule_text, re.IGNORECASE) for kw in keywords):
-            tags.add(tag)
-    metadata['tags'] = sorted(list(tags))
-    return metadata
+    return {'tags': SECTION_TAG_CLASSIFIER.tags(rule_text)}
+
+def page_sort_key(url: str):
+    """Orders pages by the section number in their URL; pages without one follow, by URL."""
+    section_num = parse_qs(urlparse(url).query).get('sectionNum', [None])[0]
+    return (section_sort_key(section_num) if section_num else (2, (), ""), url)
+
+# Division headings ("CHAPTER 3. Summary Judgment [437c - 438]") and section numbers in page text
+HEADING_PATTERN = re.compile(r'^\s*(PART|TITLE|CHAPTER|ARTICLE)\s+[\w\d\.]+\.?\s+.*?\[.*?\]', re.MULTILINE)
+SECTION_PATTERN = re.compile(r'\b(\d{1,4}(?:\.\d{1,4}[a-z]?)?)\.')
+
+# Nesting depth of each heading level on leginfo code pages
+HEADING_LEVELS = {'PART': 0, 'TITLE': 1, 'CHAPTER': 2, 'ARTICLE': 3}
+
+def breadcrumbs_at(heading_matches, positions) -> list:
+    """
+    Returns the nested heading path in effect at each text position.
+
+    Headings and positions (both in ascending order) are swept together once.
+    A stack holds the open PART/TITLE/CHAPTER/ARTICLE headings, and a new
+    heading closes every open heading at its level or deeper, so each path is
+    the true hierarchy rather than every heading seen so far.
+    """
+    paths = []
+    stack = []  # (level, cleaned heading text)
+    h = 0
+    for position in positions:
+        while h < len(heading_matches) and heading_matches[h].start() < position:
+            heading = heading_matches[h]
+            level = HEADING_LEVELS[heading.group(1)]
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, clean_text(heading.group(0))))
+            h += 1
+        paths.append([text for _, text in stack])
+    return paths
 
 # --- Main Scraper Script ---
 
-def get_links_to_process(start_url, toc_start_marker, toc_end_marker, session):
-    """Crawls the website to find all pages that might contain law text within the specified range."""
-    print("Starting crawl to find all potential content links...")
-    content_pages = set()
+# The TOC links between these two headings cover the whole CCP
+TOC_START_MARKER = "PART 1. OF COURTS OF JUSTICE"
+TOC_END_MARKER = "TITLE 7. UNIFORM FEDERAL LIEN REGISTRATION ACT"
+
+def get_toc_seed_links(start_url, toc_start_marker, toc_end_marker, session):
+    """Returns the Table of Contents links between the start and end markers, or [] on failure."""
     queue = []
     visited = set()
 
@@ -71,77 +117,95 @@ def get_links_to_process(start_url, toc_start_marker, toc_end_marker, session):
     except requests.exceptions.RequestException as e:
         print(f"Error accessing start page {start_url}: {e}")
         return []
+    return queue
 
-    crawl_queue = list(queue)
-    for url in queue:
-        if 'codes_displayText.xhtml' in url or 'codes_displaySection.xhtml' in url:
-            content_pages.add(url)
+def get_links_to_process(start_url, toc_start_marker, toc_end_marker, session, workers=4, page_store=None,
+                         checkpoint=None, resume_state=None):
+    """
+    Crawls the website to find all pages that might contain law text within the specified range.
+
+    Links are followed only on the start URL's host, so the crawl can be run
+    against a local stand-in serving saved leginfo pages. When a page store is
+    given, the body of every content page is kept in it for process_page.
+    With a CrawlCheckpoint, the frontier and visited set are saved
+    periodically, and a saved "crawl" state passed as `resume_state`
+    continues that crawl instead of starting from the TOC. The session's
+    adapter is expected to rate-limit requests (see ThrottledAdapter).
+    """
+    print("Starting crawl to find all potential content links...")
+    resuming = resume_state is not None and resume_state.get("phase") == "crawl"
+    if resuming:
+        queue = []
+        print(f"Resuming crawl: {len(resume_state['pending'])} pages queued, {len(resume_state['visited'])} already seen.")
+    else:
+        queue = get_toc_seed_links(start_url, toc_start_marker, toc_end_marker, session)
+        if not queue:
+            return []
 
-    while crawl_queue:
-        url = crawl_queue.pop(0)
-        print(f"  Crawling page: {url}")
-        
-        try:
-            time.sleep(0.1) 
-            response = session.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+    host = urlparse(start_url).netloc
 
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '').split('#')[0]
-                if not href or 'goUp=Y' in href or 'mailto:' in href:
-                    continue
+    def is_ccp_link(full_url):
+        is_ccp = 'tocCode=CCP' in full_url or 'lawCode=CCP' in full_url
+        return is_ccp and urlparse(full_url).netloc == host
+
+    def keep_content_page(url, body):
+        if page_store is not None and is_content_page(url):
+            page_store.put(url, body)
+
+    def save_checkpoint(pending, visited):
+        checkpoint.save("crawl", pending=pending, visited=visited)
+
+    crawler = Crawler(session, is_ccp_link, workers=workers, rate=None, on_page=keep_content_page,
+                      checkpoint=save_checkpoint if checkpoint is not None else None)
+    if resuming:
+        crawler.restore(resume_state["pending"], resume_state["visited"])
+    try:
+        content_pages = {url for url in crawler.crawl(queue) if is_content_page(url)}
+    except KeyboardInterrupt:
+        if checkpoint is not None:
+            print("\nInterrupted. Crawl progress saved; rerun with --resume to continue.")
+        raise
 
-                full_url = urljoin(url, href)
-                is_ccp_link = 'tocCode=CCP' in full_url or 'lawCode=CCP' in full_url
-                if 'leginfo.legislature.ca.gov' in full_url and is_ccp_link and full_url not in visited:
-                    print(f"    -> Found new CCP link: {full_url}")
-                    visited.add(full_url)
-                    crawl_queue.append(full_url)
-                    if 'codes_displayText.xhtml' in full_url or 'codes_displaySection.xhtml' in full_url:
-                        content_pages.add(full_url)
-        except requests.exceptions.RequestException as e:
-            print(f"    Could not crawl {url}: {e}")
-            
     print(f"Crawl complete. Found {len(content_pages)} unique content pages to analyze.")
     return list(content_pages)
 
-def process_page(url, session, output_dir):
+def process_page(url, session, sink, page_store=None, parser='auto'):
     """
     Fetches a page, identifies all law sections and their hierarchical context,
-    and saves each individual section to its own JSON file.
+    and writes each individual section to the output sink.
+
+    If the crawl already downloaded the page into `page_store`, that copy is
+    used and no request is made; a refetch is rate-limited by the session's
+    adapter like every other request to the host. `parser` names the
+    html_text backend used to extract the page's law text.
     """
     try:
         print(f"Analyzing page: {url}")
-        time.sleep(0.1)
-        response = session.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        content_div = soup.find('div', id='content_main') or soup.find('div', id='sectionText') or soup.body
-        
-        for br in soup.find_all("br"): br.replace_with("\n")
-        page_text = content_div.get_text().replace(u'\xa0', ' ')
-
-        heading_regex = r'^\s*(PART|TITLE|CHAPTER|ARTICLE)\s+[\w\d\.]+\.?\s+.*?\[.*?\]'
-        heading_matches = list(re.finditer(heading_regex, page_text, re.MULTILINE))
+        content = page_store.take(url) if page_store is not None else None
+        encoding = None
+        if content is None:
+            response = session.get(url)
+            response.raise_for_status()
+            content = response.content
+            encoding = charset_from_content_type(response.headers.get('Content-Type'))
+        page_text = extract_page_text(content, parser, encoding)
 
-        section_regex = r'\b(\d{1,4}(?:\.\d{1,4}[a-z]?)?)\.'
-        section_matches = list(re.finditer(section_regex, page_text))
+        heading_matches = list(HEADING_PATTERN.finditer(page_text))
+        section_matches = list(SECTION_PATTERN.finditer(page_text))
         
         # --- NEW LOGIC: Handle both multi-section and single-section pages ---
         
         if section_matches:
             # This is a page with multiple sections visible in the text
             print(f"  -> Found {len(heading_matches)} headings and {len(section_matches)} section references in text.")
+            section_paths = breadcrumbs_at(heading_matches, [m.start() for m in section_matches])
 
             for i, section_match in enumerate(section_matches):
-                section_number = section_match.group(1)
-                # Simple check to avoid creating files from out-of-context year numbers
-                if len(section_number) < 3: continue
+                # Simple check to avoid creating files from out-of-context year numbers;
+                # it looks at the text as written, so zero-padded "010" stays in
+                if len(section_match.group(1)) < 3: continue
+                section_number = canonical_section(section_match.group(1))
                 
-                output_filename = os.path.join(output_dir, f'{section_number}.json')
-
                 start_index = section_match.start()
                 end_index = section_matches[i + 1].start() if i + 1 < len(section_matches) else None
                 section_text_chunk = page_text[start_index:end_index]
@@ -150,15 +214,8 @@ def process_page(url, session, output_dir):
                 if len(section_text_chunk) < 50: # Arbitrary short length
                     continue
 
-                # ... (rest of the multi-section parsing logic remains the same)
-                parent_heading_text = f"SECTION {section_number}"
-                breadcrumb_path = []
-                for h in heading_matches:
-                    if h.start() < start_index:
-                        parent_heading_text = clean_text(h.group(0))
-                        breadcrumb_path.append(parent_heading_text)
-                    else:
-                        break
+                breadcrumb_path = section_paths[i]
+                parent_heading_text = breadcrumb_path[-1] if breadcrumb_path else f"SECTION {section_number}"
                 
                 rule_parts = re.split(r'(?=\(\s*[a-z]\s*\))', section_text_chunk)
                 main_rule_text = clean_text(rule_parts[0])
@@ -170,9 +227,8 @@ def process_page(url, session, output_dir):
                 rule_data = {"rule_id": section_number, "text": main_rule_text, "metadata": {"tags": extract_metadata_for_rule(section_text_chunk)['tags'], "subsections": subsections}, "last_updated": last_updated}
                 final_json = {"title": parent_heading_text, "path": breadcrumb_path, "source_url": url, "rule": rule_data}
 
-                with open(output_filename, 'w', encoding='utf-8') as f:
-                    json.dump(final_json, f, indent=4)
-                print(f"  -> SUCCESS (Text Match): Saved Section {section_number} to {output_filename}")
+                output_location = sink.write(section_number, final_json)
+                print(f"  -> SUCCESS (Text Match): Saved Section {section_number} to {output_location}")
 
         else:
             # FALLBACK LOGIC: This may be a single-section page (like 437c)
@@ -182,17 +238,13 @@ def process_page(url, session, output_dir):
             section_num_from_url = query_params.get('sectionNum', [None])[0]
 
             if section_num_from_url:
-                section_number = section_num_from_url
+                section_number = canonical_section(section_num_from_url)
                 print(f"  -> No sections in text, but found section '{section_number}' in URL.")
-                output_filename = os.path.join(output_dir, f'{section_number}.json')
-                
                 # The whole page text is the section chunk
                 section_text_chunk = page_text
                 
-                parent_heading_text = f"SECTION {section_number}"
-                breadcrumb_path = [clean_text(h.group(0)) for h in heading_matches]
-                if breadcrumb_path:
-                    parent_heading_text = breadcrumb_path[-1]
+                breadcrumb_path = breadcrumbs_at(heading_matches, [len(page_text)])[0]
+                parent_heading_text = breadcrumb_path[-1] if breadcrumb_path else f"SECTION {section_number}"
 
                 rule_parts = re.split(r'(?=\(\s*[a-z]\s*\))', section_text_chunk)
                 main_rule_text = clean_text(rule_parts[0] if rule_parts else "")
@@ -204,9 +256,8 @@ def process_page(url, session, output_dir):
                 rule_data = {"rule_id": section_number, "text": main_rule_text, "metadata": {"tags": extract_metadata_for_rule(section_text_chunk)['tags'], "subsections": subsections}, "last_updated": last_updated}
                 final_json = {"title": parent_heading_text, "path": breadcrumb_path, "source_url": url, "rule": rule_data}
 
-                with open(output_filename, 'w', encoding='utf-8') as f:
-                    json.dump(final_json, f, indent=4)
-                print(f"  -> SUCCESS (URL Match): Saved Section {section_number} to {output_filename}")
+                output_location = sink.write(section_number, final_json)
+                print(f"  -> SUCCESS (URL Match): Saved Section {section_number} to {output_location}")
             else:
                 print("  -> No section numbers found in text or URL. Likely a TOC. Skipping.")
 
@@ -216,31 +267,123 @@ def process_page(url, session, output_dir):
     except Exception as e:
         print(f"  -> FAILED during extraction for {url}: {e}")
 
+def parse_args(argv=None):
+    """Parses the command-line options for the scraper."""
+    parser = argparse.ArgumentParser(description="Crawl leginfo and save each CCP section as JSON.")
+    parser.add_argument("--start-url", default="https://leginfo.legislature.ca.gov/faces/codedisplayexpand.xhtml?tocCode=CCP",
+                        help="Table of contents page to start from (point at a local stand-in for testing).")
+    parser.add_argument("--output-dir", default="output_json", help="Directory for the section JSON files.")
+    parser.add_argument("--output-format", default="files", choices=["files", "jsonl"],
+                        help="One atomically written JSON file per section, or a single sections.jsonl.")
+    parser.add_argument("--compact", action="store_true", help="Write per-section files without indentation.")
+    parser.add_argument("--workers", type=int, default=4, help="Number of concurrent fetchers.")
+    parser.add_argument("--rate", type=float, default=5.0, help="Maximum requests per second per host.")
+    parser.add_argument("--page-store-mb", type=int, default=256,
+                        help="Disk budget for content pages kept between crawl and analysis.")
+    parser.add_argument("--cache-dir", default=".http_cache", help="Directory of the persistent HTTP cache.")
+    parser.add_argument("--cache-mb", type=int, default=512, help="Disk budget for the HTTP cache.")
+    parser.add_argument("--cache-max-age", type=int, default=0,
+                        help="Seconds a cached page is used without revalidation (0 = always revalidate).")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the HTTP cache.")
+    parser.add_argument("--parser", default="auto", choices=["auto"] + available_backends(),
+                        help="HTML parsing backend for section pages (default: fastest installed).")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run from the checkpoint in the output directory.")
+    parser.add_argument("--checkpoint-interval", type=float, default=30.0,
+                        help="Seconds between progress checkpoints.")
+    return parser.parse_args(argv)
+
+def run_phases(args, session, page_store, checkpoint, resume_state):
+    """Runs (or resumes) the crawl and then the analysis of every content page found."""
+    processed = set()
+    if resume_state is not None and resume_state["phase"] == "analyze":
+        pages_to_process = resume_state["pages"]
+        processed = set(resume_state["processed"])
+        print(f"Resuming analysis: {len(processed)} of {len(pages_to_process)} pages already processed.")
+    else:
+        pages_to_process = get_links_to_process(args.start_url, TOC_START_MARKER, TOC_END_MARKER, session,
+                                                workers=args.workers, page_store=page_store,
+                                                checkpoint=checkpoint, resume_state=resume_state)
+        checkpoint.save("analyze", pages=pages_to_process, processed=processed)
+
+    if not pages_to_process:
+        print("No pages found to process. Exiting.")
+        checkpoint.clear()
+        return
+
+    print(f"\nAnalyzing {len(pages_to_process)} pages for law sections...")
+    # A resumed run appends, so sections.jsonl may repeat those of the page
+    # that was interrupted; later lines supersede earlier ones.
+    resuming_analysis = resume_state is not None and resume_state["phase"] == "analyze"
+    with open_sink(args.output_format, args.output_dir, compact=args.compact, append=resuming_analysis) as sink:
+        last_checkpoint = time.monotonic()
+        try:
+            for i, url in enumerate(sorted(set(pages_to_process), key=page_sort_key)):
+                if url in processed:
+                    continue
+                print(f"\n--- Analyzing Page {i+1} of {len(pages_to_process)} ---")
+                process_page(url, session, sink, page_store, args.parser)
+                processed.add(url)
+                if time.monotonic() - last_checkpoint >= args.checkpoint_interval:
+                    # Sections must be on disk before their pages count as processed
+                    sink.flush()
+                    checkpoint.save("analyze", pages=pages_to_process, processed=processed)
+                    last_checkpoint = time.monotonic()
+        except KeyboardInterrupt:
+            sink.flush()
+            checkpoint.save("analyze", pages=pages_to_process, processed=processed)
+            print("\nInterrupted. Progress saved; rerun with --resume to continue.")
+            raise
+    checkpoint.clear()
+    print(f"\nWrote {sink.written} sections.")
+
+    print(f"\nFetches saved by reusing crawled pages: {page_store.hits} of {len(pages_to_process)} "
+          f"({page_store.misses} refetched, {page_store.evicted} evicted from the page store)")
+
 def main():
     """Main function to drive the scraping and processing workflow."""
-    start_url = "https://leginfo.legislature.ca.gov/faces/codedisplayexpand.xhtml?tocCode=CCP"
-    toc_start_marker = "PART 1. OF COURTS OF JUSTICE"
-    toc_end_marker = "TITLE 7. UNIFORM FEDERAL LIEN REGISTRATION ACT"
-    output_json_dir = "output_json"
+    args = parse_args()
+    start_url = args.start_url
+    output_json_dir = args.output_dir
     if not os.path.exists(output_json_dir):
         os.makedirs(output_json_dir)
 
-    with requests.Session() as session:
-        session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
-        pages_to_process = get_links_to_process(start_url, toc_start_marker, toc_end_marker, session)
-
-        if not pages_to_process:
-            print("No pages found to process. Exiting.")
-            return
+    checkpoint = CrawlCheckpoint(os.path.join(output_json_dir, ".crawl_checkpoint.json.gz"), start_url)
+    resume_state = None
+    if args.resume:
+        resume_state = checkpoint.load()
+        if resume_state is None:
+            print("No checkpoint found for this start URL; starting a fresh run.")
 
-        print(f"\nAnalyzing {len(pages_to_process)} pages for law sections...")
-        for i, url in enumerate(sorted(list(set(pages_to_process)))):
-            print(f"\n--- Analyzing Page {i+1} of {len(pages_to_process)} ---")
-            process_page(url, session, output_json_dir)
+    with requests.Session() as session, tempfile.TemporaryDirectory(prefix="ccp_pages_") as store_dir:
+        session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
+        # Let every concurrent fetcher keep its own pooled keep-alive connection
+        # and wait on one token bucket per host, shared by the crawl and the
+        # analysis refetches; cache hits never reach the network and take no token
+        limiter = HostRateLimiter(args.rate, burst=2)
+        cache = None
+        if args.no_cache:
+            adapter = ThrottledAdapter(limiter, pool_connections=args.workers, pool_maxsize=args.workers)
+        else:
+            # Statutes change a few times a year, so reruns mostly get 304s
+            cache = HTTPCache(args.cache_dir, max_bytes=args.cache_mb * 1024 * 1024, max_age=args.cache_max_age)
+            adapter = CachingAdapter(cache, limiter, pool_connections=args.workers, pool_maxsize=args.workers)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # Content pages downloaded during the crawl are reused by process_page
+        page_store = PageStore(store_dir, max_bytes=args.page_store_mb * 1024 * 1024)
+        try:
+            run_phases(args, session, page_store, checkpoint, resume_state)
+        finally:
+            # Also on an interrupt, so a resumed run finds every page stored so far
+            if cache is not None:
+                cache.save()
+                print(cache.stats_line())
 
     print(f"\nBatch processing complete. JSON files are saved in the '{output_json_dir}' directory.")
 
 if __name__ == '__main__':
     # Ensure you have the required libraries installed:
     # pip install requests beautifulsoup4
+    # Optional, for faster page parsing: pip install lxml (or selectolax)
     main()
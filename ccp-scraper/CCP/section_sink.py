@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import tempfile
+
+class PerFileSink:
+    """
+    Writes each section to its own `<section>.json` file.
+
+    Files are written to a temporary file in the same directory and renamed
+    into place, so an interrupted run never leaves a truncated JSON file.
+
+    Args:
+        output_dir: Directory for the section files.
+        compact: Write without indentation.
+    """
+
+    def __init__(self, output_dir, compact=False):
+        self.output_dir = output_dir
+        self.indent = None if compact else 4
+        self.written = 0
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write(self, section_number, record) -> str:
+        """Writes one section and returns the path it was saved to."""
+        path = os.path.join(self.output_dir, f'{section_number}.json')
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, prefix=f'.{section_number}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f, indent=self.indent)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.written += 1
+        return path
+
+    def flush(self):
+        """Nothing to do: every section file is complete once write() returns."""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class JsonLinesSink:
+    """
+    Appends every section as one compact JSON line to a single file.
+
+    Lines go through a large write buffer and are flushed and fsynced on
+    close, so a full-code scrape produces one consolidated artifact with a
+    handful of writes instead of one small file per section.
+
+    Args:
+        path: The .jsonl file to write.
+        append: Keep existing lines (e.g. when resuming) instead of truncating.
+        buffer_size: Size of the write buffer in bytes.
+    """
+
+    def __init__(self, path, append=False, buffer_size=1 << 20):
+        self.path = path
+        self.written = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, 'a' if append else 'w', encoding='utf-8', buffering=buffer_size)
+
+    def write(self, section_number, record) -> str:
+        """Buffers one section line and returns the file it is written to."""
+        self.file.write(json.dumps(record, separators=(',', ':')))
+        self.file.write('\n')
+        self.written += 1
+        return self.path
+
+    def flush(self):
+        """Pushes buffered lines to disk; call it before recording them as done in a checkpoint."""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_sink(output_format, output_dir, compact=False, append=False):
+    """
+    Creates the section sink for an output format.
+
+    Args:
+        output_format: "files" for one JSON file per section, or "jsonl" for a
+            single `sections.jsonl` in the output directory.
+        output_dir: The output directory.
+        compact: Drop indentation in "files" mode ("jsonl" is always compact).
+        append: Append to an existing `sections.jsonl` instead of replacing it.
+    """
+    if output_format == 'jsonl':
+        return JsonLinesSink(os.path.join(output_dir, 'sections.jsonl'), append=append)
+    if output_format == 'files':
+        return PerFileSink(output_dir, compact=compact)
+    raise ValueError(f"Unknown output format '{output_format}'")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+
+# Keyword vocabulary used to tag CCP rules. Each keyword is matched as a whole
+# word, case-insensitively.
+TAG_KEYWORDS = {
+    'motion': ['motion', 'move'],
+    'deadline': ['days', 'date', 'period', 'time', 'within'],
+    'service': ['served', 'service', 'delivery'],
+    'evidence': ['affidavits', 'declarations', 'evidence', 'admissions', 'depositions'],
+    'sanction': ['sanctions', 'bad faith'],
+    'judgment': ['judgment'],
+    'opposition': ['opposition'],
+    'reply': ['reply']
+}
+
+class TagClassifier:
+    """
+    Classifies rule text against a tag vocabulary in a single scan.
+
+    The whole vocabulary is compiled once into one alternation with a named
+    group per tag, e.g. ``\\b(?:(?P<motion>motion|move)|(?P<reply>reply))\\b``.
+    Classifying a rule is then one ``finditer`` over its text that reads the
+    tag off ``match.lastgroup`` and stops as soon as every tag has been seen,
+    instead of one ``re.search`` per keyword.
+    """
+
+    def __init__(self, tag_keywords: dict):
+        self.tag_keywords = tag_keywords
+        self._group_to_tag = {}
+        alternatives = []
+        for i, (tag, keywords) in enumerate(tag_keywords.items()):
+            # Tags are not guaranteed to be valid group names, so index them
+            group = f"t{i}"
+            self._group_to_tag[group] = tag
+            # Longest first so a keyword never loses to its own prefix
+            words = sorted(keywords, key=len, reverse=True)
+            alternatives.append(f"(?P<{group}>{'|'.join(re.escape(w) for w in words)})")
+        # A first-character lookahead lets the scan reject most word starts
+        # before trying any of the alternatives
+        initials = sorted({w[0].lower() for words in tag_keywords.values() for w in words})
+        lookahead = '(?=[' + ''.join(re.escape(c) for c in initials) + '])' if initials else ''
+        self.pattern = re.compile(r'\b' + lookahead + '(?:' + '|'.join(alternatives) + r')\b', re.IGNORECASE)
+
+    def classify(self, text: str) -> set:
+        """Returns the set of tags whose keywords occur in the text."""
+        found = set()
+        remaining = len(self._group_to_tag)
+        for match in self.pattern.finditer(text):
+            tag = self._group_to_tag[match.lastgroup]
+            if tag not in found:
+                found.add(tag)
+                remaining -= 1
+                if not remaining:
+                    break
+        return found
+
+    def tags(self, text: str) -> list:
+        """Returns the sorted list of tags, the form stored in rule metadata."""
+        return sorted(self.classify(text))
+
+DEFAULT_CLASSIFIER = TagClassifier(TAG_KEYWORDS)
+
+def classify_tags(rule_text: str) -> list:
+    """Tags a rule with the default CCP vocabulary."""
+    return DEFAULT_CLASSIFIER.tags(rule_text)
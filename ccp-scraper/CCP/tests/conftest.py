@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The scraper modules are scripts in the parent directory, not a package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,85 @@
+import pytest
+
+from html_text import extract_page_text
+from scrape_and_process import HEADING_LEVELS, HEADING_PATTERN, SECTION_PATTERN, breadcrumbs_at, clean_text
+
+def old_breadcrumbs(heading_matches, position):
+    """The per-section rescan process_page used before breadcrumbs_at: every earlier heading."""
+    path = []
+    for heading in heading_matches:
+        if heading.start() < position:
+            path.append(clean_text(heading.group(0)))
+        else:
+            break
+    return path
+
+def nested(path):
+    """Keeps the headings of a flat path that no later heading at the same or a higher level closes."""
+    level = lambda text: HEADING_LEVELS[text.split()[0]]
+    return [text for i, text in enumerate(path) if all(level(later) > level(text) for later in path[i + 1:])]
+
+def section_block(number):
+    return (f"<p>{number}. A party may move for the relief described in this section "
+            f"within 30 days after service of the notice.<br/>(a) First subdivision.</p>")
+
+def standin_page(parts=3, titles=3, chapters=3, articles=4, sections=5):
+    """
+    A leginfo-style code page with sibling divisions at every level; a count
+    of 0 leaves that level out, so sections sit directly under the one above.
+    """
+    levels = [("PART", parts), ("TITLE", titles), ("CHAPTER", chapters), ("ARTICLE", articles)]
+    blocks = []
+    number = 100
+
+    def division(depth):
+        nonlocal number
+        if depth == len(levels):
+            for _ in range(sections):
+                blocks.append(section_block(number))
+                number += 1
+            return
+        name, count = levels[depth]
+        if not count:
+            division(depth + 1)
+            return
+        for i in range(1, count + 1):
+            blocks.append(f"<h{depth + 3}>{name} {i}. General Provisions [{number} - {number + 99}]</h{depth + 3}>")
+            division(depth + 1)
+
+    division(0)
+    html = "<html><body><div id='content_main'>" + "\n".join(blocks) + "</div></body></html>"
+    return extract_page_text(html.encode("utf-8"), "html.parser")
+
+def scan(page_text):
+    return list(HEADING_PATTERN.finditer(page_text)), list(SECTION_PATTERN.finditer(page_text))
+
+def test_large_page_matches_old_implementation():
+    page_text = standin_page()
+    heading_matches, section_matches = scan(page_text)
+    # Heading numbers ("PART 1.") match the section pattern too, as on real pages
+    assert len(heading_matches) == 147 and len(section_matches) == 147 + 540
+
+    positions = [m.start() for m in section_matches]
+    paths = breadcrumbs_at(heading_matches, positions)
+    for position, path in zip(positions, paths):
+        old = old_breadcrumbs(heading_matches, position)
+        # The nearest heading, used as the section title, is unchanged
+        assert path[-1:] == old[-1:]
+        # The path is the old flat list with closed sibling headings removed
+        assert path == nested(old)
+
+@pytest.mark.parametrize("levels", [1, 2, 3, 4])
+def test_single_chain_identical_to_old_implementation(levels):
+    # Without sibling divisions, the old flat list already was the hierarchy
+    page_text = standin_page(parts=1, titles=int(levels > 1), chapters=int(levels > 2), articles=int(levels > 3), sections=40)
+    heading_matches, section_matches = scan(page_text)
+    assert len(heading_matches) == levels and len(section_matches) == levels + 40
+    positions = [m.start() for m in section_matches] + [len(page_text)]
+    for position, path in zip(positions, breadcrumbs_at(heading_matches, positions)):
+        assert path == old_breadcrumbs(heading_matches, position)
+
+def test_sibling_heading_closes_previous():
+    page_text = standin_page(parts=1, titles=1, chapters=2, articles=1, sections=2)
+    heading_matches, section_matches = scan(page_text)
+    last = breadcrumbs_at(heading_matches, [section_matches[-1].start()])[0]
+    assert [text.split(".")[0] for text in last] == ["PART 1", "TITLE 1", "CHAPTER 2", "ARTICLE 1"]
@@ -0,0 +1,66 @@
+import html
+
+import requests
+import pytest
+
+from crawler import Crawler
+from leginfo_standin import saved_page_name, start_standin
+
+TOC = "/faces/codes_displayexpand.xhtml?tocCode=CCP"
+
+def link_page(*hrefs):
+    links = "".join(f"<a href='{html.escape(href)}'>link</a>" for href in hrefs)
+    return f"<html><body>{links}</body></html>"
+
+# Every page the crawl can reach; "missing" is never saved, so it is a 404
+PAGES = {
+    TOC: link_page(
+        "/faces/codes_displayText.xhtml?lawCode=CCP&part=1",
+        "/faces/codes_displayText.xhtml?lawCode=CCP&part=2",
+        "/faces/codes_displayText.xhtml?lawCode=CCP&part=missing",
+        "/faces/codes_displayText.xhtml?lawCode=CCP&part=broken",
+        "/faces/other.xhtml?tocCode=PEN",
+    ),
+    "/faces/codes_displayText.xhtml?lawCode=CCP&part=1": link_page(
+        "/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=437c",
+        TOC,
+    ),
+    "/faces/codes_displayText.xhtml?lawCode=CCP&part=2": link_page(
+        "/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=437c#anchor",
+        "/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=1005",
+    ),
+    "/faces/codes_displayText.xhtml?lawCode=CCP&part=broken": link_page(),
+    "/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=437c": link_page(),
+    "/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=1005": link_page(),
+}
+
+class BrokenPageCrawler(Crawler):
+    """Fails on the "broken" page the way a parser error on a malformed page would."""
+
+    def fetch_links(self, url):
+        if "part=broken" in url:
+            raise ValueError("unparsable page")
+        return super().fetch_links(url)
+
+@pytest.fixture
+def standin(tmp_path):
+    for target, page in PAGES.items():
+        (tmp_path / saved_page_name(target)).write_text(page, encoding="utf-8")
+    server = start_standin(str(tmp_path))
+    yield f"http://localhost:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def test_crawl_survives_failing_pages(standin):
+    pages = []
+    with requests.Session() as session:
+        crawler = BrokenPageCrawler(session, lambda url: "CCP" in url, workers=3, rate=1000.0, burst=10,
+                                    stats_interval=60.0, on_page=lambda url, body: pages.append(url))
+        visited = crawler.crawl([standin + TOC])
+
+    expected = {standin + target for target in PAGES} | {standin + "/faces/codes_displayText.xhtml?lawCode=CCP&part=missing"}
+    assert visited == expected
+    # The 404 and the parser failure are counted; every other page is fetched once
+    assert crawler.errors == 2
+    assert crawler.pages_fetched == len(expected) - 2
+    assert sorted(pages) == sorted(url for url in expected if "missing" not in url and "broken" not in url)
@@ -0,0 +1,54 @@
+import pytest
+
+from html_text import BACKENDS, available_backends, charset_from_content_type, extract_page_text
+
+PAGES = {
+    "utf8_without_meta": (
+        "<html><body><div id='content_main'>café §\xa01.<br>Next line</div></body></html>".encode("utf-8"),
+        None,
+        "café § 1.\nNext line",
+    ),
+    "http_charset": (
+        "<html><body><div id='content_main'>café §</div></body></html>".encode("cp1252"),
+        "windows-1252",
+        "café §",
+    ),
+    "meta_charset": (
+        "<html><head><meta charset='windows-1252'></head><body><div id='content_main'>café</div></body></html>".encode("cp1252"),
+        None,
+        "café",
+    ),
+    "scripts_and_styles": (
+        b"<html><body><div id='content_main'><script>var x = 1;</script><style>p {}</style>"
+        b"Text <b>kept<script>dropped()</script> here</b><template>t</template><!-- note --></div></body></html>",
+        None,
+        "Text kept here",
+    ),
+    "section_text_fallback": (
+        b"<html><body><div id='nav'>Menu</div><div id='sectionText'>437c. Motion<br/>(a) Text</div></body></html>",
+        None,
+        "437c. Motion\n(a) Text",
+    ),
+    "body_fallback": (
+        b"<html><body><p>Only body</p><script>x()</script></body></html>",
+        None,
+        "Only body",
+    ),
+}
+
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("name", sorted(PAGES))
+def test_backends_agree(backend, name):
+    content, encoding, expected = PAGES[name]
+    assert BACKENDS[backend](content, encoding) == expected
+    assert BACKENDS[backend](content, encoding) == BACKENDS["html.parser"](content, encoding)
+
+def test_auto_backend_matches_html_parser():
+    for content, encoding, _ in PAGES.values():
+        assert extract_page_text(content, "auto", encoding) == extract_page_text(content, "html.parser", encoding)
+
+def test_charset_from_content_type():
+    assert charset_from_content_type("text/html; charset=UTF-8") == "UTF-8"
+    assert charset_from_content_type('text/html; charset="windows-1252"') == "windows-1252"
+    assert charset_from_content_type("text/html") is None
+    assert charset_from_content_type(None) is None
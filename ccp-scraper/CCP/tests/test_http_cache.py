@@ -0,0 +1,37 @@
+import requests
+
+from crawler import HostRateLimiter
+from http_cache import HTTPCache, CachingAdapter
+from leginfo_standin import saved_page_name, start_standin
+
+PAGE = "/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=437c"
+
+class CountingLimiter(HostRateLimiter):
+    def __init__(self):
+        super().__init__(rate=1000.0, burst=10)
+        self.acquired = []
+
+    def acquire(self, url):
+        self.acquired.append(url)
+        super().acquire(url)
+
+def test_fresh_hits_take_no_rate_limit_token(tmp_path):
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    (pages / saved_page_name(PAGE)).write_text("<html><body>437c.</body></html>", encoding="utf-8")
+    server = start_standin(str(pages))
+    url = f"http://localhost:{server.server_port}{PAGE}"
+    try:
+        limiter = CountingLimiter()
+        cache = HTTPCache(str(tmp_path / "cache"), max_age=3600)
+        with requests.Session() as session:
+            session.mount("http://", CachingAdapter(cache, limiter))
+            bodies = [session.get(url).content for _ in range(3)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert bodies == [bodies[0]] * 3
+    assert (cache.misses, cache.hits) == (1, 2)
+    # Only the miss went to the network
+    assert limiter.acquired == [url]
@@ -3,8 +3,12 @@ import fitz
 import json
 import os
 import re
+import sys
 from urllib.parse import urljoin
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from section_id import parse_section_id, section_sort_key
+
 def extract_toc_links(pdf_path):
     """Extract section links from the CCP Table of Contents PDF"""
     try:
@@ -88,23 +92,16 @@ def extract_toc_links(pdf_path):
         
         doc.close()
         
-        # Remove duplicates and sort
+        # Remove duplicates and sort. The first link of a section wins; links
+        # are keyed by SectionId so spellings like "437C" and "437c" merge.
         unique_links = {}
         for link in links:
-            key = link['ruleNumber']
-            if key not in unique_links:
-                unique_links[key] = link
+            unique_links.setdefault(parse_section_id(link['ruleNumber']) or link['ruleNumber'], link)
         
         final_links = list(unique_links.values())
         
         # Sort by section number
-        def sort_key(link):
-            try:
-                return float(link['ruleNumber'])
-            except:
-                return 0
-        
-        final_links.sort(key=sort_key)
+        final_links.sort(key=lambda link: section_sort_key(link['ruleNumber']))
         
         print(f"\nExtracted {len(final_links)} unique section links")
         
@@ -0,0 +1,126 @@
+"""
+Benchmark for the analyze_ccp_content pattern bank.
+
+Runs the original per-pattern re.findall analysis and the single-pass
+CCP_PATTERNS analysis over the same documents, reports the time per document
+and checks that both produce exactly the same analysis.
+
+Documents are the text of every PDF in --pdf-dir plus, if it exists, the
+full_text of every record in an earlier results file.
+
+Usage:
+    python ccp_results/bench_ccp_patterns.py
+    python ccp_results/bench_ccp_patterns.py --pdf-dir ccp_pdfs --results ccp_results/ccp_pymupdf_results.json
+"""
+
+import os
+import re
+import glob
+import time
+import argparse
+
+import fitz
+
+from process_ccp_pdfs import analyze_ccp_content
+from results_io import iter_results
+
+def legacy_analyze_ccp_content(text, rule_info):
+    """The original implementation: every pattern recompiled and run with its own findall."""
+    analysis = {
+        "section_number": rule_info.get("ruleNumber", ""),
+        "section_title": rule_info.get("title", ""),
+        "filing_relevance": rule_info.get("filingRelevance", {}),
+        "procedural_requirements": [],
+        "filing_procedures": [],
+        "service_requirements": [],
+        "deadlines_and_timing": [],
+        "format_specifications": [],
+        "cross_references": [],
+        "key_provisions": []
+    }
+    proc_patterns = [
+        r'shall\s+(?:be\s+)?(?:file[d]?|serve[d]?)\s+([^.]{10,100})',
+        r'must\s+(?:be\s+)?(?:file[d]?|serve[d]?)\s+([^.]{10,100})',
+        r'(?:filing|service)\s+(?:shall|must)\s+([^.]{10,100})',
+        r'(?:document|paper|pleading)\s+(?:shall|must)\s+([^.]{10,100})'
+    ]
+    for pattern in proc_patterns:
+        for match in re.findall(pattern, text, re.IGNORECASE):
+            if len(match.strip()) > 15:
+                analysis["procedural_requirements"].append(match.strip()[:200])
+    timing_patterns = [
+        r'within\s+(\d+)\s+(calendar\s+days?|court\s+days?|business\s+days?|days?)',
+        r'(\d+)\s+(calendar\s+days?|court\s+days?|business\s+days?)\s+(?:before|after|from)',
+        r'(?:no\s+later\s+than|not\s+later\s+than)\s+([^.]{5,50})',
+        r'(?:deadline|due\s+date|time\s+limit)\s+(?:is|shall\s+be)\s+([^.]{5,50})'
+    ]
+    for pattern in timing_patterns:
+        for match in re.findall(pattern, text, re.IGNORECASE):
+            timing_text = ' '.join(match) if isinstance(match, tuple) else match
+            if len(timing_text.strip()) > 3:
+                analysis["deadlines_and_timing"].append(timing_text.strip()[:150])
+    ref_patterns = [
+        r'(?:Section|Rule|Code)\s+(\d+\.?\d*(?:\.\d+)?)',
+        r'Code\s+of\s+Civil\s+Procedure\s+[Ss]ection\s+(\d+\.?\d*)',
+        r'California\s+Rules\s+of\s+Court\s+[Rr]ule\s+(\d+\.?\d*)',
+    ]
+    for pattern in ref_patterns:
+        for match in re.findall(pattern, text, re.IGNORECASE):
+            if match not in analysis["cross_references"]:
+                analysis["cross_references"].append(match)
+    paragraphs = text.split('\n\n')
+    filing_terms = ['filing', 'service', 'pleading', 'summons', 'complaint', 'procedure', 'deadline', 'format']
+    for para in paragraphs:
+        para = para.strip()
+        if len(para) > 50 and any(term in para.lower() for term in filing_terms):
+            analysis["key_provisions"].append(para[:300])
+            if len(analysis["key_provisions"]) >= 5:
+                break
+    return analysis
+
+def load_documents(pdf_dir, results_path):
+    """Returns (text, rule_info) pairs from the PDFs and the earlier results file."""
+    documents = []
+    for pdf_path in sorted(glob.glob(os.path.join(pdf_dir, "*.pdf"))):
+        with fitz.open(pdf_path) as doc:
+            text = "".join(page.get_text() + "\n" for page in doc)
+        documents.append((text, {"ruleNumber": os.path.basename(pdf_path)}))
+    if results_path and os.path.exists(results_path):
+        for record in iter_results(results_path):
+            if "content" in record:
+                documents.append((record["content"]["full_text"], record["rule_info"]))
+    return documents
+
+def time_per_document(analyze, documents, repeat=5):
+    """Returns the best-of-`repeat` analysis time per document, in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text, rule_info in documents:
+            analyze(text, rule_info)
+        best = min(best, time.perf_counter() - start)
+    return best / len(documents) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CCP pattern bank against the original findall loop")
+    parser.add_argument("--pdf-dir", default="ccp_pdfs", help="Directory of PDFs to analyze")
+    parser.add_argument("--results", default="ccp_results/ccp_pymupdf_results.json", help="Earlier results file whose full_text is reused")
+    args = parser.parse_args()
+
+    documents = load_documents(args.pdf_dir, args.results)
+    if not documents:
+        print("No documents found.")
+        return
+
+    mismatches = sum(1 for text, rule_info in documents
+                     if legacy_analyze_ccp_content(text, rule_info) != analyze_ccp_content(text, rule_info))
+    characters = sum(len(text) for text, _ in documents)
+    print(f"Documents: {len(documents)} ({characters / len(documents) / 1024:.1f} K characters average)")
+
+    legacy_ms = time_per_document(legacy_analyze_ccp_content, documents)
+    bank_ms = time_per_document(analyze_ccp_content, documents)
+    print(f"{'per-pattern findall':22} {legacy_ms:8.3f} ms/document")
+    print(f"{'pattern bank':22} {bank_ms:8.3f} ms/document  {legacy_ms / bank_ms:5.1f}x  mismatches: {mismatches}")
+
+if __name__ == '__main__':
+    main()
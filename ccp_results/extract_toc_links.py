@@ -1,110 +1,178 @@
 
+import bisect
 import fitz
 import json
 import os
 import re
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from urllib.parse import urljoin
 
-def extract_toc_links(pdf_path):
-    """Extract section links from the CCP Table of Contents PDF"""
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from section_id import parse_section_id, section_sort_key
+
+SECTION_URI_PATTERN = re.compile(r'sectionNum=([\d\.a-z]+)')
+
+# Section number patterns found in the TOC text (including lettered subsections)
+SECTION_TEXT_PATTERNS = [
+    re.compile(r'(\d+[a-z]?\.\d+[a-z]?)\s+[A-Z][^\n]{10,}', re.MULTILINE),  # "415.10 SOME TITLE" or "437c.10 TITLE"
+    re.compile(r'(\d+[a-z]?)\s+[A-Z][^\n]{10,}', re.MULTILINE),               # "415 SOME TITLE" or "437c TITLE"
+    re.compile(r'Section\s+(\d+[a-z]?\.?\d*[a-z]?)\s+[A-Z][^\n]{10,}', re.MULTILINE),  # "Section 415.10 SOME TITLE" or "Section 437c TITLE"
+    re.compile(r'(\d+[a-z])\.\s+[A-Z][^\n]{10,}', re.MULTILINE),             # "437c. SOME TITLE"
+]
+
+# A section number as a whole token within a line of text
+SECTION_TOKEN = re.compile(r'(?<![\w.])\d+[a-z]?(?:\.\d+[a-z]?)*(?![\w])')
+
+SECTION_URL = "https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum={}"
+
+class PageTextIndex:
+    """
+    Line geometry and a section-number lookup for one TOC page, built once.
+
+    Lines come from get_text("dict") with their bounding boxes, sorted top to
+    bottom, so the text next to a link rectangle is found with a binary search
+    instead of rescanning the page text for every link.
+    """
+
+    def __init__(self, page):
+        lines = []
+        for block in page.get_text("dict")["blocks"]:
+            for line in block.get("lines", []):
+                text = "".join(span["text"] for span in line["spans"]).strip()
+                if text:
+                    lines.append((fitz.Rect(line["bbox"]), text))
+        lines.sort(key=lambda item: ((item[0].y0 + item[0].y1) / 2, item[0].x0))
+        self.lines = lines
+        self.centers = [(rect.y0 + rect.y1) / 2 for rect, _ in lines]
+
+        # First line (in reading order) mentioning each section number
+        self.section_lines = {}
+        for _, text in lines:
+            if text.isdigit():
+                continue
+            for token in SECTION_TOKEN.findall(text):
+                if len(text) > len(token):
+                    self.section_lines.setdefault(token, text)
+
+    def row_text(self, rect):
+        """Returns the text of the lines on the same row as `rect`, left to right."""
+        start = bisect.bisect_left(self.centers, rect.y0)
+        end = bisect.bisect_right(self.centers, rect.y1)
+        row = sorted(self.lines[start:end], key=lambda item: item[0].x0)
+        return " ".join(text for _, text in row)
+
+    def title_for(self, section_num, rect):
+        """
+        Picks the title of a linked section.
+
+        The text on the link's own row wins when it says more than the bare
+        section number; otherwise the first line mentioning the number is used.
+        """
+        row = self.row_text(rect)
+        if len(row) > len(section_num) and not row.isdigit():
+            return row[:200]
+        title = self.section_lines.get(section_num)
+        if title:
+            return title[:200]
+        return f"CCP Section {section_num}"
+
+def extract_page_links(page, page_num):
+    """
+    Extracts the section links of one TOC page.
+
+    Returns hyperlinked sections first, then sections found by text pattern,
+    in page order; duplicates are left for the caller to resolve.
+    """
+    page_links = []
+    index = None
+    for link in page.get_links():
+        uri = link.get('uri')
+        # Look for CCP section links
+        if not uri or 'codes_displaySection' not in uri or 'CCP' not in uri:
+            continue
+        section_match = SECTION_URI_PATTERN.search(uri)
+        if not section_match:
+            continue
+        if index is None:
+            index = PageTextIndex(page)
+        section_num = section_match.group(1)
+        page_links.append({
+            'ruleNumber': section_num,
+            'title': index.title_for(section_num, link['from']),
+            'url': uri if uri.startswith('http') else f"https://leginfo.legislature.ca.gov{uri}",
+            'page': page_num + 1,
+            'source': 'toc_pdf_hyperlink'
+        })
+
+    page_text = page.get_text()
+    for pattern in SECTION_TEXT_PATTERNS:
+        for match in pattern.finditer(page_text):
+            section_num = match.group(1)
+            page_links.append({
+                'ruleNumber': section_num,
+                'title': match.group(0).strip()[:200],  # Limit title length
+                'url': SECTION_URL.format(section_num),
+                'page': page_num + 1,
+                'source': 'toc_pdf_text_pattern'
+            })
+    return page_links
+
+def extract_page_range(pdf_path, start, stop):
+    """
+    Extracts pages [start, stop) of a TOC PDF with the worker's own document handle.
+
+    Returns:
+        One list of links per page, in page order.
+    """
+    with fitz.open(pdf_path) as doc:
+        return [extract_page_links(doc[page_num], page_num) for page_num in range(start, stop)]
+
+def page_ranges(page_count, workers):
+    """Splits the page range into contiguous chunks, a few per worker so uneven pages balance out."""
+    chunk_count = min(page_count, workers * 4)
+    bounds = [page_count * i // chunk_count for i in range(chunk_count + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(chunk_count)]
+
+def extract_toc_links(pdf_path, workers=1):
+    """
+    Extract section links from the CCP Table of Contents PDF
+
+    With more than one worker the pages are split into contiguous ranges that
+    worker processes extract independently; the per-page results are merged
+    in page order, so the output is the same as a sequential run.
+    """
     try:
-        doc = fitz.open(pdf_path)
-        links = []
+        with fitz.open(pdf_path) as doc:
+            page_count = len(doc)
         
         print(f"Processing TOC PDF: {pdf_path}")
-        print(f"Total pages: {len(doc)}")
-        
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_text = page.get_text()
-            
-            # Extract hyperlinks from the page
-            page_links = page.get_links()
-            
-            for link in page_links:
-                if link.get('uri'):
-                    uri = link['uri']
-                    # Look for CCP section links
-                    if 'codes_displaySection' in uri and 'CCP' in uri:
-                        # Extract section number from URI (including lettered subsections)
-                        section_match = re.search(r'sectionNum=([\d\.a-z]+)', uri)
-                        if section_match:
-                            section_num = section_match.group(1)
-                            
-                            # Get the text content around this link for context
-                            rect = link['from']
-                            # Get text in the vicinity of the link
-                            text_area = page.get_text("text", clip=rect)
-                            
-                            # Try to find the section title in the surrounding text
-                            lines = page_text.split('\n')
-                            section_title = f"CCP Section {section_num}"
-                            
-                            # Look for lines containing the section number
-                            for line in lines:
-                                if section_num in line and len(line.strip()) > len(section_num):
-                                    # This line likely contains the section title
-                                    clean_line = line.strip()
-                                    if clean_line and not clean_line.isdigit():
-                                        section_title = clean_line[:200]  # Limit length
-                                        break
-                            
-                            links.append({
-                                'ruleNumber': section_num,
-                                'title': section_title,
-                                'url': uri if uri.startswith('http') else f"https://leginfo.legislature.ca.gov{uri}",
-                                'page': page_num + 1,
-                                'source': 'toc_pdf_hyperlink'
-                            })
-            
-            # Also extract section numbers from text patterns
-            # Look for section number patterns in the text (including lettered subsections)
-            section_patterns = [
-                r'(\d+[a-z]?\.\d+[a-z]?)\s+[A-Z][^\n]{10,}',  # "415.10 SOME TITLE" or "437c.10 TITLE"
-                r'(\d+[a-z]?)\s+[A-Z][^\n]{10,}',               # "415 SOME TITLE" or "437c TITLE"
-                r'Section\s+(\d+[a-z]?\.?\d*[a-z]?)\s+[A-Z][^\n]{10,}',  # "Section 415.10 SOME TITLE" or "Section 437c TITLE"
-                r'(\d+[a-z])\.\s+[A-Z][^\n]{10,}',             # "437c. SOME TITLE"
-            ]
-            
-            for pattern in section_patterns:
-                matches = re.finditer(pattern, page_text, re.MULTILINE)
-                for match in matches:
-                    section_num = match.group(1)
-                    full_match = match.group(0).strip()
-                    
-                    # Check if we already have this section from hyperlinks
-                    existing = any(link['ruleNumber'] == section_num for link in links)
-                    if not existing:
-                        # Generate the URL for this section
-                        section_url = f"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum={section_num}"
-                        
-                        links.append({
-                            'ruleNumber': section_num,
-                            'title': full_match[:200],  # Limit title length
-                            'url': section_url,
-                            'page': page_num + 1,
-                            'source': 'toc_pdf_text_pattern'
-                        })
+        print(f"Total pages: {page_count}")
         
-        doc.close()
+        if workers > 1 and page_count > 1:
+            ranges = page_ranges(page_count, workers)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # map() returns the ranges in submission order, i.e. page order
+                chunks = pool.map(extract_page_range, repeat(pdf_path), [r[0] for r in ranges], [r[1] for r in ranges])
+                pages = [page_links for chunk in chunks for page_links in chunk]
+        else:
+            pages = extract_page_range(pdf_path, 0, page_count)
         
-        # Remove duplicates and sort
+        # The first link seen for a section wins: hyperlinks before text
+        # patterns on a page, and earlier pages before later ones. Sections
+        # are keyed by SectionId so spellings like "437C" and "437c" merge.
         unique_links = {}
-        for link in links:
-            key = link['ruleNumber']
-            if key not in unique_links:
-                unique_links[key] = link
+        for page_links in pages:
+            for link in page_links:
+                unique_links.setdefault(parse_section_id(link['ruleNumber']) or link['ruleNumber'], link)
         
         final_links = list(unique_links.values())
         
-        # Sort by section number
-        def sort_key(link):
-            try:
-                return float(link['ruleNumber'])
-            except:
-                return 0
-        
-        final_links.sort(key=sort_key)
+        # Sort by section number, lettered sections in their natural place
+        final_links.sort(key=lambda link: section_sort_key(link['ruleNumber']))
         
         print(f"\nExtracted {len(final_links)} unique section links")
         
@@ -122,22 +190,33 @@ def extract_toc_links(pdf_path):
         print(f"Error extracting TOC links: {e}")
         return []
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extract section links from a code Table of Contents PDF")
+    parser.add_argument("--pdf", default="ccp_pdfs/ccp_toc.pdf", help="Table of Contents PDF")
+    parser.add_argument("--output", default="ccp_results/toc_links.json", help="Links JSON file")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count; 1 runs sequentially)")
+    return parser.parse_args(argv)
+
 def main():
-    pdf_path = "ccp_pdfs/ccp_toc.pdf"
+    args = parse_args()
+    pdf_path = args.pdf
     
     if not os.path.exists(pdf_path):
         print(f"Error: TOC PDF not found at {pdf_path}")
         return
     
-    links = extract_toc_links(pdf_path)
+    workers = args.workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    links = extract_toc_links(pdf_path, workers)
+    elapsed = time.perf_counter() - start_time
     
     # Save results
-    output_path = "ccp_results/toc_links.json"
+    output_path = args.output
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(links, f, indent=2, ensure_ascii=False)
     
     print(f"\n💾 TOC links saved to: {output_path}")
-    print(f"✅ Successfully extracted {len(links)} section links from TOC PDF")
+    print(f"✅ Successfully extracted {len(links)} section links from TOC PDF in {elapsed:.2f}s with {workers} worker(s)")
 
 if __name__ == "__main__":
     main()
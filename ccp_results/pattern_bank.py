@@ -0,0 +1,95 @@
+import re
+
+# Characters that match an ASCII letter under re.IGNORECASE but whose lower()
+# is not that letter (or not a single character). Text containing them is
+# scanned case-insensitively instead of through its lowercased copy.
+_CASE_EXCEPTIONS = ('İ', 'ı', 'ſ')
+
+class PatternBank:
+    """
+    A registry of precompiled, case-insensitive extraction patterns scanned in
+    a single pass.
+
+    Every pattern is registered under a category together with a lead: a
+    short lowercase regex that matches wherever the pattern can start (e.g.
+    ``shall`` for ``shall\\s+(?:be\\s+)?filed...``). All leads are compiled into
+    one plain alternation, so a single search over the lowercased text finds
+    every position where some pattern could start. At each of those positions
+    the lead that fired is identified and only the patterns behind it are
+    tried, instead of running a full ``re.findall`` per pattern.
+
+    Results are exactly what ``re.findall(pattern, text, re.IGNORECASE)`` would
+    return for each pattern: matches of one pattern never overlap, and a
+    category lists its patterns' matches in registration order. For that to
+    hold, leads of different groups must never match at the same position;
+    patterns that can start with the same word share one lead string.
+    """
+
+    def __init__(self):
+        self.categories = {}
+        self._patterns = []
+        self._lead_groups = {}
+        self._compiled = False
+
+    def add(self, category, pattern, lead):
+        """Registers a pattern (a regex string) and the lowercase lead it always starts with."""
+        index = len(self._patterns)
+        self._patterns.append(re.compile(pattern, re.IGNORECASE))
+        self.categories.setdefault(category, []).append(index)
+        self._lead_groups.setdefault(lead, []).append(index)
+        self._compiled = False
+        return self
+
+    def _compile(self):
+        self._group_patterns = {}
+        named = []
+        for i, (lead, indexes) in enumerate(self._lead_groups.items()):
+            group = f"l{i}"
+            self._group_patterns[group] = [(index, self._patterns[index]) for index in indexes]
+            named.append(f"(?P<{group}>{lead})")
+        plain = '|'.join(f"(?:{lead})" for lead in self._lead_groups)
+        # Named groups defeat the regex engine's prefix optimizations, so the
+        # plain alternation finds positions and the named one, only tried at
+        # those positions, tells which lead fired
+        self._finder = re.compile(plain)
+        self._identifier = re.compile('|'.join(named))
+        self._finder_nocase = re.compile(plain, re.IGNORECASE)
+        self._identifier_nocase = re.compile('|'.join(named), re.IGNORECASE)
+        self._compiled = True
+
+    def scan(self, text):
+        """
+        Scans the text once and returns the findall results of every pattern.
+
+        Returns:
+            A dictionary mapping each category to the list of findall values
+            (a string, or a tuple for patterns with several groups).
+        """
+        if not self._compiled:
+            self._compile()
+        if any(c in text for c in _CASE_EXCEPTIONS):
+            haystack, finder, identifier = text, self._finder_nocase, self._identifier_nocase
+        else:
+            haystack, finder, identifier = text.lower(), self._finder, self._identifier
+
+        found = [[] for _ in self._patterns]
+        next_start = [0] * len(self._patterns)
+        hit = finder.search(haystack)
+        while hit is not None:
+            pos = hit.start()
+            for index, pattern in self._group_patterns[identifier.match(haystack, pos).lastgroup]:
+                # Like findall, a pattern resumes searching where its last match ended
+                if pos < next_start[index]:
+                    continue
+                match = pattern.match(text, pos)
+                if match is None:
+                    continue
+                groups = match.groups()
+                found[index].append(match.group() if not groups else groups[0] if len(groups) == 1 else groups)
+                next_start[index] = max(match.end(), pos + 1)
+            # Leads may overlap, so look for the next one from the following character
+            hit = finder.search(haystack, pos + 1)
+        return {
+            category: [value for index in indexes for value in found[index]]
+            for category, indexes in self.categories.items()
+        }
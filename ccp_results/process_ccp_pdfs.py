@@ -4,9 +4,70 @@ import json
 import os
 import sys
 import re
+import glob
+import time
+import argparse
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 
-def extract_ccp_content(pdf_path, rule_info):
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from pattern_bank import PatternBank
+from results_io import open_results_writer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from section_id import parse_section_id, section_sort_key
+
+# PDFs in ccp_pdfs/ are only downloaded for sections that passed the scraper's
+# filing-relevance pre-filter, so they all carry the same relevance record.
+PRE_FILTERED_RELEVANCE = {"score": 8, "isRelevant": True, "source": "pre_filtered"}
+
+PDF_NAME_PATTERN = re.compile(r'^ccp_section_(.+?)_\d{4}-\d{2}-\d{2}_\d+\.pdf$')
+
+# Patterns analyze_ccp_content extracts, compiled once and scanned in one pass.
+# The lead is the text every match of the pattern starts with.
+CCP_PATTERNS = (
+    PatternBank()
+    # Procedural requirements
+    .add("procedural", r'shall\s+(?:be\s+)?(?:file[d]?|serve[d]?)\s+([^.]{10,100})', lead=r'shall')
+    .add("procedural", r'must\s+(?:be\s+)?(?:file[d]?|serve[d]?)\s+([^.]{10,100})', lead=r'must')
+    .add("procedural", r'(?:filing|service)\s+(?:shall|must)\s+([^.]{10,100})', lead=r'filing|service')
+    .add("procedural", r'(?:document|paper|pleading)\s+(?:shall|must)\s+([^.]{10,100})', lead=r'document|paper|pleading')
+    # Timing requirements
+    .add("timing", r'within\s+(\d+)\s+(calendar\s+days?|court\s+days?|business\s+days?|days?)', lead=r'within')
+    .add("timing", r'(\d+)\s+(calendar\s+days?|court\s+days?|business\s+days?)\s+(?:before|after|from)', lead=r'\d+\s+(?:calendar|court|business)')
+    .add("timing", r'(?:no\s+later\s+than|not\s+later\s+than)\s+([^.]{5,50})', lead=r'not?\s+later')
+    .add("timing", r'(?:deadline|due\s+date|time\s+limit)\s+(?:is|shall\s+be)\s+([^.]{5,50})', lead=r'deadline|due|time')
+    # Cross-references; both Code patterns share the "Code" lead
+    .add("reference", r'(?:Section|Rule|Code)\s+(\d+\.?\d*(?:\.\d+)?)', lead=r'section|rule|code')
+    .add("reference", r'Code\s+of\s+Civil\s+Procedure\s+[Ss]ection\s+(\d+\.?\d*)', lead=r'section|rule|code')
+    .add("reference", r'California\s+Rules\s+of\s+Court\s+[Rr]ule\s+(\d+\.?\d*)', lead=r'california')
+)
+
+# Extraction profiles: "full" keeps every page's text in content.pages,
+# "analysis" keeps only the joined text and a per-page character count
+PROFILES = ("full", "analysis")
+
+def iter_page_texts(doc):
+    """
+    Reads a document one page at a time.
+
+    Yields:
+        (page number, text, error) tuples; text is None when the page could
+        not be read and error holds the exception.
+    """
+    for page_num in range(len(doc)):
+        try:
+            yield page_num + 1, doc[page_num].get_text(), None
+        except Exception as page_error:
+            print(f"Warning: Error reading page {page_num + 1}: {page_error}")
+            yield page_num + 1, None, page_error
+
+def extract_ccp_content(pdf_path, rule_info, profile="full"):
     """Extract content from a CCP PDF with rule-specific parsing"""
     try:
         # Check if file exists and has content
@@ -30,25 +91,26 @@ def extract_ccp_content(pdf_path, rule_info):
         # Extract metadata
         metadata = doc.metadata
         
-        # Extract text content
-        full_text = ""
+        # Extract text content. Pages are read lazily and joined once; only
+        # the full profile also keeps each page's own text.
+        keep_page_text = profile == "full"
         pages_content = []
         
-        for page_num in range(len(doc)):
-            try:
-                page = doc[page_num]
-                page_text = page.get_text()
-                pages_content.append({
-                    "page": page_num + 1,
-                    "text": page_text.strip()
-                })
-                full_text += page_text + "\n"
-            except Exception as page_error:
-                print(f"Warning: Error reading page {page_num + 1}: {page_error}")
-                pages_content.append({
-                    "page": page_num + 1,
-                    "text": f"[Error reading page: {page_error}]"
-                })
+        def page_texts():
+            for page_number, page_text, page_error in iter_page_texts(doc):
+                if page_error is not None:
+                    pages_content.append({
+                        "page": page_number,
+                        "text": f"[Error reading page: {page_error}]"
+                    } if keep_page_text else {"page": page_number, "error": str(page_error)})
+                    continue
+                if keep_page_text:
+                    pages_content.append({"page": page_number, "text": page_text.strip()})
+                else:
+                    pages_content.append({"page": page_number, "character_count": len(page_text.strip())})
+                yield page_text + "\n"
+        
+        full_text = "".join(page_texts())
         
         # CCP-specific content analysis
         ccp_analysis = analyze_ccp_content(full_text, rule_info)
@@ -56,6 +118,8 @@ def extract_ccp_content(pdf_path, rule_info):
         # Store page count before closing document
         page_count = len(doc)
         doc.close()
+        text = full_text.strip()
+        del full_text
         
         return {
             "rule_info": rule_info,
@@ -74,11 +138,11 @@ def extract_ccp_content(pdf_path, rule_info):
                 "modification_date": metadata.get("modDate", "")
             },
             "content": {
-                "full_text": full_text.strip(),
+                "full_text": text,
                 "page_count": page_count,
                 "pages": pages_content,
-                "character_count": len(full_text.strip()),
-                "word_count": len(full_text.strip().split())
+                "character_count": len(text),
+                "word_count": len(text.split())
             },
             "ccp_analysis": ccp_analysis,
             "extracted_at": datetime.now().isoformat()
@@ -111,50 +175,24 @@ def analyze_ccp_content(text, rule_info):
         "key_provisions": []
     }
     
-    # Extract procedural requirements
-    proc_patterns = [
-        r'shall\s+(?:be\s+)?(?:file[d]?|serve[d]?)\s+([^.]{10,100})',
-        r'must\s+(?:be\s+)?(?:file[d]?|serve[d]?)\s+([^.]{10,100})',
-        r'(?:filing|service)\s+(?:shall|must)\s+([^.]{10,100})',
-        r'(?:document|paper|pleading)\s+(?:shall|must)\s+([^.]{10,100})'
-    ]
+    matches = CCP_PATTERNS.scan(text)
     
-    for pattern in proc_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            if len(match.strip()) > 15:
-                analysis["procedural_requirements"].append(match.strip()[:200])
+    # Extract procedural requirements
+    for match in matches["procedural"]:
+        if len(match.strip()) > 15:
+            analysis["procedural_requirements"].append(match.strip()[:200])
     
     # Extract timing requirements
-    timing_patterns = [
-        r'within\s+(\d+)\s+(calendar\s+days?|court\s+days?|business\s+days?|days?)',
-        r'(\d+)\s+(calendar\s+days?|court\s+days?|business\s+days?)\s+(?:before|after|from)',
-        r'(?:no\s+later\s+than|not\s+later\s+than)\s+([^.]{5,50})',
-        r'(?:deadline|due\s+date|time\s+limit)\s+(?:is|shall\s+be)\s+([^.]{5,50})'
-    ]
-    
-    for pattern in timing_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            if isinstance(match, tuple):
-                timing_text = ' '.join(match)
-            else:
-                timing_text = match
-            if len(timing_text.strip()) > 3:
-                analysis["deadlines_and_timing"].append(timing_text.strip()[:150])
-    
-    # Extract cross-references
-    ref_patterns = [
-        r'(?:Section|Rule|Code)\s+(\d+\.?\d*(?:\.\d+)?)',
-        r'Code\s+of\s+Civil\s+Procedure\s+[Ss]ection\s+(\d+\.?\d*)',
-        r'California\s+Rules\s+of\s+Court\s+[Rr]ule\s+(\d+\.?\d*)',
-    ]
+    for match in matches["timing"]:
+        if isinstance(match, tuple):
+            timing_text = ' '.join(match)
+        else:
+            timing_text = match
+        if len(timing_text.strip()) > 3:
+            analysis["deadlines_and_timing"].append(timing_text.strip()[:150])
     
-    for pattern in ref_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            if match not in analysis["cross_references"]:
-                analysis["cross_references"].append(match)
+    # Extract cross-references, deduplicated in first-seen order
+    analysis["cross_references"] = list(dict.fromkeys(matches["reference"]))
     
     # Extract key provisions (paragraphs with filing-related content)
     paragraphs = text.split('\n\n')
@@ -169,72 +207,222 @@ def analyze_ccp_content(text, rule_info):
     
     return analysis
 
-def main():
-    pdf_paths = ["ccp_pdfs/ccp_section_020_2025-06-20_0.pdf","ccp_pdfs/ccp_section_1002.7_2025-06-20_46.pdf","ccp_pdfs/ccp_section_1008_2025-06-20_47.pdf","ccp_pdfs/ccp_section_109_2025-06-20_3.pdf","ccp_pdfs/ccp_section_109_2025-06-20_4.pdf","ccp_pdfs/ccp_section_116.630_2025-06-20_5.pdf","ccp_pdfs/ccp_section_1250.250_2025-06-20_48.pdf","ccp_pdfs/ccp_section_150_2025-06-20_4.pdf","ccp_pdfs/ccp_section_150_2025-06-20_6.pdf","ccp_pdfs/ccp_section_161_2025-06-20_5.pdf","ccp_pdfs/ccp_section_161_2025-06-20_7.pdf","ccp_pdfs/ccp_section_2025.340_2025-06-20_49.pdf","ccp_pdfs/ccp_section_2031.320_2025-06-20_50.pdf","ccp_pdfs/ccp_section_2033.740_2025-06-20_51.pdf","ccp_pdfs/ccp_section_2034.010_2025-06-20_52.pdf","ccp_pdfs/ccp_section_2034.630_2025-06-20_53.pdf","ccp_pdfs/ccp_section_2035.060_2025-06-20_54.pdf","ccp_pdfs/ccp_section_30_2025-06-20_0.pdf","ccp_pdfs/ccp_section_30_2025-06-20_1.pdf","ccp_pdfs/ccp_section_340_2025-06-20_6.pdf","ccp_pdfs/ccp_section_340_2025-06-20_8.pdf","ccp_pdfs/ccp_section_405.8_2025-06-20_7.pdf","ccp_pdfs/ccp_section_405.8_2025-06-20_9.pdf","ccp_pdfs/ccp_section_410.10_2025-06-20_10.pdf","ccp_pdfs/ccp_section_410.10_2025-06-20_8.pdf","ccp_pdfs/ccp_section_410.42_2025-06-20_11.pdf","ccp_pdfs/ccp_section_410.42_2025-06-20_9.pdf","ccp_pdfs/ccp_section_410.70_2025-06-20_10.pdf","ccp_pdfs/ccp_section_410.70_2025-06-20_12.pdf","ccp_pdfs/ccp_section_411.35_2025-06-20_11.pdf","ccp_pdfs/ccp_section_411.35_2025-06-20_13.pdf","ccp_pdfs/ccp_section_412.30_2025-06-20_13.pdf","ccp_pdfs/ccp_section_412.30_2025-06-20_15.pdf","ccp_pdfs/ccp_section_412_2025-06-20_12.pdf","ccp_pdfs/ccp_section_412_2025-06-20_14.pdf","ccp_pdfs/ccp_section_413.40_2025-06-20_14.pdf","ccp_pdfs/ccp_section_413.40_2025-06-20_16.pdf","ccp_pdfs/ccp_section_414.10_2025-06-20_15.pdf","ccp_pdfs/ccp_section_414.10_2025-06-20_17.pdf","ccp_pdfs/ccp_section_415.95_2025-06-20_16.pdf","ccp_pdfs/ccp_section_415.95_2025-06-20_18.pdf","ccp_pdfs/ccp_section_416.90_2025-06-20_17.pdf","ccp_pdfs/ccp_section_416.90_2025-06-20_19.pdf","ccp_pdfs/ccp_section_417.40_2025-06-20_18.pdf","ccp_pdfs/ccp_section_417.40_2025-06-20_20.pdf","ccp_pdfs/ccp_section_418.11_2025-06-20_19.pdf","ccp_pdfs/ccp_section_418.11_2025-06-20_21.pdf","ccp_pdfs/ccp_section_420_2025-06-20_20.pdf","ccp_pdfs/ccp_section_420_2025-06-20_22.pdf","ccp_pdfs/ccp_section_421_2025-06-20_21.pdf","ccp_pdfs/ccp_section_421_2025-06-20_23.pdf","ccp_pdfs/ccp_section_422.40_2025-06-20_22.pdf","ccp_pdfs/ccp_section_422.40_2025-06-20_24.pdf","ccp_pdfs/ccp_section_425.55_2025-06-20_23.pdf","ccp_pdfs/ccp_section_425.55_2025-06-20_25.pdf","ccp_pdfs/ccp_section_426.70_2025-06-20_24.pdf","ccp_pdfs/ccp_section_426.70_2025-06-20_26.pdf","ccp_pdfs/ccp_section_427.10_2025-06-20_25.pdf","ccp_pdfs/ccp_section_427.10_2025-06-20_27.pdf","ccp_pdfs/ccp_section_428.80_2025-06-20_26.pdf","ccp_pdfs/ccp_section_428.80_2025-06-20_28.pdf","ccp_pdfs/ccp_section_429.30_2025-06-20_27.pdf","ccp_pdfs/ccp_section_429.30_2025-06-20_29.pdf","ccp_pdfs/ccp_section_430.90_2025-06-20_29.pdf","ccp_pdfs/ccp_section_430.90_2025-06-20_31.pdf","ccp_pdfs/ccp_section_430_2025-06-20_28.pdf","ccp_pdfs/ccp_section_430_2025-06-20_30.pdf","ccp_pdfs/ccp_section_431.70_2025-06-20_30.pdf","ccp_pdfs/ccp_section_431.70_2025-06-20_32.pdf","ccp_pdfs/ccp_section_432.10_2025-06-20_32.pdf","ccp_pdfs/ccp_section_432.10_2025-06-20_34.pdf","ccp_pdfs/ccp_section_432_2025-06-20_31.pdf","ccp_pdfs/ccp_section_432_2025-06-20_33.pdf","ccp_pdfs/ccp_section_437_2025-06-20_33.pdf","ccp_pdfs/ccp_section_437_2025-06-20_35.pdf","ccp_pdfs/ccp_section_437_2025-06-20_999.pdf","ccp_pdfs/ccp_section_439_2025-06-20_34.pdf","ccp_pdfs/ccp_section_439_2025-06-20_36.pdf","ccp_pdfs/ccp_section_440_2025-06-20_35.pdf","ccp_pdfs/ccp_section_440_2025-06-20_37.pdf","ccp_pdfs/ccp_section_446_2025-06-20_36.pdf","ccp_pdfs/ccp_section_446_2025-06-20_38.pdf","ccp_pdfs/ccp_section_450_2025-06-20_37.pdf","ccp_pdfs/ccp_section_465_2025-06-20_38.pdf","ccp_pdfs/ccp_section_470_2025-06-20_39.pdf","ccp_pdfs/ccp_section_475_2025-06-20_40.pdf","ccp_pdfs/ccp_section_583.161_2025-06-20_41.pdf","ccp_pdfs/ccp_section_703.150_2025-06-20_42.pdf","ccp_pdfs/ccp_section_706.109_2025-06-20_43.pdf","ccp_pdfs/ccp_section_762.090_2025-06-20_44.pdf","ccp_pdfs/ccp_section_80_2025-06-20_1.pdf","ccp_pdfs/ccp_section_80_2025-06-20_2.pdf","ccp_pdfs/ccp_section_834_2025-06-20_45.pdf","ccp_pdfs/ccp_section_95_2025-06-20_2.pdf","ccp_pdfs/ccp_section_95_2025-06-20_3.pdf"]
-    rule_data = [{"ruleNumber":"020","title":"CCP Section 020","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=020","filename":"ccp_section_020_2025-06-20_0.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"1002.7","title":"CCP Section 1002.7","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=1002.7","filename":"ccp_section_1002.7_2025-06-20_46.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"1008","title":"CCP Section 1008","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=1008","filename":"ccp_section_1008_2025-06-20_47.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"109","title":"CCP Section 109","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=109","filename":"ccp_section_109_2025-06-20_3.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"109","title":"CCP Section 109","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=109","filename":"ccp_section_109_2025-06-20_4.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"116.630","title":"CCP Section 116.630","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=116.630","filename":"ccp_section_116.630_2025-06-20_5.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"1250.250","title":"CCP Section 1250.250","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=1250.250","filename":"ccp_section_1250.250_2025-06-20_48.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"150","title":"CCP Section 150","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=150","filename":"ccp_section_150_2025-06-20_4.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"150","title":"CCP Section 150","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=150","filename":"ccp_section_150_2025-06-20_6.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"161","title":"CCP Section 161","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=161","filename":"ccp_section_161_2025-06-20_5.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"161","title":"CCP Section 161","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=161","filename":"ccp_section_161_2025-06-20_7.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"2025.340","title":"CCP Section 2025.340","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=2025.340","filename":"ccp_section_2025.340_2025-06-20_49.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"2031.320","title":"CCP Section 2031.320","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=2031.320","filename":"ccp_section_2031.320_2025-06-20_50.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"2033.740","title":"CCP Section 2033.740","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=2033.740","filename":"ccp_section_2033.740_2025-06-20_51.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"2034.010","title":"CCP Section 2034.010","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=2034.010","filename":"ccp_section_2034.010_2025-06-20_52.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"2034.630","title":"CCP Section 2034.630","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=2034.630","filename":"ccp_section_2034.630_2025-06-20_53.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"2035.060","title":"CCP Section 2035.060","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=2035.060","filename":"ccp_section_2035.060_2025-06-20_54.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"30","title":"CCP Section 30","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=30","filename":"ccp_section_30_2025-06-20_0.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"30","title":"CCP Section 30","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=30","filename":"ccp_section_30_2025-06-20_1.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"340","title":"CCP Section 340","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=340","filename":"ccp_section_340_2025-06-20_6.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"340","title":"CCP Section 340","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=340","filename":"ccp_section_340_2025-06-20_8.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"405.8","title":"CCP Section 405.8","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=405.8","filename":"ccp_section_405.8_2025-06-20_7.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"405.8","title":"CCP Section 405.8","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=405.8","filename":"ccp_section_405.8_2025-06-20_9.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"410.10","title":"CCP Section 410.10","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=410.10","filename":"ccp_section_410.10_2025-06-20_10.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"410.10","title":"CCP Section 410.10","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=410.10","filename":"ccp_section_410.10_2025-06-20_8.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"410.42","title":"CCP Section 410.42","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=410.42","filename":"ccp_section_410.42_2025-06-20_11.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"410.42","title":"CCP Section 410.42","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=410.42","filename":"ccp_section_410.42_2025-06-20_9.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"410.70","title":"CCP Section 410.70","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=410.70","filename":"ccp_section_410.70_2025-06-20_10.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"410.70","title":"CCP Section 410.70","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=410.70","filename":"ccp_section_410.70_2025-06-20_12.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"411.35","title":"CCP Section 411.35","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=411.35","filename":"ccp_section_411.35_2025-06-20_11.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"411.35","title":"CCP Section 411.35","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=411.35","filename":"ccp_section_411.35_2025-06-20_13.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"412.30","title":"CCP Section 412.30","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=412.30","filename":"ccp_section_412.30_2025-06-20_13.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"412.30","title":"CCP Section 412.30","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=412.30","filename":"ccp_section_412.30_2025-06-20_15.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"412","title":"CCP Section 412","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=412","filename":"ccp_section_412_2025-06-20_12.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"412","title":"CCP Section 412","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=412","filename":"ccp_section_412_2025-06-20_14.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"413.40","title":"CCP Section 413.40","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=413.40","filename":"ccp_section_413.40_2025-06-20_14.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"413.40","title":"CCP Section 413.40","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=413.40","filename":"ccp_section_413.40_2025-06-20_16.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"414.10","title":"CCP Section 414.10","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=414.10","filename":"ccp_section_414.10_2025-06-20_15.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"414.10","title":"CCP Section 414.10","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=414.10","filename":"ccp_section_414.10_2025-06-20_17.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"415.95","title":"CCP Section 415.95","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=415.95","filename":"ccp_section_415.95_2025-06-20_16.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"415.95","title":"CCP Section 415.95","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=415.95","filename":"ccp_section_415.95_2025-06-20_18.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"416.90","title":"CCP Section 416.90","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=416.90","filename":"ccp_section_416.90_2025-06-20_17.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"416.90","title":"CCP Section 416.90","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=416.90","filename":"ccp_section_416.90_2025-06-20_19.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"417.40","title":"CCP Section 417.40","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=417.40","filename":"ccp_section_417.40_2025-06-20_18.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"417.40","title":"CCP Section 417.40","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=417.40","filename":"ccp_section_417.40_2025-06-20_20.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"418.11","title":"CCP Section 418.11","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=418.11","filename":"ccp_section_418.11_2025-06-20_19.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"418.11","title":"CCP Section 418.11","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=418.11","filename":"ccp_section_418.11_2025-06-20_21.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"420","title":"CCP Section 420","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=420","filename":"ccp_section_420_2025-06-20_20.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"420","title":"CCP Section 420","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=420","filename":"ccp_section_420_2025-06-20_22.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"421","title":"CCP Section 421","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=421","filename":"ccp_section_421_2025-06-20_21.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"421","title":"CCP Section 421","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=421","filename":"ccp_section_421_2025-06-20_23.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"422.40","title":"CCP Section 422.40","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=422.40","filename":"ccp_section_422.40_2025-06-20_22.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"422.40","title":"CCP Section 422.40","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=422.40","filename":"ccp_section_422.40_2025-06-20_24.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"425.55","title":"CCP Section 425.55","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=425.55","filename":"ccp_section_425.55_2025-06-20_23.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"425.55","title":"CCP Section 425.55","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=425.55","filename":"ccp_section_425.55_2025-06-20_25.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"426.70","title":"CCP Section 426.70","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=426.70","filename":"ccp_section_426.70_2025-06-20_24.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"426.70","title":"CCP Section 426.70","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=426.70","filename":"ccp_section_426.70_2025-06-20_26.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"427.10","title":"CCP Section 427.10","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=427.10","filename":"ccp_section_427.10_2025-06-20_25.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"427.10","title":"CCP Section 427.10","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=427.10","filename":"ccp_section_427.10_2025-06-20_27.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"428.80","title":"CCP Section 428.80","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=428.80","filename":"ccp_section_428.80_2025-06-20_26.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"428.80","title":"CCP Section 428.80","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=428.80","filename":"ccp_section_428.80_2025-06-20_28.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"429.30","title":"CCP Section 429.30","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=429.30","filename":"ccp_section_429.30_2025-06-20_27.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"429.30","title":"CCP Section 429.30","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=429.30","filename":"ccp_section_429.30_2025-06-20_29.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"430.90","title":"CCP Section 430.90","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=430.90","filename":"ccp_section_430.90_2025-06-20_29.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"430.90","title":"CCP Section 430.90","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=430.90","filename":"ccp_section_430.90_2025-06-20_31.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"430","title":"CCP Section 430","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=430","filename":"ccp_section_430_2025-06-20_28.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"430","title":"CCP Section 430","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=430","filename":"ccp_section_430_2025-06-20_30.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"431.70","title":"CCP Section 431.70","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=431.70","filename":"ccp_section_431.70_2025-06-20_30.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"431.70","title":"CCP Section 431.70","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=431.70","filename":"ccp_section_431.70_2025-06-20_32.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"432.10","title":"CCP Section 432.10","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=432.10","filename":"ccp_section_432.10_2025-06-20_32.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"432.10","title":"CCP Section 432.10","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=432.10","filename":"ccp_section_432.10_2025-06-20_34.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"432","title":"CCP Section 432","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=432","filename":"ccp_section_432_2025-06-20_31.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"432","title":"CCP Section 432","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=432","filename":"ccp_section_432_2025-06-20_33.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"437","title":"CCP Section 437","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=437","filename":"ccp_section_437_2025-06-20_33.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"437","title":"CCP Section 437","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=437","filename":"ccp_section_437_2025-06-20_35.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"437","title":"CCP Section 437","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=437","filename":"ccp_section_437_2025-06-20_999.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"439","title":"CCP Section 439","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=439","filename":"ccp_section_439_2025-06-20_34.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"439","title":"CCP Section 439","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=439","filename":"ccp_section_439_2025-06-20_36.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"440","title":"CCP Section 440","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=440","filename":"ccp_section_440_2025-06-20_35.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"440","title":"CCP Section 440","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=440","filename":"ccp_section_440_2025-06-20_37.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"446","title":"CCP Section 446","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=446","filename":"ccp_section_446_2025-06-20_36.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"446","title":"CCP Section 446","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=446","filename":"ccp_section_446_2025-06-20_38.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"450","title":"CCP Section 450","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=450","filename":"ccp_section_450_2025-06-20_37.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"465","title":"CCP Section 465","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=465","filename":"ccp_section_465_2025-06-20_38.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"470","title":"CCP Section 470","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=470","filename":"ccp_section_470_2025-06-20_39.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"475","title":"CCP Section 475","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=475","filename":"ccp_section_475_2025-06-20_40.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"583.161","title":"CCP Section 583.161","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=583.161","filename":"ccp_section_583.161_2025-06-20_41.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"703.150","title":"CCP Section 703.150","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=703.150","filename":"ccp_section_703.150_2025-06-20_42.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"706.109","title":"CCP Section 706.109","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=706.109","filename":"ccp_section_706.109_2025-06-20_43.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"762.090","title":"CCP Section 762.090","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=762.090","filename":"ccp_section_762.090_2025-06-20_44.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"80","title":"CCP Section 80","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=80","filename":"ccp_section_80_2025-06-20_1.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"80","title":"CCP Section 80","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=80","filename":"ccp_section_80_2025-06-20_2.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"834","title":"CCP Section 834","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=834","filename":"ccp_section_834_2025-06-20_45.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"95","title":"CCP Section 95","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=95","filename":"ccp_section_95_2025-06-20_2.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}},{"ruleNumber":"95","title":"CCP Section 95","url":"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum=95","filename":"ccp_section_95_2025-06-20_3.pdf","source":"existing_pdf","filingRelevance":{"score":8,"isRelevant":True,"source":"pre_filtered"}}]
-    
-    # Create mapping of PDF paths to rule data
-    path_to_rule = {}
-    for i, pdf_path in enumerate(pdf_paths):
-        if i < len(rule_data):
-            path_to_rule[pdf_path] = rule_data[i]
-        else:
-            path_to_rule[pdf_path] = {"ruleNumber": "Unknown", "title": "Unknown"}
-    
-    results = []
-    
-    print(f"Processing {len(pdf_paths)} CCP PDF files...")
-    
-    for i, pdf_path in enumerate(pdf_paths, 1):
-        rule_info = path_to_rule.get(pdf_path, {})
-        section_num = rule_info.get("ruleNumber", "Unknown")
-        
-        print(f"\nProcessing {i}/{len(pdf_paths)}: CCP Section {section_num}")
-        print(f"File: {os.path.basename(pdf_path)}")
-        
-        if not os.path.exists(pdf_path):
-            print(f"❌ File not found: {pdf_path}")
-            results.append({
-                "rule_info": rule_info,
-                "file_info": {
-                    "file_path": pdf_path,
-                    "status": "error",
-                    "error": "File not found"
-                }
-            })
+def load_toc_index(toc_path):
+    """
+    Loads toc_links.json into a dict keyed by SectionId (or the raw text if it
+    does not parse). Like extract_toc_links, the first link of a section wins.
+    """
+    if not os.path.exists(toc_path):
+        print(f"Warning: TOC links not found at {toc_path}; using generic section titles")
+        return {}
+    with open(toc_path, 'r', encoding='utf-8') as f:
+        toc_index = {}
+        for link in json.load(f):
+            toc_index.setdefault(parse_section_id(link["ruleNumber"]) or link["ruleNumber"], link)
+        return toc_index
+
+def build_work_list(pdf_dir, toc_index):
+    """
+    Pairs every section PDF in `pdf_dir` with its rule info.
+
+    The section number is read from the file name
+    (ccp_section_<number>_<date>_<n>.pdf) and joined against the TOC index.
+    Sections missing from the TOC get a generic title and URL. "source" stays
+    "existing_pdf" for every record; how the TOC link was found is kept as
+    "toc_source" (None for sections missing from the TOC). The list is in
+    section order.
+    """
+    work = []
+    for pdf_path in sorted(glob.glob(os.path.join(pdf_dir, "ccp_section_*.pdf"))):
+        filename = os.path.basename(pdf_path)
+        match = PDF_NAME_PATTERN.match(filename)
+        if not match:
+            print(f"Skipping unrecognized file name: {filename}")
             continue
-        
-        result = extract_ccp_content(pdf_path, rule_info)
-        results.append(result)
-        
-        if result["file_info"]["status"] == "success":
-            content = result["content"]
-            analysis = result["ccp_analysis"]
-            print(f"✅ Success: {content['page_count']} pages, {content['word_count']} words")
-            print(f"   📋 Procedural requirements: {len(analysis['procedural_requirements'])}")
-            print(f"   ⏰ Timing requirements: {len(analysis['deadlines_and_timing'])}")
-            print(f"   🔗 Cross-references: {len(analysis['cross_references'])}")
-            print(f"   📄 Key provisions: {len(analysis['key_provisions'])}")
-        else:
-            print(f"❌ Error: {result['file_info'].get('error', 'Unknown error')}")
-    
-    # Save results
-    output_path = "ccp_results/ccp_pymupdf_results.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    
+        section_num = match.group(1)
+        toc_link = toc_index.get(parse_section_id(section_num) or section_num, {})
+        rule_info = {
+            "ruleNumber": section_num,
+            "title": toc_link.get("title", f"CCP Section {section_num}"),
+            "url": toc_link.get("url", f"https://leginfo.legislature.ca.gov/faces/codes_displaySection.xhtml?lawCode=CCP&sectionNum={section_num}"),
+            "filename": filename,
+            "source": "existing_pdf",
+            "toc_source": toc_link.get("source"),
+            "filingRelevance": PRE_FILTERED_RELEVANCE
+        }
+        work.append((pdf_path, rule_info))
+    work.sort(key=lambda item: section_sort_key(item[1]["ruleNumber"]))
+    return work
+
+def worker_peak_rss():
+    """Peak resident set size of the current process in bytes, or None where unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def timed_extract(pdf_path, rule_info, profile="full", track_memory=False):
+    """
+    Runs extract_ccp_content in a worker.
+
+    Returns:
+        (result, seconds taken, memory) where memory holds the document's
+        peak Python heap (only with track_memory) and the worker's peak RSS.
+    """
+    if track_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = extract_ccp_content(pdf_path, rule_info, profile)
+    seconds = time.perf_counter() - start
+    memory = {"heap_peak": tracemalloc.get_traced_memory()[1] - baseline if track_memory else None,
+              "worker_rss": worker_peak_rss()}
+    return result, seconds, memory
+
+def imap_unordered(pool, fn, argument_tuples, window):
+    """
+    Yields fn(*arguments) for every tuple as soon as it completes, like
+    multiprocessing's imap_unordered.
+
+    At most `window` tasks are in flight, so finished results never wait
+    behind a slow document and pending ones are not all queued up front.
+    """
+    argument_tuples = iter(argument_tuples)
+    pending = set()
+    while True:
+        for arguments in argument_tuples:
+            pending.add(pool.submit(fn, *arguments))
+            if len(pending) >= window:
+                break
+        if not pending:
+            return
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+def format_bytes(size):
+    """Human-readable byte count"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extract and analyze CCP section PDFs with PyMuPDF")
+    parser.add_argument("--pdf-dir", default="ccp_pdfs", help="Directory of ccp_section_*.pdf files")
+    parser.add_argument("--toc", default="ccp_results/toc_links.json", help="TOC links produced by extract_toc_links.py")
+    parser.add_argument("--output", default="ccp_results/ccp_pymupdf_results.json", help="Results file; a .jsonl or .jsonl.gz path streams one record per line")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--profile", choices=PROFILES, default="full",
+                        help="full keeps each page's text; analysis keeps only the joined text and page sizes")
+    parser.add_argument("--track-memory", action="store_true",
+                        help="Measure each document's peak Python heap (slower)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Keep the records an interrupted run left behind (the .jsonl output, or the "
+                             ".partial.jsonl sidecar of a .json output) and only process the remaining PDFs")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    toc_index = load_toc_index(args.toc)
+    work = build_work_list(args.pdf_dir, toc_index)
+    if not work:
+        print(f"No CCP section PDFs found in {args.pdf_dir}")
+        return
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"Processing {len(work)} CCP PDF files with {workers} worker(s)...")
+
+    # Records are written as they come back, so only per-document counters stay in memory
+    latencies = []
+    heap_peaks = []
+    peak_rss = None
+    processed = successful = total_procedures = total_timing = total_pages = 0
+    output_path = args.output
+    start_time = time.perf_counter()
+    with open_results_writer(output_path, resume=args.resume) as writer, ProcessPoolExecutor(max_workers=workers) as pool:
+        done = set()
+        for result in writer.recover():
+            done.add(result["file_info"]["file_path"])
+            processed += 1
+            if result["file_info"]["status"] == "success":
+                successful += 1
+                total_procedures += len(result["ccp_analysis"]['procedural_requirements'])
+                total_timing += len(result["ccp_analysis"]['deadlines_and_timing'])
+        if done:
+            print(f"Resuming: {len(done)} document(s) recovered from the interrupted run")
+        remaining = [(pdf_path, rule_info) for pdf_path, rule_info in work if pdf_path not in done]
+
+        # Records are written in completion order, so none is held back behind
+        # a slow document; sort by rule_info.ruleNumber if order matters
+        tasks = ((pdf_path, rule_info, args.profile, args.track_memory) for pdf_path, rule_info in remaining)
+        outcomes = imap_unordered(pool, timed_extract, tasks, window=workers * 4)
+        for i, (result, seconds, memory) in enumerate(outcomes, 1):
+            writer.write(result)
+            processed += 1
+            latencies.append(seconds)
+            if memory["worker_rss"] is not None:
+                peak_rss = max(peak_rss or 0, memory["worker_rss"])
+            memory_note = ""
+            if memory["heap_peak"] is not None:
+                heap_peaks.append(memory["heap_peak"])
+                memory_note = f", peak heap {format_bytes(memory['heap_peak'])}"
+            section_num = result["rule_info"].get("ruleNumber", "Unknown")
+
+            print(f"\nProcessed {i}/{len(remaining)}: CCP Section {section_num} ({seconds * 1000:.0f} ms{memory_note})")
+            print(f"File: {result['file_info']['file_name']}")
+
+            if result["file_info"]["status"] == "success":
+                content = result["content"]
+                analysis = result["ccp_analysis"]
+                successful += 1
+                total_procedures += len(analysis['procedural_requirements'])
+                total_timing += len(analysis['deadlines_and_timing'])
+                total_pages += content['page_count']
+                print(f"✅ Success: {content['page_count']} pages, {content['word_count']} words")
+                print(f"   📋 Procedural requirements: {len(analysis['procedural_requirements'])}")
+                print(f"   ⏰ Timing requirements: {len(analysis['deadlines_and_timing'])}")
+                print(f"   🔗 Cross-references: {len(analysis['cross_references'])}")
+                print(f"   📄 Key provisions: {len(analysis['key_provisions'])}")
+            else:
+                print(f"❌ Error: {result['file_info'].get('error', 'Unknown error')}")
+    elapsed = max(time.perf_counter() - start_time, 1e-9)
+
     print(f"\n💾 CCP analysis results saved to: {output_path}")
-    print(f"✅ Processed {len(results)} CCP section documents")
+    print(f"✅ Processed {processed} CCP section documents")
     
     # Generate summary
-    successful = [r for r in results if r.get('file_info', {}).get('status') == 'success']
-    total_procedures = sum(len(r.get('ccp_analysis', {}).get('procedural_requirements', [])) for r in successful)
-    total_timing = sum(len(r.get('ccp_analysis', {}).get('deadlines_and_timing', [])) for r in successful)
+    latencies.sort()
     
     print(f"\n📊 CCP Analysis Summary:")
-    print(f"   • Successful extractions: {len(successful)}/{len(results)} documents")
+    print(f"   • Successful extractions: {successful}/{processed} documents")
     print(f"   • Total procedural requirements: {total_procedures}")
     print(f"   • Total timing requirements: {total_timing}")
+    print(f"\n⏱️  Performance:")
+    print(f"   • Wall time: {elapsed:.2f}s with {workers} worker(s)")
+    # Recovered documents were not processed by this run, so they are left out of the timings
+    print(f"   • Throughput: {total_pages / elapsed:.1f} pages/sec, {len(latencies) / elapsed:.1f} documents/sec")
+    if latencies:
+        print(f"   • Per-document latency: p50 {percentile(latencies, 50) * 1000:.0f} ms, "
+              f"p90 {percentile(latencies, 90) * 1000:.0f} ms, p99 {percentile(latencies, 99) * 1000:.0f} ms, "
+              f"max {latencies[-1] * 1000:.0f} ms")
+    if heap_peaks:
+        heap_peaks.sort()
+        print(f"   • Per-document peak heap: p50 {format_bytes(percentile(heap_peaks, 50))}, "
+              f"p90 {format_bytes(percentile(heap_peaks, 90))}, max {format_bytes(heap_peaks[-1])}")
+    if peak_rss is not None:
+        print(f"   • Peak worker RSS: {format_bytes(peak_rss)}")
 
 if __name__ == "__main__":
     main()
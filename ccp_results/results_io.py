@@ -0,0 +1,177 @@
+import gzip
+import json
+import os
+
+def _open_text(path, mode):
+    """Opens a text file, transparently gzip-compressed when the path ends in .gz"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+def _tagged_jsonl_path(path, tag):
+    """Inserts `tag` before the .jsonl/.jsonl.gz extension of `path`"""
+    i = path.rfind('.jsonl')
+    return f"{path[:i]}.{tag}{path[i:]}"
+
+def _sidecar_path(path):
+    """The JSONL sidecar a JSON array writer streams to: out.json -> out.partial.jsonl"""
+    gz = path.endswith('.gz')
+    base = path[:-3] if gz else path
+    if base.endswith('.json'):
+        base = base[:-5]
+    return f"{base}.partial.jsonl{'.gz' if gz else ''}"
+
+def _set_aside(path):
+    """
+    Renames a previous run's JSONL output out of the way so it can be
+    replayed into a fresh file. Returns the renamed path, or None if there is
+    nothing to resume from.
+
+    If a renamed copy is already there, an earlier resume crashed while
+    replaying it, so `path` only holds a prefix of it and is dropped.
+    """
+    previous = _tagged_jsonl_path(path, 'previous')
+    if os.path.exists(previous):
+        if os.path.exists(path):
+            os.remove(path)
+        return previous
+    if not os.path.exists(path):
+        return None
+    os.replace(path, previous)
+    return previous
+
+def _replay(writer, previous):
+    """Writes every complete record of `previous` to `writer`, yielding each one"""
+    if previous is None:
+        return
+    for record in iter_results(previous):
+        writer.write(record)
+        yield record
+    os.remove(previous)
+
+class JsonLinesResultsWriter:
+    """
+    Streams one result record per line to a JSONL file (gzip if the path ends in .gz).
+
+    Each record is flushed as soon as it is written, so a crash loses at most
+    the document that was being processed. With resume=True the records an
+    interrupted run left in `path` are kept; recover() copies them into the
+    new file and yields them so the caller can skip that work.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.count = 0
+        self._previous = _set_aside(path) if resume else None
+        self.file = _open_text(path, 'w')
+
+    def recover(self):
+        """Yields the records recovered from the previous run (call before write)"""
+        yield from _replay(self, self._previous)
+
+    def write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False))
+        self.file.write('\n')
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class JsonArrayResultsWriter:
+    """
+    Streams records into a JSON array identical to json.dump(records, indent=2).
+
+    Records are written as they arrive instead of being held in memory until
+    the end. The array goes to a temporary file that replaces `path` only once
+    it is complete, so readers never see a truncated array.
+
+    Every record is also streamed to a JSONL sidecar (out.json ->
+    out.partial.jsonl) that is flushed per record. The sidecar is removed once
+    the array is in place; after a crash it is left behind, readable with
+    iter_results, and resume=True replays it through recover() so the
+    documents already in it need not be processed again.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        # Keep the .gz suffix so _open_text compresses the temporary file too
+        self.tmp_path = f"{path}.tmp{'.gz' if path.endswith('.gz') else ''}"
+        self.count = 0
+        self.sidecar = JsonLinesResultsWriter(_sidecar_path(path), resume=resume)
+        self.file = _open_text(self.tmp_path, 'w')
+        self.file.write('[')
+
+    def recover(self):
+        """Yields the records recovered from the crashed run's sidecar (call before write)"""
+        for record in self.sidecar.recover():
+            self._write_array(record)
+            yield record
+
+    def write(self, record):
+        self.sidecar.write(record)
+        self._write_array(record)
+
+    def _write_array(self, record):
+        body = json.dumps(record, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        self.file.write((',\n  ' if self.count else '\n  ') + body)
+        self.count += 1
+
+    def close(self, complete=True):
+        if self.file.closed:
+            return
+        self.file.write('\n]' if self.count else ']')
+        self.file.close()
+        self.sidecar.close()
+        if complete:
+            os.replace(self.tmp_path, self.path)
+            os.remove(self.sidecar.path)
+        else:
+            # The sidecar holds everything written so far
+            os.remove(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.close(complete=exc_type is None)
+
+def open_results_writer(path, resume=False):
+    """Returns a JSONL writer for .jsonl/.jsonl.gz paths and a JSON array writer otherwise"""
+    if path.endswith(('.jsonl', '.jsonl.gz')):
+        return JsonLinesResultsWriter(path, resume=resume)
+    return JsonArrayResultsWriter(path, resume=resume)
+
+def iter_results(path):
+    """
+    Lazily yields result records from a results file.
+
+    JSONL files (optionally .gz) are read one line at a time, and a truncated
+    final line (or gzip stream) left by an interrupted run is skipped. Legacy
+    .json array files are still supported but have to be loaded whole.
+    """
+    if path.endswith(('.jsonl', '.jsonl.gz')):
+        with _open_text(path, 'r') as f:
+            try:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # Only the last line of a crashed run can be partial
+                        break
+            except EOFError:
+                # A crashed .gz run has no end-of-stream marker
+                return
+    else:
+        with _open_text(path, 'r') as f:
+            yield from json.load(f)
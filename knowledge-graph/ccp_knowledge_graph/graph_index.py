@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+In-memory indexes over a knowledge graph file, used by serve_graph.py's query API.
+
+Reads the formats the JS generators write:
+    d3         {"nodes": [{"id": ...}], "links": [{"source": ..., "target": ...}]}
+    cytoscape  {"nodes": [{"data": {...}}], "edges": [{"data": {...}}]}
+               or {"elements": [{"data": {...}}, ...]}
+    graph_data.js, i.e. "const graphData = {...};" around a cytoscape object
+"""
+import os
+import json
+import hashlib
+from collections import defaultdict, deque
+
+def _unwrap(item):
+    """Cytoscape wraps every element in {"data": {...}}."""
+    return item["data"] if isinstance(item, dict) and isinstance(item.get("data"), dict) else item
+
+def parse_graph(text):
+    """
+    Parses graph JSON (or a graph_data.js script) into plain node and edge lists.
+
+    Returns:
+        (nodes, edges): node dictionaries with an "id", and edge dictionaries
+        with "source" and "target" node ids.
+    """
+    text = text.strip()
+    if not text.startswith("{"):
+        # graph_data.js: strip the variable declaration and the trailing semicolon
+        text = text[text.index("{"):text.rindex("}") + 1]
+    data = json.loads(text)
+
+    if "elements" in data:
+        elements = [_unwrap(element) for element in data["elements"]]
+        nodes = [element for element in elements if "source" not in element or "target" not in element]
+        edges = [element for element in elements if "source" in element and "target" in element]
+    else:
+        nodes = [_unwrap(node) for node in data.get("nodes", [])]
+        edges = [_unwrap(edge) for edge in data.get("links", data.get("edges", []))]
+    # d3 replaces source/target with node objects once it has laid out a graph
+    for edge in edges:
+        for end in ("source", "target"):
+            if isinstance(edge[end], dict):
+                edge[end] = edge[end]["id"]
+    return [node for node in nodes if "id" in node], edges
+
+def node_source(node):
+    """The data source of a node (ccp, crc, county...), wherever the generator put it."""
+    return node.get("source") or node.get("properties", {}).get("source") or "unknown"
+
+def edge_type(edge):
+    return edge.get("type") or edge.get("label") or "related"
+
+class GraphIndex:
+    """
+    Adjacency and lookup indexes over one graph, built once.
+
+    Nodes are indexed by id, category and source, and edges by type; every
+    node has an undirected adjacency list of (neighbor id, edge position), so
+    a neighborhood query only visits the edges of the nodes it reaches.
+
+    Args:
+        nodes: Node dictionaries, each with an "id".
+        edges: Edge dictionaries with "source" and "target" ids; edges to
+            unknown nodes are dropped.
+        name: Name the graph is served under.
+        version: Identifies the data the index was built from (a content
+            hash for files); changes whenever the graph does.
+    """
+
+    def __init__(self, nodes, edges, name="graph", version=""):
+        self.name = name
+        self.version = version
+        self.nodes = nodes
+        self.by_id = {node["id"]: node for node in nodes}
+        self.edges = [edge for edge in edges if edge["source"] in self.by_id and edge["target"] in self.by_id]
+
+        self.by_category = defaultdict(list)
+        self.by_source = defaultdict(list)
+        for node in nodes:
+            self.by_category[node.get("category", "Uncategorized")].append(node)
+            self.by_source[node_source(node)].append(node)
+
+        self.by_edge_type = defaultdict(list)
+        self.adjacency = defaultdict(list)
+        for position, edge in enumerate(self.edges):
+            self.by_edge_type[edge_type(edge)].append(position)
+            self.adjacency[edge["source"]].append((edge["target"], position))
+            self.adjacency[edge["target"]].append((edge["source"], position))
+
+    @classmethod
+    def from_file(cls, path, name=None):
+        """Loads and indexes a graph file."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        nodes, edges = parse_graph(raw.decode("utf-8"))
+        return cls(nodes, edges, name or os.path.splitext(os.path.basename(path))[0], hashlib.sha256(raw).hexdigest()[:16])
+
+    def summary(self):
+        """Counts per category, source and edge type."""
+        return {
+            "graph": self.name,
+            "version": self.version,
+            "node_count": len(self.nodes),
+            "edge_count": len(self.edges),
+            "categories": {category: len(nodes) for category, nodes in sorted(self.by_category.items())},
+            "sources": {source: len(nodes) for source, nodes in sorted(self.by_source.items())},
+            "edge_types": {kind: len(positions) for kind, positions in sorted(self.by_edge_type.items())},
+        }
+
+    def neighborhood(self, node_id, hops=1, edge_types=None, max_nodes=500):
+        """
+        Returns the nodes within `hops` edges of a node and the edges between them.
+
+        Args:
+            node_id: The center node.
+            hops: Breadth-first search depth.
+            edge_types: Only follow edges of these types (all types if empty).
+            max_nodes: Stop expanding once this many nodes have been reached.
+
+        Raises:
+            KeyError: If the node does not exist.
+        """
+        if node_id not in self.by_id:
+            raise KeyError(node_id)
+        allowed = set(edge_types) if edge_types else None
+        depth = {node_id: 0}
+        queue = deque([node_id])
+        truncated = False
+        while queue:
+            current = queue.popleft()
+            if depth[current] >= hops:
+                continue
+            for neighbor, position in self.adjacency[current]:
+                if neighbor in depth or (allowed is not None and edge_type(self.edges[position]) not in allowed):
+                    continue
+                if len(depth) >= max_nodes:
+                    truncated = True
+                    break
+                depth[neighbor] = depth[current] + 1
+                queue.append(neighbor)
+        # Every followable edge between two reached nodes, including those on the outer ring
+        edge_positions = sorted({
+            position
+            for node in depth for neighbor, position in self.adjacency[node]
+            if neighbor in depth and (allowed is None or edge_type(self.edges[position]) in allowed)
+        })
+        return {
+            "center": node_id,
+            "hops": hops,
+            "truncated": truncated,
+            "nodes": [dict(self.by_id[node], distance=distance) for node, distance in depth.items()],
+            "edges": [self.edges[position] for position in edge_positions],
+        }
+
+    def category_slice(self, category, include_edges=True):
+        """Returns the nodes of one category and, optionally, the edges among them."""
+        nodes = self.by_category.get(category, [])
+        result = {"category": category, "node_count": len(nodes), "nodes": nodes}
+        if include_edges:
+            ids = {node["id"] for node in nodes}
+            positions = sorted({position for node_id in ids for neighbor, position in self.adjacency[node_id] if neighbor in ids})
+            result["edges"] = [self.edges[position] for position in positions]
+        return result
+
+    def node_page(self, offset=0, limit=100, category=None, source=None):
+        """Returns one page of nodes, optionally filtered by category and source."""
+        if category is not None:
+            nodes = self.by_category.get(category, [])
+            if source is not None:
+                nodes = [node for node in nodes if node_source(node) == source]
+        elif source is not None:
+            nodes = self.by_source.get(source, [])
+        else:
+            nodes = self.nodes
+        return {
+            "total": len(nodes),
+            "offset": offset,
+            "limit": limit,
+            "nodes": nodes[offset:offset + limit],
+        }
@@ -1,26 +1,538 @@
 #!/usr/bin/env python3
 """
-Simple HTTP server for CCP Knowledge Graph visualization
+HTTP server for CCP Knowledge Graph visualization
 Run this script to serve the knowledge graph locally and avoid CORS issues.
+
+Requests are handled on one thread each, so a slow client does not hold up
+anyone else. Files are read once and kept in memory together with gzip (and,
+when the brotli package is installed, brotli) variants, up to a memory budget
+(--cache-mb) beyond which the least recently served files are dropped. They
+are served with strong ETags so reloads are answered with 304 Not Modified.
+
+Graph files given with --graph (by default graph_data.js,
+ccp_knowledge_graph_d3.json and ccp_knowledge_graph_cytoscape.json in the
+directory, and the unified generator's unified_legal_graph_output/*.json)
+are also loaded into
+in-memory indexes and queried through a small JSON API, so a page can
+fetch just the part of the graph it draws:
+
+    GET /api/graphs                                   loaded graphs and their sizes
+    GET /api/summary?graph=NAME                       counts per category, source and edge type
+    GET /api/nodes?graph=NAME&category=C&source=S&offset=0&limit=100
+    GET /api/neighborhood?graph=NAME&id=437c&hops=2&edge_type=T
+    GET /api/category?graph=NAME&name=C&edges=1
+
+`graph` defaults to the first loaded graph.
+
+The graph files and every cached file are polled for changes in the
+background (--watch-interval). Changed files are re-read, reparsed and
+recompressed off the request path and swapped in atomically, so requests keep
+getting the previous version, never a half-built one, until the new one is
+ready, and then see a new ETag. A graph file that does not parse, at startup
+or later, is logged and skipped until it changes again.
+
+Usage:
+    python serve_graph.py
+    python serve_graph.py --port 9000 --directory ./export --no-browser
+    python serve_graph.py --graph ../../unified_legal_graph_output/unified_legal_knowledge_graph_d3.json
 """
-import http.server
-import socketserver
-import webbrowser
 import os
+import glob
+import gzip
+import json
+import hashlib
+import argparse
+import time
+import threading
+import webbrowser
+from collections import OrderedDict
+import http.server
+import email.utils
+from http import HTTPStatus
+from urllib.parse import urlsplit, parse_qs
+
+from graph_index import GraphIndex
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 PORT = 8000
-directory = os.path.dirname(os.path.abspath(__file__))
-
-os.chdir(directory)
-
-Handler = http.server.SimpleHTTPRequestHandler
-with socketserver.TCPServer(("", PORT), Handler) as httpd:
-    print(f"🌐 Serving CCP Knowledge Graph at http://localhost:{PORT}")
-    print(f"📁 Directory: {directory}")
-    print(f"🔗 Open: http://localhost:{PORT}/ccp_knowledge_graph_server.html")
-    print("Press Ctrl+C to stop")
-    
-    # Automatically open browser
-    webbrowser.open(f"http://localhost:{PORT}/ccp_knowledge_graph_server.html")
-    
-    httpd.serve_forever()
+DEFAULT_PAGE = "ccp_knowledge_graph_server.html"
+
+# Content types worth compressing, and files too small to bother
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+MIN_COMPRESS_SIZE = 1024
+# Larger files are streamed from disk by the stock handler instead of cached
+MAX_CACHED_SIZE = 32 * 1024 * 1024
+# Total size of all cached variants; least recently served files are evicted beyond it
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Graph exports in the served directory that are indexed when --graph is not given
+DEFAULT_GRAPH_FILES = ("graph_data.js", "ccp_knowledge_graph_d3.json", "ccp_knowledge_graph_cytoscape.json")
+# The unified generator's output at the repository root
+UNIFIED_GRAPH_GLOB = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..",
+                                                   "unified_legal_graph_output", "*.json"))
+MAX_PAGE_SIZE = 1000
+MAX_HOPS = 5
+WATCH_INTERVAL = 2.0
+
+class CachedAsset:
+    """
+    One file's bytes, its precompressed variants and its validators.
+
+    Each variant has its own strong ETag (the content hash plus the coding),
+    as the bytes on the wire differ between codings.
+    """
+
+    def __init__(self, stat, body, content_type):
+        self.key = (stat.st_mtime_ns, stat.st_size)
+        self.content_type = content_type
+        self.mtime = int(stat.st_mtime)
+        self.last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.variants = {"identity": (body, f'"{digest}"')}
+        if len(body) >= MIN_COMPRESS_SIZE and content_type.startswith(COMPRESSIBLE_TYPES):
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.variants["gzip"] = (compressed, f'"{digest}-gzip"')
+            if brotli is not None:
+                compressed = brotli.compress(body, quality=11)
+                if len(compressed) < len(body):
+                    self.variants["br"] = (compressed, f'"{digest}-br"')
+        self.size = sum(len(variant) for variant, _ in self.variants.values())
+
+class AssetCache:
+    """
+    Thread-safe in-memory cache of CachedAssets keyed by file path.
+
+    The variants of all cached files together are kept under `max_bytes`:
+    adding a file evicts the least recently served ones, which are simply
+    read and compressed again if they are requested later.
+
+    Without a watcher, an entry is rebuilt on the request that finds the
+    file's mtime or size changed. With one (`watched`), requests always get the
+    cached entry and ArtifactWatcher calls refresh() to rebuild changed files
+    in the background. Building happens outside the lock; two threads racing
+    on the same changed file both compress it and the last one wins, which is
+    harmless.
+    """
+
+    def __init__(self, max_file_size=MAX_CACHED_SIZE, max_bytes=MAX_CACHE_BYTES):
+        self.max_file_size = max_file_size
+        self.max_bytes = max_bytes
+        self.watched = False
+        self._assets = OrderedDict()  # path -> CachedAsset, least recently served first
+        self.total_bytes = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+
+    def get(self, path, content_type):
+        """Returns the CachedAsset for a file, or None if it is too large to cache."""
+        with self._lock:
+            asset = self._assets.get(path)
+            if asset is not None:
+                self._assets.move_to_end(path)
+        if asset is not None and self.watched:
+            return asset
+        stat = os.stat(path)
+        if stat.st_size > self.max_file_size:
+            return None
+        if asset is not None and asset.key == (stat.st_mtime_ns, stat.st_size):
+            return asset
+        return self._build(path, stat, content_type)
+
+    def _build(self, path, stat, content_type):
+        with open(path, "rb") as f:
+            body = f.read()
+        asset = CachedAsset(stat, body, content_type)
+        with self._lock:
+            self._discard_locked(path)
+            self._assets[path] = asset
+            self.total_bytes += asset.size
+            # The new entry is last, so it is only evicted if it alone is over budget
+            while self.total_bytes > self.max_bytes and self._assets:
+                _, old = self._assets.popitem(last=False)
+                self.total_bytes -= old.size
+                self.evicted += 1
+        return asset
+
+    def _discard_locked(self, path):
+        old = self._assets.pop(path, None)
+        if old is not None:
+            self.total_bytes -= old.size
+
+    def refresh(self):
+        """Rebuilds the entries whose file changed and drops those that are gone; returns the changed paths."""
+        with self._lock:
+            entries = list(self._assets.items())
+        changed = []
+        for path, asset in entries:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            if stat is not None and asset.key == (stat.st_mtime_ns, stat.st_size):
+                continue
+            changed.append(path)
+            if stat is None or stat.st_size > self.max_file_size:
+                with self._lock:
+                    self._discard_locked(path)
+                continue
+            try:
+                self._build(path, stat, asset.content_type)
+            except OSError:
+                with self._lock:
+                    self._discard_locked(path)
+        return changed
+
+def compress(body, coding):
+    """Compresses a response body for a Content-Encoding."""
+    if coding == "br":
+        return brotli.compress(body, quality=5)
+    if coding == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return body
+
+def choose_encoding(accept_encoding, variants):
+    """Picks the best available coding from an Accept-Encoding header, preferring br over gzip."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.lower()] = quality
+    for coding in ("br", "gzip"):
+        if coding in variants and accepted.get(coding, accepted.get("*", 0.0)) > 0:
+            return coding
+    return "identity"
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against an ETag, as RFC 9110 requires for GET."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+class ApiError(Exception):
+    """A query API request that cannot be answered; carries the HTTP status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def query_int(params, name, default, minimum, maximum):
+    """Reads an integer query parameter, clamped to [minimum, maximum]."""
+    value = params.get(name, [None])[0]
+    if value is None:
+        return default
+    try:
+        return max(minimum, min(maximum, int(value)))
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"'{name}' must be an integer")
+
+def answer_query(graphs, route, params):
+    """
+    Runs one query API request against the loaded graphs.
+
+    Args:
+        graphs: Dictionary of GraphIndex by name, in load order.
+        route: The path after /api/, e.g. "neighborhood".
+        params: Parsed query string (parse_qs).
+
+    Returns:
+        The JSON-serializable response.
+    """
+    if route == "graphs":
+        return {"graphs": [{"name": name, "version": index.version,
+                            "node_count": len(index.nodes), "edge_count": len(index.edges)}
+                           for name, index in graphs.items()]}
+
+    name = params.get("graph", [None])[0]
+    if name is None:
+        if not graphs:
+            raise ApiError(HTTPStatus.NOT_FOUND, "No graphs are loaded")
+        index = next(iter(graphs.values()))
+    elif name in graphs:
+        index = graphs[name]
+    else:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown graph '{name}'")
+
+    if route == "summary":
+        return index.summary()
+    if route == "nodes":
+        return index.node_page(offset=query_int(params, "offset", 0, 0, len(index.nodes)),
+                               limit=query_int(params, "limit", 100, 1, MAX_PAGE_SIZE),
+                               category=params.get("category", [None])[0],
+                               source=params.get("source", [None])[0])
+    if route == "neighborhood":
+        node_id = params.get("id", [None])[0]
+        if node_id is None:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "'id' is required")
+        try:
+            return index.neighborhood(node_id, hops=query_int(params, "hops", 1, 0, MAX_HOPS),
+                                      edge_types=params.get("edge_type"),
+                                      max_nodes=query_int(params, "max_nodes", 500, 1, 10 * MAX_PAGE_SIZE))
+        except KeyError:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown node '{node_id}'")
+    if route == "category":
+        category = params.get("name", [None])[0]
+        if category is None:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "'name' is required")
+        return index.category_slice(category, include_edges=params.get("edges", ["1"])[0] != "0")
+    raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown API endpoint '{route}'")
+
+class GraphStore:
+    """
+    The indexed graph files, keyed by file name without extension.
+
+    `graphs` is never modified in place: a reload builds the new index first
+    and then replaces the whole dictionary, so a request that read `graphs`
+    once keeps a consistent set of indexes for its whole lifetime.
+
+    A file that cannot be read at startup is logged and skipped like a failed
+    reload, and is loaded once it changes.
+    """
+
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self.graphs = {}
+        self._keys = {}
+        self._failed = {}
+        for path in self.paths:
+            try:
+                self.reload(path)
+            except Exception as e:
+                print(f"⚠️  Could not load {path}: {e}; skipping it until it changes")
+
+    def reload(self, path):
+        """(Re)builds one graph's index and swaps it in; on error the loaded index is kept."""
+        stat = os.stat(path)
+        try:
+            index = GraphIndex.from_file(path)
+        except Exception:
+            # Not retried until the file changes again
+            self._failed[path] = (stat.st_mtime_ns, stat.st_size)
+            raise
+        graphs = dict(self.graphs)
+        graphs[index.name] = index
+        self.graphs = graphs
+        # Recorded from before the read, so a write racing the read is seen on the next poll
+        self._keys[path] = (stat.st_mtime_ns, stat.st_size)
+        print(f"📊 Loaded graph '{index.name}' ({index.version}): {len(index.nodes)} nodes, {len(index.edges)} edges")
+        return index
+
+    def changed_paths(self):
+        """Graph files whose mtime or size differs from the version that is loaded."""
+        changed = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            key = (stat.st_mtime_ns, stat.st_size)
+            if key != self._keys.get(path) and key != self._failed.get(path):
+                changed.append(path)
+        return changed
+
+class ArtifactWatcher(threading.Thread):
+    """
+    Polls the graph files and the cached files for changes and reloads them.
+
+    All parsing and compression happens on this thread. A graph file that
+    fails to parse (e.g. because a generator is halfway through rewriting it)
+    keeps its previous index and is retried once the file changes again.
+    """
+
+    def __init__(self, store, cache, interval=WATCH_INTERVAL):
+        super().__init__(name="artifact-watcher", daemon=True)
+        self.store = store
+        self.cache = cache
+        self.interval = interval
+        self._stopped = threading.Event()
+        cache.watched = True
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.poll()
+
+    def poll(self):
+        for path in self.store.changed_paths():
+            started = time.perf_counter()
+            try:
+                index = self.store.reload(path)
+            except Exception as e:
+                print(f"⚠️  Could not reload {path}: {e}; keeping the previous version")
+                continue
+            print(f"🔄 Reloaded graph '{index.name}' in {(time.perf_counter() - started) * 1000:.0f} ms")
+        for path in self.cache.refresh():
+            print(f"🔄 Refreshed {os.path.basename(path)}")
+
+    def stop(self):
+        self._stopped.set()
+
+def make_handler(directory, cache, max_age=0, store=None):
+    """Builds a request handler class serving `directory` through `cache` and the query API over `store`."""
+    cache_control = f"public, max-age={max_age}" if max_age > 0 else "no-cache"
+
+    class GraphRequestHandler(http.server.SimpleHTTPRequestHandler):
+        # Keep-alive lets a page fetch its scripts and data over one connection
+        protocol_version = "HTTP/1.1"
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=directory, **kwargs)
+
+        def do_GET(self):
+            if self.path.startswith("/api/"):
+                self.send_api(head_only=False)
+            else:
+                self.send_cached(head_only=False)
+
+        def do_HEAD(self):
+            if self.path.startswith("/api/"):
+                self.send_api(head_only=True)
+            else:
+                self.send_cached(head_only=True)
+
+        def send_api(self, head_only):
+            url = urlsplit(self.path)
+            try:
+                graphs = store.graphs if store is not None else {}
+                payload = answer_query(graphs, url.path[len("/api/"):].strip("/"), parse_qs(url.query))
+                status = HTTPStatus.OK
+            except ApiError as e:
+                payload, status = {"error": str(e)}, e.status
+            body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            if status == HTTPStatus.OK and etag_matches(self.headers.get("If-None-Match", ""), etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return
+
+            coding = "identity"
+            if len(body) >= MIN_COMPRESS_SIZE:
+                available = ("br", "gzip") if brotli is not None else ("gzip",)
+                coding = choose_encoding(self.headers.get("Accept-Encoding", ""), available)
+                body = compress(body, coding)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            if coding != "identity":
+                self.send_header("Content-Encoding", coding)
+            # The ETag names the uncompressed JSON, so it is weak across codings
+            self.send_header("ETag", etag if coding == "identity" else f"W/{etag}")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            if not head_only:
+                self.wfile.write(body)
+
+        def send_cached(self, head_only):
+            path = self.translate_path(self.path)
+            asset = cache.get(path, self.guess_type(path)) if os.path.isfile(path) else None
+            if asset is None:
+                # Directories, missing files and very large files keep the stock behaviour
+                return super().do_HEAD() if head_only else super().do_GET()
+
+            coding = choose_encoding(self.headers.get("Accept-Encoding", ""), asset.variants)
+            body, etag = asset.variants[coding]
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match is not None:
+                not_modified = etag_matches(if_none_match, etag)
+            else:
+                not_modified = self.not_modified_since(asset)
+            if not_modified:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_validators(asset, etag)
+                self.end_headers()
+                return
+
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", asset.content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if coding != "identity":
+                self.send_header("Content-Encoding", coding)
+            self.send_validators(asset, etag)
+            self.end_headers()
+            if not head_only:
+                self.wfile.write(body)
+
+        def send_validators(self, asset, etag):
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", asset.last_modified)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+
+        def not_modified_since(self, asset):
+            if_modified_since = self.headers.get("If-Modified-Since")
+            if not if_modified_since:
+                return False
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return since is not None and asset.mtime <= since.timestamp()
+
+    return GraphRequestHandler
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the CCP Knowledge Graph visualizations")
+    parser.add_argument("--port", type=int, default=PORT, help=f"Port to listen on (default: {PORT})")
+    parser.add_argument("--bind", default="", help="Address to bind (default: all interfaces)")
+    parser.add_argument("--directory", default=os.path.dirname(os.path.abspath(__file__)),
+                        help="Directory to serve (default: this script's directory)")
+    parser.add_argument("--cache-mb", type=int, default=MAX_CACHE_BYTES // (1024 * 1024),
+                        help=f"Memory budget for cached files and their compressed variants (default: {MAX_CACHE_BYTES // (1024 * 1024)})")
+    parser.add_argument("--max-age", type=int, default=0,
+                        help="Cache-Control max-age in seconds; 0 makes browsers revalidate every time (default)")
+    parser.add_argument("--no-browser", action="store_true", help="Do not open a browser (headless use)")
+    parser.add_argument("--watch-interval", type=float, default=WATCH_INTERVAL,
+                        help=f"Seconds between checks for changed files (default: {WATCH_INTERVAL}; 0 disables reloading)")
+    parser.add_argument("--graph", action="append", default=None,
+                        help=f"Graph file to index for the query API; repeatable (default: {', '.join(DEFAULT_GRAPH_FILES)} "
+                             "in the directory and unified_legal_graph_output/*.json)")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    directory = os.path.abspath(args.directory)
+    graph_paths = args.graph
+    if graph_paths is None:
+        graph_paths = [os.path.join(directory, name) for name in DEFAULT_GRAPH_FILES]
+        graph_paths = [path for path in graph_paths if os.path.isfile(path)]
+        graph_paths += sorted(glob.glob(UNIFIED_GRAPH_GLOB))
+    cache = AssetCache(max_bytes=args.cache_mb * 1024 * 1024)
+    store = GraphStore(graph_paths)
+    handler = make_handler(directory, cache, args.max_age, store)
+    if args.watch_interval > 0:
+        ArtifactWatcher(store, cache, args.watch_interval).start()
+
+    with http.server.ThreadingHTTPServer((args.bind, args.port), handler) as httpd:
+        url = f"http://localhost:{httpd.server_port}/{DEFAULT_PAGE}"
+        print(f"🌐 Serving CCP Knowledge Graph at http://localhost:{httpd.server_port}")
+        print(f"📁 Directory: {directory}")
+        print(f"🔗 Open: {url}")
+        print(f"🗜️  Compression: gzip{', brotli' if brotli is not None else ''}")
+        print("Press Ctrl+C to stop")
+
+        # Automatically open browser
+        if not args.no_browser:
+            webbrowser.open(url)
+
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
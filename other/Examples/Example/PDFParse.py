@@ -1,8 +1,13 @@
 import fitz  # PyMuPDF
+import os
 import re
+import sys
 import json
 from datetime import datetime
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+from section_id import section_sort_key
+
 def parse_pdf_rules(pdf_path):
     """
     Parses a PDF of court rules to extract rules, sub-rules, and update dates,
@@ -86,11 +91,7 @@ def parse_pdf_rules(pdf_path):
             final_rules.append(rule)
             
     # Sort the final list by rule number to maintain document order
-    def sort_key(r):
-        parts = r['rule_number'].split('.')
-        return [int(p) for p in parts if p]
-
-    final_rules.sort(key=sort_key)
+    final_rules.sort(key=lambda r: section_sort_key(r['rule_number']))
 
     return json.dumps(final_rules, indent=2)
 
@@ -98,7 +99,6 @@ def parse_pdf_rules(pdf_path):
 if __name__ == '__main__':
     pdf_file_path = '/Users/honamyoo/Documents/Litigation/roc-title-2.pdf'
     
-    import os
     if os.path.exists(pdf_file_path):
         structured_data_json = parse_pdf_rules(pdf_file_path)
         print(structured_data_json)
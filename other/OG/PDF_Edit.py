@@ -6,9 +6,22 @@
 # Open your terminal or command prompt and run:
 # pip install pypdf
 
-from pypdf import PdfReader, PdfWriter
+from pypdf import PdfReader
+from pypdf.generic import (ArrayObject, BooleanObject, DecodedStreamObject, DictionaryObject, IndirectObject,
+                           NameObject, NumberObject, TextStringObject)
+from functools import lru_cache
+from typing import NamedTuple
+import io
+import os
+import re
 import json
 
+STARTXREF_PATTERN = re.compile(rb"startxref\s+(\d+)")
+# A cross-reference section that is a stream object ("12 0 obj") rather than an "xref" table
+XREF_STREAM_PATTERN = re.compile(rb"\s*\d+\s+\d+\s+obj\b")
+# /Ff bit 16: a button field that is a radio group rather than a checkbox
+RADIO_FLAG = 1 << 15
+
 # --- STEP 1: INSPECT THE PDF TO FIND FIELD NAMES ---
 # Before you can fill a form, you MUST know the internal names of the fields.
 # This function helps you discover those names. You only need to run this once
@@ -21,26 +34,81 @@ def inspect_pdf_form_fields(pdf_path):
     """
     print(f"--- Inspecting fields for: {pdf_path} ---")
     try:
-        reader = PdfReader(pdf_path)
-        fields = reader.get_fields()
-        if not fields:
+        # The field tree is walked once per template and cached
+        form = load_form(pdf_path)
+        if not form.fields:
             print("This PDF does not contain any fillable form fields.")
             return
         
         print("Found the following form fields:")
         # Pretty print the dictionary for readability
         import pprint
-        pprint.pprint(fields)
+        pprint.pprint({name: field.kind for name, field in form.fields.items()})
         print("--- End of Inspection ---")
 
     except FileNotFoundError:
         print(f"Error: The file '{pdf_path}' was not found.")
+    except ValueError as e:
+        print(f"Error: {e}")
     except Exception as e:
         print(f"An unexpected error occurred during inspection: {e}")
 
 # --- STEP 2: PRE-POPULATE THE FORM ---
 # This function takes the data and fills out the PDF.
 
+# Mapping files connect your human-readable data keys to the actual,
+# often complex, field names discovered in Step 1. They live in
+# form_mappings/, one JSON file per form, and name the form revision they
+# were written against (see form_registry.py for the revision check).
+MAPPING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "form_mappings")
+CM010_MAPPING_PATH = os.path.join(MAPPING_DIR, "cm010.json")
+
+class FieldMapping(NamedTuple):
+    """A declarative mapping of data keys to the fields of one form revision."""
+    form: str
+    revision: str
+    text: tuple
+    checkboxes: tuple
+
+    def values(self, record):
+        """Converts a data record into PDF field values; missing or null keys leave fields blank or unchecked."""
+        values = {field: "" if record.get(key) is None else str(record[key]) for key, field in self.text}
+        # Set checkbox values. If the key exists and is True, set to '/Yes'.
+        values.update({field: '/Yes' if record.get(key) else '/Off' for key, field in self.checkboxes})
+        return values
+
+def load_field_mapping(mapping_path):
+    """
+    Reads a mapping file, once per process until the file changes:
+    {"form": "CM-010", "revision": "January 1, 2024",
+     "fields": {data key: field name}, "checkboxes": {data key: field name}}
+    """
+    stat = os.stat(mapping_path)
+    return _load_field_mapping(mapping_path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=None)
+def _load_field_mapping(mapping_path, mtime_ns, size):
+    with open(mapping_path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    return FieldMapping(
+        spec["form"],
+        spec["revision"],
+        tuple(spec.get("fields", {}).items()),
+        tuple(spec.get("checkboxes", {}).items()),
+    )
+
+def cm010_field_values(data_to_fill):
+    """
+    Converts case data into CM-010 PDF field values.
+
+    Args:
+        data_to_fill (dict): The case data (attorney_details, county, judge...).
+
+    Returns:
+        A dictionary mapping PDF field names to values.
+    """
+    return load_field_mapping(CM010_MAPPING_PATH).values(data_to_fill)
+
 def populate_cm010(input_pdf_path, output_pdf_path, data_to_fill):
     """
     Fills the CM-010 PDF form with the provided data and saves it to a new file.
@@ -52,62 +120,9 @@ def populate_cm010(input_pdf_path, output_pdf_path, data_to_fill):
     """
     print(f"\n--- Starting to populate {input_pdf_path} ---")
     try:
-        reader = PdfReader(input_pdf_path)
-        writer = PdfWriter()
-
-        # Copy all pages from the original PDF to the writer object
-        for page in reader.pages:
-            writer.add_page(page)
-
-        # This mapping connects your human-readable data keys to the actual,
-        # often complex, field names discovered in Step 1.
-        # NOTE: These keys are derived from inspecting a standard CM-010 form
-        # and may need to be adjusted if the form version changes.
-        field_mapping = {
-            # Header Information
-            "attorney_name_address": "topmostSubform[0].Page1[0].f1_01[0]",
-            "attorney_for": "topmostSubform[0].Page1[0].f1_03[0]",
-            # Court Information
-            "county": "topmostSubform[0].Page1[0].f1_02[0]",
-            "court_street_address": "topmostSubform[0].Page1[0].f1_04[0]",
-            "court_city_zip": "topmostSubform[0].Page1[0].f1_06[0]",
-            "court_branch_name": "topmostSubform[0].Page1[0].f1_07[0]",
-            # Case Information
-            "case_name": "topmostSubform[0].Page1[0].f1_08[0]",
-            "judge_name": "topmostSubform[0].Page1[0].f1_10[0]",
-            "dept_number": "topmostSubform[0].Page1[0].f1_11[0]",
-            # Checkboxes (these require a special value: '/Yes' to check)
-            "is_complex_checkbox": "topmostSubform[0].Page1[0].c1_01[1]",
-            "remedy_monetary_checkbox": "topmostSubform[0].Page1[0].c1_02[0]",
-            "remedy_nonmonetary_checkbox": "topmostSubform[0].Page1[0].c1_03[0]"
-        }
-
-        # Prepare the final dictionary for the PDF writer
-        pdf_field_data = {
-            field_mapping["attorney_name_address"]: data_to_fill.get("attorney_details", ""),
-            field_mapping["attorney_for"]: data_to_fill.get("attorney_representing", ""),
-            field_mapping["county"]: data_to_fill.get("county", ""),
-            field_mapping["court_street_address"]: data_to_fill.get("court_street", ""),
-            field_mapping["court_city_zip"]: data_to_fill.get("court_city_zip", ""),
-            field_mapping["court_branch_name"]: data_to_fill.get("court_branch", ""),
-            field_mapping["case_name"]: data_to_fill.get("case_name", ""),
-            field_mapping["judge_name"]: data_to_fill.get("judge", ""),
-            field_mapping["dept_number"]: data_to_fill.get("department", ""),
-            # Set checkbox values. If the key exists and is True, set to '/Yes'.
-            field_mapping["is_complex_checkbox"]: '/Yes' if data_to_fill.get("is_complex") else '/Off',
-            field_mapping["remedy_monetary_checkbox"]: '/Yes' if data_to_fill.get("wants_monetary") else '/Off',
-            field_mapping["remedy_nonmonetary_checkbox"]: '/Yes' if data_to_fill.get("wants_nonmonetary") else '/Off',
-        }
-
-        # Update the form fields on the first page of the PDF
-        writer.update_page_form_field_values(
-            writer.pages[0], pdf_field_data
-        )
-
-        # Write the updated content to a new, populated PDF file
-        with open(output_pdf_path, "wb") as output_stream:
-            writer.write(output_stream)
-        
+        # The template is parsed once per process and each form is written as
+        # an incremental update to it (see FormFiller below)
+        load_form(input_pdf_path).fill_to(output_pdf_path, cm010_field_values(data_to_fill))
         print(f"Successfully pre-populated form and saved to '{output_pdf_path}'")
 
     except FileNotFoundError:
@@ -115,6 +130,266 @@ def populate_cm010(input_pdf_path, output_pdf_path, data_to_fill):
     except Exception as e:
         print(f"An unexpected error occurred during population: {e}")
 
+# --- STEP 3: FILL MANY FORMS FROM ONE PARSED TEMPLATE ---
+# For batches, the template is parsed once and every filled form is written
+# as the untouched template bytes plus a small incremental update.
+
+class FormField(NamedTuple):
+    """A terminal form field: its object, kind, widget annotations and their on-states."""
+    ref: IndirectObject
+    kind: str
+    widgets: tuple
+    # One per widget: the appearance state that shows it checked
+    on_states: tuple
+    radio: bool
+
+    def button_states(self, value):
+        """
+        The /V value and per-widget /AS states that set a button field to `value`.
+
+        A false value or '/Off' clears every widget. A state name selects the
+        widgets with that on-state, which is how a radio group is set; any
+        other true value checks a checkbox's widgets, each in its own on-state.
+
+        Raises:
+            ValueError: If a radio group is given anything but one of its states.
+        """
+        if value in (None, False, "", "/Off", "Off"):
+            return NameObject("/Off"), (NameObject("/Off"),) * len(self.widgets)
+        state = f"/{str(value).lstrip('/')}" if isinstance(value, str) else None
+        if state in self.on_states:
+            return NameObject(state), tuple(NameObject(state if on == state else "/Off") for on in self.on_states)
+        if self.radio:
+            raise ValueError(f"radio group takes one of {', '.join(sorted(set(self.on_states)))}, not {value!r}")
+        return NameObject(self.on_states[0]), tuple(NameObject(on) for on in self.on_states)
+
+class FormFiller:
+    """
+    Fills one PDF form template many times.
+
+    The template is read and its field tree walked once, building a map of
+    fully qualified field names (e.g. "topmostSubform[0].Page1[0].f1_01[0]")
+    to their objects. A fill does not copy pages or re-serialize the
+    document: the output is the template's bytes followed by an incremental
+    update holding only the changed field dictionaries, the AcroForm
+    dictionary and a new cross-reference section. That section is of the
+    same kind as the template's last one, a classic xref table or an xref
+    stream, since a table cannot point back to a stream with /Prev.
+
+    Filled text fields drop their stale appearance streams and the AcroForm
+    sets /NeedAppearances, so viewers draw the new values; checkboxes and
+    radio buttons switch to their existing on/off appearances, each widget
+    to its own on-state. The XFA form is removed from the
+    update, because viewers that support XFA would otherwise show its data
+    instead of the AcroForm values.
+
+    Args:
+        template_path (str): The blank PDF form.
+
+    Raises:
+        ValueError: If the PDF is encrypted or has no AcroForm.
+    """
+
+    def __init__(self, template_path):
+        with open(template_path, "rb") as f:
+            self.template = f.read()
+        if not self.template.endswith(b"\n"):
+            self.template += b"\n"
+        reader = PdfReader(io.BytesIO(self.template))
+        if reader.is_encrypted:
+            raise ValueError(f"{template_path} is encrypted")
+        root_ref = reader.trailer.raw_get("/Root")
+        self._root = root_ref.get_object()
+        self._root_ref = root_ref
+        acroform = self._root.raw_get("/AcroForm") if "/AcroForm" in self._root else None
+        if acroform is None:
+            raise ValueError(f"{template_path} has no fillable form fields")
+        self._acroform_ref = acroform if isinstance(acroform, IndirectObject) else None
+        self._acroform = acroform.get_object()
+        self._trailer = {key: reader.trailer.raw_get(key) for key in ("/Root", "/Info", "/ID") if key in reader.trailer}
+        self._size = reader.trailer["/Size"]
+        self._startxref = int(STARTXREF_PATTERN.findall(self.template[-1024:])[-1])
+        self._xref_stream = XREF_STREAM_PATTERN.match(self.template, self._startxref) is not None
+
+        self.fields = {}
+        for ref in self._acroform.get("/Fields", []):
+            self._walk_field(ref, "", None, 0)
+
+    def _walk_field(self, ref, parent_name, inherited_kind, inherited_flags):
+        field = ref.get_object()
+        name = field.get("/T")
+        qualified = f"{parent_name}.{name}" if parent_name and name is not None else (name or parent_name)
+        kind = field.get("/FT", inherited_kind)
+        flags = int(field.get("/Ff", inherited_flags))
+        kids = field.get("/Kids", [])
+        child_fields = [kid for kid in kids if "/T" in kid.get_object()]
+        if child_fields:
+            for kid in child_fields:
+                self._walk_field(kid, qualified, kind, flags)
+            return
+        # A terminal field is its own widget or has widget kids without names
+        widgets = tuple(kids) if kids else (ref,)
+        on_states = ()
+        if kind == "/Btn":
+            on_states = tuple(
+                next((str(state) for state in widget.get_object().get("/AP", {}).get("/N", {}) if state != "/Off"), "/Yes")
+                for widget in widgets
+            )
+        self.fields[qualified] = FormField(ref, kind, widgets, on_states, kind == "/Btn" and bool(flags & RADIO_FLAG))
+
+    @property
+    def field_names(self):
+        return list(self.fields)
+
+    def _changed_objects(self, values):
+        """
+        Returns {object reference: new dictionary} for a set of field values.
+
+        Raises:
+            ValueError: If a field is unknown or a radio group gets a value
+                that is not one of its states.
+        """
+        unknown = [name for name in values if name not in self.fields]
+        if unknown:
+            raise ValueError(f"Unknown form fields: {', '.join(unknown)}")
+        changed = {}
+
+        def updated(ref):
+            key = (ref.idnum, ref.generation)
+            if key not in changed:
+                changed[key] = (ref, DictionaryObject(ref.get_object()))
+            return changed[key][1]
+
+        for name, value in values.items():
+            field = self.fields[name]
+            if field.kind == "/Btn":
+                try:
+                    state, widget_states = field.button_states(value)
+                except ValueError as e:
+                    raise ValueError(f"{name}: {e}") from None
+                updated(field.ref)[NameObject("/V")] = state
+                for widget, widget_state in zip(field.widgets, widget_states):
+                    updated(widget)[NameObject("/AS")] = widget_state
+            else:
+                updated(field.ref)[NameObject("/V")] = TextStringObject(str(value))
+                for widget in field.widgets:
+                    updated(widget).pop("/AP", None)
+
+        acroform = DictionaryObject(self._acroform)
+        acroform[NameObject("/NeedAppearances")] = BooleanObject(True)
+        acroform.pop("/XFA", None)
+        if self._acroform_ref is not None:
+            changed[(self._acroform_ref.idnum, self._acroform_ref.generation)] = (self._acroform_ref, acroform)
+        else:
+            root = DictionaryObject(self._root)
+            root[NameObject("/AcroForm")] = acroform
+            changed[(self._root_ref.idnum, self._root_ref.generation)] = (self._root_ref, root)
+        return [changed[key] for key in sorted(changed)]
+
+    def fill(self, values):
+        """
+        Fills the form.
+
+        Args:
+            values (dict): Field values keyed by qualified field name; checkboxes
+                take a boolean or a state name such as '/Yes' or '/Off', and
+                radio groups the state name of the button to select.
+
+        Returns:
+            The filled PDF as bytes.
+        """
+        update = io.BytesIO()
+        offsets = []
+        base = len(self.template)
+        for ref, obj in self._changed_objects(values):
+            offsets.append((ref, base + update.tell()))
+            update.write(f"{ref.idnum} {ref.generation} obj\n".encode())
+            obj.write_to_stream(update)
+            update.write(b"\nendobj\n")
+
+        xref_offset = base + update.tell()
+        trailer = DictionaryObject({NameObject(key): value for key, value in self._trailer.items()})
+        trailer[NameObject("/Size")] = NumberObject(self._size)
+        trailer[NameObject("/Prev")] = NumberObject(self._startxref)
+        if self._xref_stream:
+            self._write_xref_stream(update, offsets, xref_offset, trailer)
+        else:
+            update.write(b"xref\n")
+            for ref, offset in offsets:
+                update.write(f"{ref.idnum} 1\n{offset:010d} {ref.generation:05d} n\r\n".encode())
+            update.write(b"trailer\n")
+            trailer.write_to_stream(update)
+        update.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+        return self.template + update.getvalue()
+
+    def _write_xref_stream(self, update, offsets, xref_offset, trailer):
+        """
+        Writes the update's cross-reference section as an xref stream object.
+
+        The stream takes the next free object number and lists itself along
+        with the changed objects, one subsection per object.
+        """
+        number = self._size
+        entries = sorted([(ref.idnum, ref.generation, offset) for ref, offset in offsets] + [(number, 0, xref_offset)])
+        offset_width = max(4, (xref_offset.bit_length() + 7) // 8)
+        xref = DecodedStreamObject()
+        xref.set_data(b"".join(
+            b"\x01" + offset.to_bytes(offset_width, "big") + generation.to_bytes(2, "big")
+            for _, generation, offset in entries
+        ))
+        xref.update(trailer)
+        xref[NameObject("/Type")] = NameObject("/XRef")
+        xref[NameObject("/Size")] = NumberObject(number + 1)
+        xref[NameObject("/W")] = ArrayObject(NumberObject(width) for width in (1, offset_width, 2))
+        xref[NameObject("/Index")] = ArrayObject(
+            NumberObject(value) for idnum, _, _ in entries for value in (idnum, 1)
+        )
+        update.write(f"{number} 0 obj\n".encode())
+        xref.write_to_stream(update)
+        update.write(b"\nendobj")
+
+    def fill_to(self, output_pdf_path, values):
+        """Fills the form and writes it atomically to a file."""
+        data = self.fill(values)
+        temp_path = f"{output_pdf_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as output_stream:
+                output_stream.write(data)
+            os.replace(temp_path, output_pdf_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def fill_many(self, records, output_path_for, to_values=cm010_field_values):
+        """
+        Fills one form per record.
+
+        Args:
+            records: Iterable of data records.
+            output_path_for: Function from (index, record) to an output path.
+            to_values: Function turning a record into field values.
+
+        Yields:
+            (output path, error message or None) for every record.
+        """
+        for index, record in enumerate(records):
+            output_pdf_path = output_path_for(index, record)
+            try:
+                self.fill_to(output_pdf_path, to_values(record))
+                yield output_pdf_path, None
+            except Exception as e:
+                yield output_pdf_path, f"{type(e).__name__}: {e}"
+
+def load_form(pdf_path):
+    """Returns the FormFiller of a template, parsing it once per process until the file changes."""
+    stat = os.stat(pdf_path)
+    return _load_form(pdf_path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=None)
+def _load_form(pdf_path, mtime_ns, size):
+    return FormFiller(pdf_path)
+
 # --- SCRIPT EXECUTION ---
 if __name__ == "__main__":
     
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmarks CM-010 cover sheet filling: the original pypdf path, which parses
+the template and copies its pages for every form, against a FormFiller that
+parses it once and writes incremental updates (what populate_cm010 uses).
+
+Both paths fill the same records; the script checks that they produce the
+same field values, then reports fills/sec for each.
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+from pypdf import PdfReader, PdfWriter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from PDF_Edit import FormFiller, cm010_field_values
+
+def cover_sheet(i):
+    return {
+        "attorney_details": f"Attorney {i} (SBN {100000 + i})\n{i} Main Street\nSan Jose, CA 95113",
+        "attorney_representing": f"Plaintiff PARTY {i}",
+        "county": "Santa Clara",
+        "court_street": "191 North First Street",
+        "court_city_zip": "San Jose, CA 95113",
+        "court_branch": "Downtown Superior Court",
+        "case_name": f"PARTY {i} vs. MEGA CORP., et al.",
+        "judge": "Hon. Charles F. Adams",
+        "department": str(i % 20 + 1),
+        "is_complex": i % 2 == 0,
+        "wants_monetary": True,
+        "wants_nonmonetary": i % 3 == 0,
+    }
+
+def copy_and_fill(template_path, output_pdf_path, record):
+    """The original populate_cm010: parse the template, copy the document and fill the first page."""
+    writer = PdfWriter()
+    writer.append(PdfReader(template_path))
+    writer.update_page_form_field_values(writer.pages[0], cm010_field_values(record))
+    with open(output_pdf_path, "wb") as output_stream:
+        writer.write(output_stream)
+
+def field_values(path):
+    return {name: field.get("/V") for name, field in PdfReader(path).get_fields().items() if "/V" in field}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CM-010 form filling")
+    parser.add_argument("--template", default="cm010.pdf", help="Blank CM-010 PDF")
+    parser.add_argument("--count", type=int, default=1000, help="Cover sheets to fill per path")
+    args = parser.parse_args()
+
+    records = [cover_sheet(i) for i in range(args.count)]
+    with tempfile.TemporaryDirectory() as output_dir:
+        def output_path_for(prefix):
+            return lambda index, record: os.path.join(output_dir, f"{prefix}_{index:05d}.pdf")
+
+        start = time.perf_counter()
+        for index, record in enumerate(records):
+            copy_and_fill(args.template, output_path_for("old")(index, record), record)
+        old_rate = args.count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        filler = FormFiller(args.template)
+        failures = [error for _, error in filler.fill_many(records, output_path_for("new")) if error]
+        new_rate = args.count / (time.perf_counter() - start)
+
+        sizes = [os.path.getsize(output_path_for(prefix)(0, None)) for prefix in ("old", "new")]
+        mismatches = sum(
+            field_values(output_path_for("old")(index, None)) != field_values(output_path_for("new")(index, None))
+            for index in range(0, args.count, max(1, args.count // 20))
+        )
+
+    print(f"Copy and fill:  {old_rate:.1f} fills/sec, {sizes[0] / 1024:.0f} KB per form")
+    print(f"FormFiller:     {new_rate:.1f} fills/sec, {sizes[1] / 1024:.0f} KB per form "
+          f"({new_rate / old_rate:.1f}x, template parsed once)")
+    print(f"Failures: {len(failures)}, field value mismatches in sampled forms: {mismatches}")
+
+if __name__ == "__main__":
+    main()
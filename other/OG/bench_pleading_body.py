@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmarks long pleadings: one 28x3 python-docx table per page (the layout
+docgen.py uses for page 2) against the body-flow section numbered from a
+header frame. Reports build-and-save time and file size per page count.
+"""
+import io
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import docgen
+
+LINE_TEXT = "Plaintiff respectfully moves the Court for an order continuing the trial date herein."
+
+def table_per_page(pages):
+    """The current layout: a page break and a filled numbered table for every body page."""
+    document = docgen.build_pleading_document()
+    table = document.tables[-1]
+    for page in range(pages):
+        if page:
+            document.add_page_break()
+            table = docgen.create_pleading_table(document)
+        for row in range(28):
+            table.cell(row, 1).paragraphs[0].add_run(LINE_TEXT)
+    return document
+
+def body_flow(pages):
+    """The body-flow layout: the same text as paragraphs in one section with the header line numbers."""
+    # Three lines of text per paragraph, about 28 lines per page
+    paragraphs = [" ".join([LINE_TEXT] * 3)] * (pages * 28 // 3)
+    return docgen.build_pleading_document(body=paragraphs)
+
+def measure(build, pages):
+    start = time.perf_counter()
+    buffer = io.BytesIO()
+    build(pages).save(buffer)
+    return time.perf_counter() - start, len(buffer.getvalue())
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-page pleading layouts")
+    parser.add_argument("--pages", type=int, nargs="+", default=[5, 25, 50, 100], help="Body page counts to build")
+    args = parser.parse_args()
+
+    print(f"{'pages':>6}  {'tables (s)':>11}  {'tables size':>12}  {'flow (s)':>9}  {'flow size':>10}")
+    for pages in args.pages:
+        table_seconds, table_size = measure(table_per_page, pages)
+        flow_seconds, flow_size = measure(body_flow, pages)
+        print(f"{pages:>6}  {table_seconds:>11.2f}  {table_size / 1024:>10.0f} KB  {flow_seconds:>9.2f}  {flow_size / 1024:>7.0f} KB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Generates filled pleadings in bulk from a JSONL case file.
+
+Each line is one case:
+
+    {"attorney": {"name": "...", "bar_number": "...", "street_address": "...",
+                  "city_state_zip": "...", "telephone": "...", "attorney_for": "..."},
+     "court": {"county": "SACRAMENTO"},
+     "parties": {"plaintiff": "...", "defendant": "..."},
+     "case_number": "24CR000123",
+     "document_title": "Motion to Continue",
+     "output": "optional-file-name.docx"}
+
+The caption fields can also be given flat, using the names in
+docgen.CAPTION_FIELDS. Documents are rendered from docgen's cached template
+in a process pool and written atomically; lines that fail are reported with
+their line number and error, and can also be written to a failures file.
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from docgen import CAPTION_FIELDS, pleading_template
+
+# Caption fields that every record must supply; the attorney block and the
+# plaintiff fall back to the template placeholders
+REQUIRED_FIELDS = ("county", "defendant", "case_number", "document_title")
+
+# Nested record sections and the caption fields they hold
+RECORD_SECTIONS = {
+    "attorney": {
+        "name": "attorney_name",
+        "bar_number": "bar_number",
+        "street_address": "street_address",
+        "city_state_zip": "city_state_zip",
+        "telephone": "telephone",
+        "attorney_for": "attorney_for",
+    },
+    "court": {"county": "county"},
+    "parties": {"plaintiff": "plaintiff", "defendant": "defendant"},
+}
+
+def record_fields(record):
+    """
+    Maps a case record to caption fields.
+
+    Null values are treated as empty.
+
+    Raises:
+        ValueError: If the record or one of its sections is not an object, or
+            the record lacks a required field.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("record is not a JSON object")
+    fields = {name: record[name] for name in CAPTION_FIELDS if name in record}
+    for section, names in RECORD_SECTIONS.items():
+        values = record.get(section)
+        if values is None:
+            continue
+        if not isinstance(values, dict):
+            raise ValueError(f"section {section} must be an object")
+        fields.update({field: values[key] for key, field in names.items() if key in values})
+    fields = {name: "" if value is None else str(value) for name, value in fields.items()}
+    missing = [name for name in REQUIRED_FIELDS if not fields.get(name, "").strip()]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    return fields
+
+def safe_name(text):
+    """Reduces text to a file-name-safe slug."""
+    return re.sub(r'[^A-Za-z0-9]+', '_', text).strip('_')[:80] or "untitled"
+
+def output_name(record, fields):
+    """The file a record is written to: its "output" name, or case number and title."""
+    if record.get("output"):
+        name = os.path.basename(str(record["output"]))
+        return name if name.lower().endswith(".docx") else name + ".docx"
+    return f"{safe_name(fields['case_number'])}_{safe_name(fields['document_title'])}.docx"
+
+def read_cases(path, output_dir):
+    """
+    Reads a JSONL case file.
+
+    Returns:
+        (tasks, failures): tasks are (line number, output path, caption fields)
+        and failures are (line number, error message) for lines that could
+        not be used.
+    """
+    tasks, failures = [], []
+    claimed = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                fields = record_fields(record)
+            except ValueError as e:
+                failures.append((line_number, str(e)))
+                continue
+            output_path = os.path.join(output_dir, output_name(record, fields))
+            if output_path in claimed:
+                failures.append((line_number, f"output {output_path} already used by line {claimed[output_path]}"))
+                continue
+            claimed[output_path] = line_number
+            tasks.append((line_number, output_path, fields))
+    return tasks, failures
+
+def render_case(task):
+    """Renders one case in a worker; returns (line number, output path, error or None)."""
+    line_number, output_path, fields = task
+    try:
+        pleading_template().save(output_path, fields)
+        return line_number, output_path, None
+    except Exception as e:
+        return line_number, output_path, f"{type(e).__name__}: {e}"
+
+def warm_template():
+    """Builds the template once when a worker starts, not inside its first case."""
+    pleading_template()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate filled pleadings from a JSONL case file")
+    parser.add_argument("cases", help="JSONL file with one case per line")
+    parser.add_argument("--output-dir", default="pleadings", help="Directory for the generated .docx files")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all CPUs)")
+    parser.add_argument("--failures", default=None, help="Write failed line numbers and errors here as JSONL")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.makedirs(args.output_dir, exist_ok=True)
+    start_time = time.perf_counter()
+    tasks, failures = read_cases(args.cases, args.output_dir)
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"Generating {len(tasks)} pleadings with {workers} worker(s)...")
+    written = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_template) as pool:
+        chunksize = max(1, min(64, len(tasks) // (workers * 4)))
+        for line_number, output_path, error in pool.map(render_case, tasks, chunksize=chunksize):
+            if error is None:
+                written += 1
+            else:
+                failures.append((line_number, error))
+    elapsed = max(time.perf_counter() - start_time, 1e-9)
+    failures.sort()
+
+    print(f"\n📊 Bulk Pleading Summary:")
+    print(f"   • Written: {written} documents to {args.output_dir}")
+    print(f"   • Failed: {len(failures)} lines")
+    print(f"   • Wall time: {elapsed:.2f}s with {workers} worker(s), {written / elapsed:.1f} documents/sec")
+    for line_number, error in failures[:20]:
+        print(f"   ❌ Line {line_number}: {error}")
+    if len(failures) > 20:
+        print(f"   ... and {len(failures) - 20} more")
+    if args.failures and failures:
+        with open(args.failures, 'w', encoding='utf-8') as f:
+            for line_number, error in failures:
+                f.write(json.dumps({"line": line_number, "error": error}) + "\n")
+        print(f"   • Failures written to: {args.failures}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,31 @@ import docx
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_ALIGN_VERTICAL
+from docx.enum.section import WD_SECTION
+from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
+import os
+import sys
+from functools import lru_cache
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pleading_template import PleadingTemplate
+
+# Caption fields of the cached pleading template and their placeholder text
+CAPTION_FIELDS = {
+    "attorney_name": "[Name or Firm Name]",
+    "bar_number": "[State Bar #]",
+    "street_address": "[Street Address]",
+    "city_state_zip": "[City, State, Zip Code]",
+    "telephone": "[Telephone #]",
+    "attorney_for": "[Party Name]",
+    "county": "[COUNTY NAME]",
+    "plaintiff": "THE PEOPLE OF THE STATE OF CALIFORNIA",
+    "defendant": "[DEFENDANT'S FULL NAME]",
+    "case_number": "[CASE NUMBER]",
+    "document_title": "[TITLE OF DOCUMENT]",
+}
 
 def create_pleading_table(document):
     """
@@ -47,9 +70,120 @@ def create_pleading_table(document):
     
     return table
 
-def create_final_pleading_template(filename="pleading_template_final.docx"):
+BODY_STYLE = "Pleading Body"
+
+def add_body_style(document):
     """
-    Creates a clean, professional Word document formatted for CA pleading paper.
+    Adds the paragraph style of pleading body text: exactly 24pt lines, so
+    every text line lands on one of the 28 numbered lines of a page.
+    """
+    if BODY_STYLE in [style.name for style in document.styles]:
+        return document.styles[BODY_STYLE]
+    style = document.styles.add_style(BODY_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = document.styles['Normal']
+    style.paragraph_format.line_spacing = Pt(24)  # A Length means an exact line height
+    style.paragraph_format.space_before = Pt(0)
+    style.paragraph_format.space_after = Pt(0)
+    style.paragraph_format.first_line_indent = Inches(0.5)
+    style.paragraph_format.widow_control = False  # Keep every page at 28 lines
+    return style
+
+PLEADING_LINES = 28
+
+# pPr children that come before w:framePr in the schema sequence
+FRAME_PR_PREDECESSORS = ('w:pStyle', 'w:keepNext', 'w:keepLines', 'w:pageBreakBefore')
+
+def add_line_number_frame(section, lines=PLEADING_LINES):
+    """
+    Puts the pleading line numbers 1-28 into the section header.
+
+    The numbers are header paragraphs sharing one w:framePr, which Word and
+    LibreOffice draw as a single text frame anchored to the page, just left
+    of the text column. With the body's 1" top margin and exact 24pt lines,
+    number n sits beside body line n, and every page shows the full 1-28
+    gutter however much text it holds.
+    """
+    header = section.header
+    header.is_linked_to_previous = False
+    frame_left = Inches(0.4)
+    for i in range(lines):
+        p_num = header.paragraphs[0] if i == 0 else header.add_paragraph()
+        p_num.add_run(str(i + 1))
+        p_num.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+        p_num.paragraph_format.space_before = Pt(0)
+        p_num.paragraph_format.space_after = Pt(0)
+        p_num.paragraph_format.line_spacing = Pt(24)
+
+        frame = OxmlElement('w:framePr')
+        frame.set(qn('w:w'), str(Inches(0.4).twips))
+        frame.set(qn('w:h'), str(Pt(24 * lines).twips))
+        frame.set(qn('w:hRule'), 'exact')
+        frame.set(qn('w:wrap'), 'around')
+        frame.set(qn('w:hAnchor'), 'page')
+        frame.set(qn('w:vAnchor'), 'page')
+        frame.set(qn('w:x'), str(frame_left.twips))
+        frame.set(qn('w:y'), str(section.top_margin.twips))
+        pPr = p_num._p.get_or_add_pPr()
+        position = sum(1 for child in pPr if child.tag in {qn(tag) for tag in FRAME_PR_PREDECESSORS})
+        pPr.insert(position, frame)
+
+def add_pleading_body_section(document):
+    """
+    Starts a new-page section laid out as pleading paper without tables.
+
+    The line numbers live once in the section header (add_line_number_frame)
+    and the vertical rule between them and the text is a left page border,
+    so pages cost nothing beyond the paragraphs that fill them. The 1" top
+    margin plus 28 exact 24pt lines leave a 2/3" bottom margin.
+
+    The gutter is fixed to the page, so body text only lines up with it
+    while every body line is exactly 24pt: headings or paragraphs with other
+    spacing or font sizes drift off the numbered lines until the next page.
+    """
+    section = document.add_section(WD_SECTION.NEW_PAGE)
+    section.top_margin = Inches(1.0)
+    section.bottom_margin = Pt(48)
+    section.left_margin = Inches(1.0)
+    section.right_margin = Inches(0.5)
+
+    pg_borders = OxmlElement('w:pgBorders')
+    pg_borders.set(qn('w:offsetFrom'), 'text')
+    left_border = OxmlElement('w:left')
+    left_border.set(qn('w:val'), 'single')
+    left_border.set(qn('w:sz'), '4')
+    left_border.set(qn('w:space'), '4')
+    left_border.set(qn('w:color'), 'auto')
+    pg_borders.append(left_border)
+    # pgBorders follows pgMar in the sectPr schema sequence
+    section._sectPr.find(qn('w:pgMar')).addnext(pg_borders)
+
+    add_line_number_frame(section)
+    return section
+
+def add_pleading_body(document, paragraphs):
+    """
+    Flows body paragraphs onto numbered pleading lines in a new section.
+
+    Args:
+        document: The docx.Document, typically with its caption page built.
+        paragraphs (list): Body text, one string per paragraph.
+    """
+    style = add_body_style(document)
+    add_pleading_body_section(document)
+    for text in paragraphs:
+        document.add_paragraph(text, style=style)
+
+def build_pleading_document(fields=CAPTION_FIELDS, body=None):
+    """
+    Builds a Word document formatted for CA pleading paper with a filled caption.
+
+    Args:
+        fields (dict): Caption text keyed like CAPTION_FIELDS.
+        body (list): Body paragraphs to flow onto numbered lines after the
+            caption page; without it, page 2 is an empty numbered table.
+
+    Returns:
+        The docx.Document.
     """
     document = docx.Document()
     style = document.styles['Normal']
@@ -71,11 +205,11 @@ def create_final_pleading_template(filename="pleading_template_final.docx"):
 
     # Attorney Info
     attorney_lines = [
-        "[Name or Firm Name], SBN [State Bar #]",
-        "[Street Address]",
-        "[City, State, Zip Code]",
-        "Telephone: [Telephone #]",
-        "Attorney for: [Party Name]"
+        f"{fields['attorney_name']}, SBN {fields['bar_number']}",
+        fields["street_address"],
+        fields["city_state_zip"],
+        f"Telephone: {fields['telephone']}",
+        f"Attorney for: {fields['attorney_for']}"
     ]
     for i, line in enumerate(attorney_lines):
         cell = table_page1.cell(i, 1)
@@ -86,7 +220,7 @@ def create_final_pleading_template(filename="pleading_template_final.docx"):
     court_cell = table_page1.cell(7, 1)
     court_cell.merge(table_page1.cell(7, 2))
     set_single_space(court_cell)
-    court_cell.text = "SUPERIOR COURT OF THE STATE OF CALIFORNIA\nCOUNTY OF [COUNTY NAME]"
+    court_cell.text = f"SUPERIOR COURT OF THE STATE OF CALIFORNIA\nCOUNTY OF {fields['county']}"
     court_cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
     court_cell.paragraphs[0].runs[0].bold = True
     
@@ -94,7 +228,7 @@ def create_final_pleading_template(filename="pleading_template_final.docx"):
     # Column 1: Plaintiff Info
     p_plaintiff_name = table_page1.cell(10, 1)
     set_single_space(p_plaintiff_name)
-    p_plaintiff_name.text = "THE PEOPLE OF THE STATE OF CALIFORNIA,"
+    p_plaintiff_name.text = f"{fields['plaintiff']},"
 
     p_plaintiff_label = table_page1.cell(12, 1)
     set_single_space(p_plaintiff_label)
@@ -107,7 +241,7 @@ def create_final_pleading_template(filename="pleading_template_final.docx"):
 
     p_defendant_name = table_page1.cell(16, 1)
     set_single_space(p_defendant_name)
-    p_defendant_name.text = "[DEFENDANT'S FULL NAME],"
+    p_defendant_name.text = f"{fields['defendant']},"
     p_defendant_name.paragraphs[0].runs[0].all_caps = True
     
     p_defendant_label = table_page1.cell(18, 1)
@@ -117,18 +251,43 @@ def create_final_pleading_template(filename="pleading_template_final.docx"):
     # Column 2: Case Info
     p_case_num = table_page1.cell(10, 2)
     set_single_space(p_case_num)
-    p_case_num.text = "Case No.: [CASE NUMBER]"
+    p_case_num.text = f"Case No.: {fields['case_number']}"
 
     p_doc_title = table_page1.cell(12, 2)
     set_single_space(p_doc_title)
-    run = p_doc_title.paragraphs[0].add_run("[TITLE OF DOCUMENT]")
+    run = p_doc_title.paragraphs[0].add_run(fields["document_title"])
     run.bold = True
     run.all_caps = True
 
     # --- Create Page 2 ---
+    if body is not None:
+        add_pleading_body(document, body)
+        return document
     document.add_page_break()
     create_pleading_table(document)
-    
+    return document
+
+@lru_cache(maxsize=None)
+def pleading_template():
+    """The two-page pleading skeleton, built once per process and cloned for each document."""
+    return PleadingTemplate(build_pleading_document, CAPTION_FIELDS)
+
+def fill_pleading(filename, fields):
+    """
+    Writes a pleading from the cached template, filling only the caption cells.
+
+    Args:
+        filename (str): The name of the Word file to create.
+        fields (dict): Caption text keyed like CAPTION_FIELDS; missing
+            fields keep their placeholders.
+    """
+    pleading_template().save(filename, fields)
+
+def create_final_pleading_template(filename="pleading_template_final.docx"):
+    """
+    Creates a clean, professional Word document formatted for CA pleading paper.
+    """
+    document = build_pleading_document()
     try:
         document.save(filename)
         print(f"Successfully created '{filename}'")
@@ -136,4 +295,5 @@ def create_final_pleading_template(filename="pleading_template_final.docx"):
         print(f"Error saving file: {e}")
 
 # Run the function to generate your template
-create_final_pleading_template()
\ No newline at end of file
+if __name__ == "__main__":
+    create_final_pleading_template()
\ No newline at end of file
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Registry of Judicial Council PDF form templates and their field mappings.
+
+Every template is inspected once: its form ID and revision are read from
+the footer every Judicial Council form carries (e.g. "CM-010 [Rev. January
+1, 2024]") and its field names and types from the AcroForm. The results are
+kept in a compact JSON index keyed by form ID and revision, which is only
+refreshed for templates whose file changed.
+
+Data keys are mapped to fields by the mapping files in form_mappings/ (see
+PDF_Edit.load_field_mapping). Before a batch runs, prepare() checks that
+the mapping was written for the template's revision and that every mapped
+field exists with the right type, so a changed form is caught up front
+rather than after thousands of bad fills.
+
+Usage:
+    python form_registry.py register cm010.pdf
+    python form_registry.py check cm010.pdf
+"""
+import os
+import re
+import sys
+import json
+import argparse
+from typing import NamedTuple
+
+from pypdf import PdfReader
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from PDF_Edit import MAPPING_DIR, FormFiller, load_field_mapping, load_form
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "form_index.json")
+
+# Judicial Council footers: "CM-010 [Rev. January 1, 2024]", "POS-010 [Rev. January 1, 2007]"
+FORM_REVISION_PATTERN = re.compile(r'\b([A-Z]{2,4}-\d{3,4}[A-Z]?)\s*\[\s*(?:Rev\.|New)\s*([^\]]+?)\s*\]')
+
+class FormMappingError(ValueError):
+    """A mapping file does not fit the form template it would fill."""
+
+class FormJob(NamedTuple):
+    """A checked template and mapping, ready to fill records."""
+    form: str
+    revision: str
+    filler: FormFiller
+    to_values: object
+
+    def fill_many(self, records, output_path_for):
+        """Fills one form per record; see FormFiller.fill_many."""
+        return self.filler.fill_many(records, output_path_for, self.to_values)
+
+def discover_form_revision(reader):
+    """
+    Reads the form ID and revision from a template's footer text.
+
+    Returns:
+        (form ID, revision), or (None, None) if no footer is found.
+    """
+    # Footers are on the first page; multi-page forms repeat them on the last
+    for page in (reader.pages[0], reader.pages[-1]):
+        match = FORM_REVISION_PATTERN.search(page.extract_text() or "")
+        if match:
+            return match.group(1), " ".join(match.group(2).split())
+    return None, None
+
+class FormRegistry:
+    """
+    The on-disk index of form templates and the mapping files for them.
+
+    Args:
+        index_path (str): JSON index file, created on first registration.
+        mapping_dir (str): Directory of mapping files.
+    """
+
+    def __init__(self, index_path=DEFAULT_INDEX_PATH, mapping_dir=MAPPING_DIR):
+        self.index_path = index_path
+        self.mapping_dir = mapping_dir
+        self.index = {}
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def _save(self):
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, separators=(",", ":"), sort_keys=True)
+        os.replace(temp_path, self.index_path)
+
+    def _find(self, pdf_path):
+        """Returns the (form ID, revision, entry) indexed for a file, if it is unchanged."""
+        path = os.path.abspath(pdf_path)
+        stat = os.stat(path)
+        for form, revisions in self.index.items():
+            for revision, entry in revisions.items():
+                if entry["path"] == path and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                    return form, revision, entry
+        return None
+
+    def register(self, pdf_path, form=None, revision=None):
+        """
+        Indexes a form template, unless the file is already indexed and unchanged.
+
+        Args:
+            pdf_path (str): The blank form PDF.
+            form (str): Form ID, when the footer cannot be read.
+            revision (str): Revision, when the footer cannot be read.
+
+        Returns:
+            (form ID, revision) of the template.
+
+        Raises:
+            ValueError: If the form ID or revision is neither given nor found.
+        """
+        found = self._find(pdf_path)
+        if found is not None and form in (None, found[0]) and revision in (None, found[1]):
+            return found[0], found[1]
+
+        path = os.path.abspath(pdf_path)
+        if form is None or revision is None:
+            discovered = discover_form_revision(PdfReader(path))
+            form, revision = form or discovered[0], revision or discovered[1]
+        if not form or not revision:
+            raise ValueError(f"Could not read the form ID and revision of {pdf_path}; pass them explicitly")
+
+        stat = os.stat(path)
+        self.index.setdefault(form, {})[revision] = {
+            "path": path,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            # Parsed through the same cache prepare() fills from, so a template is read once
+            "fields": {name: field.kind for name, field in load_form(path).fields.items()},
+        }
+        self._save()
+        return form, revision
+
+    def mapping_files(self):
+        """
+        Maps form IDs to {revision: mapping file}.
+
+        The directory is listed on every call, but each file is only parsed
+        again once it changes (see load_field_mapping), so an edited mapping
+        is picked up by a long-running process.
+        """
+        mappings = {}
+        for name in sorted(os.listdir(self.mapping_dir)):
+            if name.endswith(".json"):
+                path = os.path.join(self.mapping_dir, name)
+                mapping = load_field_mapping(path)
+                mappings.setdefault(mapping.form, {})[mapping.revision] = path
+        return mappings
+
+    def check(self, form, revision):
+        """
+        Checks the mapping of a form against an indexed template revision.
+
+        Returns:
+            A list of problems; empty when the mapping fits.
+        """
+        entry = self.index.get(form, {}).get(revision)
+        if entry is None:
+            return [f"{form} revision {revision} is not registered"]
+        mapped_revisions = self.mapping_files().get(form)
+        if not mapped_revisions:
+            return [f"No mapping file for {form} in {self.mapping_dir}"]
+        if revision not in mapped_revisions:
+            return [f"The mapping files for {form} cover revision(s) {', '.join(sorted(mapped_revisions))}, "
+                    f"but the template is revision {revision}"]
+        mapping = load_field_mapping(mapped_revisions[revision])
+
+        problems = []
+        fields = entry["fields"]
+        for key, field in mapping.text:
+            if field not in fields:
+                problems.append(f"{key}: field {field} is not on the form")
+            elif fields[field] == "/Btn":
+                problems.append(f"{key}: field {field} is a checkbox, not a text field")
+        for key, field in mapping.checkboxes:
+            if field not in fields:
+                problems.append(f"{key}: field {field} is not on the form")
+            elif fields[field] != "/Btn":
+                problems.append(f"{key}: field {field} is not a checkbox")
+        return problems
+
+    def prepare(self, pdf_path, form=None, revision=None):
+        """
+        Registers a template and checks its mapping before a batch starts.
+
+        Returns:
+            A FormJob for the template.
+
+        Raises:
+            FormMappingError: If the mapping does not fit the template.
+        """
+        form, revision = self.register(pdf_path, form, revision)
+        problems = self.check(form, revision)
+        if problems:
+            raise FormMappingError(f"Cannot fill {form} [{revision}]:\n  " + "\n  ".join(problems))
+        mapping = load_field_mapping(self.mapping_files()[form][revision])
+        return FormJob(form, revision, load_form(os.path.abspath(pdf_path)), mapping.values)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index Judicial Council form templates and check their mappings")
+    parser.add_argument("command", choices=["register", "check"])
+    parser.add_argument("pdfs", nargs="+", help="Blank form PDFs")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help="Index file")
+    parser.add_argument("--mapping-dir", default=MAPPING_DIR, help="Directory of mapping files")
+    parser.add_argument("--form", default=None, help="Form ID, if the footer cannot be read")
+    parser.add_argument("--revision", default=None, help="Revision, if the footer cannot be read")
+    args = parser.parse_args(argv)
+
+    registry = FormRegistry(args.index, args.mapping_dir)
+    failed = False
+    for pdf_path in args.pdfs:
+        try:
+            form, revision = registry.register(pdf_path, args.form, args.revision)
+        except (OSError, ValueError) as e:
+            print(f"❌ {pdf_path}: {e}")
+            failed = True
+            continue
+        print(f"📄 {pdf_path}: {form} [Rev. {revision}], {len(registry.index[form][revision]['fields'])} fields")
+        if args.command == "check":
+            problems = registry.check(form, revision)
+            for problem in problems:
+                print(f"   ❌ {problem}")
+            if not problems:
+                print(f"   ✅ Mapping fits")
+            failed = failed or bool(problems)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmarks pleading generation: rebuilding each document through python-docx
+against cloning and filling the cached template.
+
+Both paths get the same field values; the script first checks that they
+produce the same parts (the core properties timestamp aside), then reports
+documents/sec for each.
+"""
+import io
+import os
+import sys
+import time
+import zipfile
+import argparse
+
+from lxml import etree
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "OG"))
+import gen
+import docgen
+
+def caption_values(i):
+    return {
+        "attorney_name": f"Attorney {i} & Associates",
+        "bar_number": str(100000 + i),
+        "street_address": f"{i} Main Street",
+        "city_state_zip": "Sacramento, CA 95814",
+        "telephone": f"(916) 555-{i % 10000:04d}",
+        "attorney_for": "Defendant <Doe>",
+        "county": "SACRAMENTO",
+        "plaintiff": "THE PEOPLE OF THE STATE OF CALIFORNIA",
+        "defendant": f"JOHN DOE {i}",
+        "case_number": f"24CR{i:06d}",
+        "document_title": "Motion to Continue\nTrial Date",
+    }
+
+def paper_values(i):
+    values = {"document_title": f"NOTICE OF MOTION {i}"}
+    values.update({f"line_{n + 1}": f"  Line {n + 1} of document {i}" for n in range(gen.NUM_LINES)})
+    return values
+
+def rebuild(build, values):
+    buffer = io.BytesIO()
+    build(values).save(buffer)
+    return buffer.getvalue()
+
+def parts(data):
+    """Canonical XML of every part, skipping the core properties timestamp."""
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        return {
+            name: etree.tostring(etree.fromstring(package.read(name)), method="c14n")
+            for name in package.namelist()
+            if name.endswith((".xml", ".rels")) and name != "docProps/core.xml"
+        }
+
+def check(name, build, template, values):
+    old, new = parts(rebuild(build, values)), parts(template.render(values))
+    different = sorted(part for part in old.keys() | new.keys() if old.get(part) != new.get(part))
+    if different:
+        print(f"❌ {name}: parts differ: {', '.join(different)}")
+        return False
+    return True
+
+def measure(render, values, count):
+    start = time.perf_counter()
+    for i in range(count):
+        render(values(i))
+    return count / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pleading template generation")
+    parser.add_argument("--count", type=int, default=200, help="Documents per measurement")
+    args = parser.parse_args()
+
+    layouts = [
+        ("docgen pleading", docgen.build_pleading_document, docgen.pleading_template, caption_values),
+        ("gen pleading paper",
+         lambda values: gen.build_pleading_paper(values["document_title"], [values[f"line_{n + 1}"] for n in range(gen.NUM_LINES)]),
+         gen.pleading_paper_template, paper_values),
+    ]
+    for name, build, get_template, values in layouts:
+        start = time.perf_counter()
+        template = get_template()
+        setup = time.perf_counter() - start
+        if not all(check(name, build, template, values(i)) for i in range(5)):
+            continue
+        rebuilt = measure(lambda v: rebuild(build, v), values, args.count)
+        cloned = measure(template.render, values, args.count)
+        print(f"{name}: rebuild {rebuilt:.1f} docs/sec, template {cloned:.1f} docs/sec "
+              f"({cloned / rebuilt:.1f}x, template built once in {setup * 1000:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
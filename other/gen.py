@@ -4,15 +4,27 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.section import WD_SECTION
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
+from functools import lru_cache
 
-def create_pleading_paper(filename="pleading_paper_template.docx", document_title="PLEADING PAPER"):
+from pleading_template import PleadingTemplate
+
+NUM_LINES = 28
+
+# Fields of the cached pleading paper template and their defaults
+PLEADING_PAPER_FIELDS = {"document_title": "PLEADING PAPER"}
+PLEADING_PAPER_FIELDS.update({f"line_{i + 1}": "" for i in range(NUM_LINES)})
+
+def build_pleading_paper(document_title="PLEADING PAPER", lines=()):
     """
-    Creates a blank Word document with 28-line pleading paper formatting
+    Builds a Word document with 28-line pleading paper formatting
     that meets California court requirements.
 
     Args:
-        filename (str): The name of the Word file to create.
         document_title (str): The title to appear in the footer.
+        lines (list): Text for the numbered lines, one entry per line.
+
+    Returns:
+        The docx.Document.
     """
     # 1. Create a new blank document
     document = docx.Document()
@@ -31,7 +43,7 @@ def create_pleading_paper(filename="pleading_paper_template.docx", document_titl
         section.bottom_margin = Inches(1.0)
 
     # 4. Create a table with 28 rows and 2 columns
-    num_lines = 28
+    num_lines = NUM_LINES
     table = document.add_table(rows=num_lines, cols=2)
 
     # 5. Set the column widths (6.5" total width for 8.5" paper with 1" margins)
@@ -53,6 +65,8 @@ def create_pleading_paper(filename="pleading_paper_template.docx", document_titl
         p_text = cell_text.paragraphs[0]
         p_text.paragraph_format.space_after = Pt(0)
         p_text.paragraph_format.line_spacing = Pt(24)  # Double spacing (24pt for 12pt font)
+        if i < len(lines) and lines[i]:
+            p_text.add_run(lines[i])
 
     # 7. Customize table borders to create the single vertical line
     tbl = table._tbl
@@ -97,6 +111,43 @@ def create_pleading_paper(filename="pleading_paper_template.docx", document_titl
     title_run.font.name = 'Times New Roman'
     title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
+    return document
+
+@lru_cache(maxsize=None)
+def pleading_paper_template():
+    """The pleading paper skeleton, built once per process and cloned for each document."""
+    return PleadingTemplate(
+        lambda fields: build_pleading_paper(
+            fields["document_title"],
+            [fields[f"line_{i + 1}"] for i in range(NUM_LINES)],
+        ),
+        PLEADING_PAPER_FIELDS,
+    )
+
+def fill_pleading_paper(filename, document_title="PLEADING PAPER", lines=()):
+    """
+    Writes a pleading paper document from the cached template.
+
+    Args:
+        filename (str): The name of the Word file to create.
+        document_title (str): The title to appear in the footer.
+        lines (list): Text for the numbered lines, one entry per line.
+    """
+    values = {"document_title": document_title}
+    values.update({f"line_{i + 1}": line for i, line in enumerate(lines[:NUM_LINES])})
+    pleading_paper_template().save(filename, values)
+
+def create_pleading_paper(filename="pleading_paper_template.docx", document_title="PLEADING PAPER"):
+    """
+    Creates a blank Word document with 28-line pleading paper formatting
+    that meets California court requirements.
+
+    Args:
+        filename (str): The name of the Word file to create.
+        document_title (str): The title to appear in the footer.
+    """
+    document = build_pleading_paper(document_title)
+
     # 9. Save the document
     try:
         document.save(filename)
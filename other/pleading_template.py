@@ -0,0 +1,150 @@
+import io
+import os
+import re
+import copy
+import zipfile
+
+import docx
+from docx.oxml.ns import qn
+from lxml import etree
+
+W_T = qn('w:t')
+W_BR = qn('w:br')
+W_TAB = qn('w:tab')
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+TOKEN_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+def field_token(name):
+    """The placeholder a template is built with for a field: {{name}}."""
+    return f"{{{{{name}}}}}"
+
+class PleadingTemplate:
+    """
+    A pleading skeleton built once through python-docx and cloned for every document.
+
+    The builder is called a single time with a {{field}} token in place of each
+    value. The saved package is kept in memory: parts without tokens (styles,
+    settings, fonts...) are written out unchanged, and the parts with tokens
+    (the body, a footer) are kept as parsed XML trees together with the
+    position of every w:t element holding a token. Rendering a document
+    deep-copies those trees, fills in the tokens and zips the package again,
+    so the numbered table, borders and spacing are never rebuilt.
+
+    Args:
+        build: Function taking a {field: text} dictionary and returning a
+            docx.Document; it must write every value into a single run.
+        fields: Dictionary of field names and the default text used when a
+            document does not supply the field.
+
+    Raises:
+        ValueError: If the builder dropped or split a field's token.
+    """
+
+    def __init__(self, build, fields):
+        self.fields = dict(fields)
+        buffer = io.BytesIO()
+        build({name: field_token(name) for name in self.fields}).save(buffer)
+
+        self._members = []
+        self._parts = {}
+        found = set()
+        with zipfile.ZipFile(buffer) as package:
+            for info in package.infolist():
+                data = package.read(info.filename)
+                self._members.append((info, data))
+                if b"{{" not in data:
+                    continue
+                root = etree.fromstring(data)
+                slots = [
+                    (position, t.text)
+                    for position, t in enumerate(root.iter(W_T))
+                    if t.text and TOKEN_PATTERN.search(t.text)
+                ]
+                if slots:
+                    self._parts[info.filename] = (root, slots)
+                    found.update(name for _, text in slots for name in TOKEN_PATTERN.findall(text))
+        missing = set(self.fields) - found
+        if missing:
+            raise ValueError(f"Template builder did not write fields: {', '.join(sorted(missing))}")
+
+    def _fill(self, values):
+        """Returns the XML of every templated part with the values filled in."""
+        def replace(match):
+            name = match.group(1)
+            return str(values[name]) if name in values else self.fields.get(name, match.group())
+
+        filled = {}
+        for name, (root, slots) in self._parts.items():
+            tree = copy.deepcopy(root)
+            texts = list(tree.iter(W_T))
+            for position, text in slots:
+                set_run_text(texts[position], TOKEN_PATTERN.sub(replace, text))
+            filled[name] = etree.tostring(tree, xml_declaration=True, encoding='UTF-8', standalone=True)
+        return filled
+
+    def render(self, values=None):
+        """
+        Renders one document.
+
+        Args:
+            values: Dictionary of field values; missing fields get their defaults.
+
+        Returns:
+            The .docx file contents as bytes.
+        """
+        filled = self._fill(values or {})
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as package:
+            for info, data in self._members:
+                package.writestr(info, filled.get(info.filename, data))
+        return buffer.getvalue()
+
+    def save(self, filename, values=None):
+        """
+        Renders one document and writes it to a file.
+
+        The document is written to a temporary file next to the target and
+        renamed over it, so a crash never leaves a truncated .docx behind.
+        """
+        data = self.render(values)
+        temp_name = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(temp_name, 'wb') as f:
+                f.write(data)
+            os.replace(temp_name, filename)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+
+    def document(self, values=None):
+        """Renders one document and opens it with python-docx for further editing."""
+        return docx.Document(io.BytesIO(self.render(values)))
+
+def set_run_text(t, text):
+    """
+    Replaces the text of a w:t element the way python-docx's run.text does:
+    newlines become w:br and tabs become w:tab, and leading or trailing
+    spaces are preserved.
+    """
+    pieces = re.split(r'([\t\n])', text)
+    t.text = pieces[0]
+    _preserve_space(t)
+    anchor = t
+    for piece in pieces[1:]:
+        if piece in ('\t', '\n'):
+            element = etree.Element(W_BR if piece == '\n' else W_TAB)
+        elif piece:
+            element = etree.Element(W_T)
+            element.text = piece
+            _preserve_space(element)
+        else:
+            continue
+        anchor.addnext(element)
+        anchor = element
+
+def _preserve_space(t):
+    if t.text and t.text != t.text.strip():
+        t.set(XML_SPACE, 'preserve')
+    elif XML_SPACE in t.attrib:
+        del t.attrib[XML_SPACE]
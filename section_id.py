@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Canonical section and rule identifiers shared by the extraction scripts.
+
+Every script that sorts, deduplicates or joins on a section number (CCP
+sections such as "437c.10", Rules of Court such as "3.110") goes through
+SectionId, so all artifacts agree on ordering and identity.
+
+Scripts outside the repository root import it with the root on sys.path:
+
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    from section_id import SectionId, section_sort_key
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+SECTION_ID_PATTERN = re.compile(r'^\s*(?:§\s*)?(\d+)([a-z]*)((?:\.\d+[a-z]*)*)\.?\s*$', re.IGNORECASE)
+SUBSECTION_PATTERN = re.compile(r'\.((\d+)[a-z]*)', re.IGNORECASE)
+
+class SectionId(NamedTuple):
+    """
+    A parsed section number: "437c.10" is SectionId(437, "c", ((10, "10"),)).
+
+    Each subsection keeps its text next to its value, so zero-padded numbers
+    such as "680.010" survive a round trip through str(). Being a tuple it is
+    hashable and totally ordered, and numeric parts compare as numbers:
+    2 < 10, 437 < 437.5 < 437c < 437c.10 < 438, 3.12 < 3.110.
+    """
+
+    number: int
+    suffix: str = ""
+    subsections: tuple = ()
+
+    @classmethod
+    def parse(cls, text) -> "SectionId":
+        """Parses a section number, raising ValueError if it is not one."""
+        return _parse(str(text))
+
+    def __str__(self) -> str:
+        return f"{self.number}{self.suffix}" + "".join(f".{text}" for _, text in self.subsections)
+
+@lru_cache(maxsize=None)
+def _parse(text: str) -> SectionId:
+    match = SECTION_ID_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Not a section number: {text!r}")
+    subsections = tuple((int(number), part.lower()) for part, number in SUBSECTION_PATTERN.findall(match.group(3)))
+    return SectionId(int(match.group(1)), match.group(2).lower(), subsections)
+
+def parse_section_id(text):
+    """Returns the SectionId of a section number, or None if it does not parse."""
+    try:
+        return SectionId.parse(text)
+    except ValueError:
+        return None
+
+def canonical_section(text) -> str:
+    """Returns the canonical text of a section number ("0437C." -> "437c"), or the text unchanged if it does not parse."""
+    section_id = parse_section_id(text)
+    return str(section_id) if section_id is not None else text
+
+def section_sort_key(text):
+    """Sort key for section number strings; anything that does not parse sorts last, by text."""
+    section_id = parse_section_id(text)
+    return (0, section_id, "") if section_id is not None else (1, (), str(text))